@@ -233,6 +233,12 @@ def create_app():
         except Exception as e:
             logger.warning(f"Instance type fields migration may have already run: {str(e)}")
 
+        try:
+            from migrations.add_object_list_keyset_index import run_migration as run_object_list_keyset_index_migration
+            run_object_list_keyset_index_migration(db)
+        except Exception as e:
+            logger.warning(f"Object list keyset index migration may have already run: {str(e)}")
+
         seed_data(app)
 
         # Re-run after seed to guarantee canonical 'namn' field on freshly seeded databases.
@@ -260,6 +266,12 @@ def create_app():
         except Exception as e:
             logger.warning(f"Instances post-seed migration may have already run: {str(e)}")
 
+        try:
+            from migrations.add_id_sequences import run_migration as run_id_sequences_migration
+            run_id_sequences_migration(db)
+        except Exception as e:
+            logger.warning(f"ID sequence migration may have already run: {str(e)}")
+
         try:
             from migrations.remove_auto_id_from_objects import run_migration as run_remove_auto_id_migration
             run_remove_auto_id_migration(db)
@@ -295,6 +307,30 @@ def create_app():
             run_category_relation_rules_migration(db)
         except Exception as e:
             logger.warning(f"Category relation rules seed may have already run: {str(e)}")
+
+        try:
+            from migrations.add_category_node_closure import run_migration as run_category_node_closure_migration
+            run_category_node_closure_migration(db)
+        except Exception as e:
+            logger.warning(f"Category node closure migration may have already run: {str(e)}")
+
+        try:
+            from migrations.remove_object_summaries import run_migration as run_remove_object_summaries_migration
+            run_remove_object_summaries_migration(db)
+        except Exception as e:
+            logger.warning(f"Object summaries removal migration may have already run: {str(e)}")
+
+        try:
+            from migrations.add_object_search_index import run_migration as run_object_search_index_migration
+            run_object_search_index_migration(db)
+        except Exception as e:
+            logger.warning(f"Object search index migration may have already run: {str(e)}")
+
+        try:
+            from migrations.add_object_suggest_index import run_migration as run_object_suggest_index_migration
+            run_object_suggest_index_migration(db)
+        except Exception as e:
+            logger.warning(f"Object suggest index migration may have already run: {str(e)}")
     
     # Register blueprints
     register_blueprints(app)
@@ -26,3 +26,23 @@ class Config:
         'pool_recycle': 3600,
         'pool_pre_ping': True,
     }
+
+    # In-process trigram index for /api/search on SQLite: 'auto' (only when the
+    # FTS5 table is missing), 'on' or 'off'. Never used on PostgreSQL.
+    SEARCH_MEMORY_INDEX = os.environ.get('SEARCH_MEMORY_INDEX', 'auto').strip().lower()
+
+    # Rendered object trees kept per worker (see utils/tree_cache.py).
+    TREE_CACHE_MAX_ENTRIES = int(os.environ.get('TREE_CACHE_MAX_ENTRIES', '32'))
+    TREE_CACHE_MAX_BYTES = int(os.environ.get('TREE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+    # A streamed tree is only kept for the cache while its body stays this small;
+    # larger trees are streamed without being held in memory a second time.
+    TREE_CACHE_STREAM_MAX_BYTES = int(os.environ.get('TREE_CACHE_STREAM_MAX_BYTES', str(1024 * 1024)))
+
+    # Display data, requirement text and short description of tree nodes, per
+    # object revision (see utils/tree_display_cache.py).
+    TREE_DISPLAY_CACHE_MAX_ENTRIES = int(os.environ.get('TREE_DISPLAY_CACHE_MAX_ENTRIES', '20000'))
+
+    # Upper bound of one tree response (routes/objects.py): nodes built and
+    # seconds spent before the remaining lists are truncated; 0 disables.
+    TREE_MAX_NODES = int(os.environ.get('TREE_MAX_NODES', '50000'))
+    TREE_MAX_SECONDS = float(os.environ.get('TREE_MAX_SECONDS', '10'))
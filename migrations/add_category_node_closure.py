@@ -0,0 +1,46 @@
+"""Migration: add category_node_closure table and rebuild it when it is out of step with category_nodes."""
+from sqlalchemy import inspect, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def run_migration(db):
+    try:
+        engine = db.session.get_bind()
+        inspector = inspect(engine)
+        tables = set(inspector.get_table_names())
+
+        if 'category_node_closure' not in tables:
+            db.session.execute(text("""
+                CREATE TABLE category_node_closure (
+                    ancestor_id   INTEGER NOT NULL REFERENCES category_nodes(id) ON DELETE CASCADE,
+                    descendant_id INTEGER NOT NULL REFERENCES category_nodes(id) ON DELETE CASCADE,
+                    depth         INTEGER NOT NULL,
+                    PRIMARY KEY (ancestor_id, descendant_id)
+                )
+            """))
+            logger.info("Created category_node_closure table")
+
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_category_node_closure_descendant "
+            "ON category_node_closure (descendant_id, depth)"
+        ))
+        db.session.commit()
+
+        # Nodes seeded with plain SQL (or rows lost to a failed write) leave the
+        # self rows short of the node count; rebuild the whole table then.
+        node_count = db.session.execute(text("SELECT COUNT(*) FROM category_nodes")).scalar() or 0
+        self_row_count = db.session.execute(
+            text("SELECT COUNT(*) FROM category_node_closure WHERE depth = 0")
+        ).scalar() or 0
+        if node_count != self_row_count:
+            from utils.category_closure import rebuild_category_node_closure
+            written = rebuild_category_node_closure()
+            logger.info(f"Category node closure migration completed successfully ({written} rows rebuilt)")
+        else:
+            logger.info("Category node closure migration completed successfully (up to date)")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error running category node closure migration: {str(e)}")
+        raise
@@ -0,0 +1,64 @@
+"""Migration: add id_sequences table and seed it from existing object main_ids."""
+from sqlalchemy import inspect, text
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+BASE_ID_PATTERN = re.compile(r'^([A-Za-z0-9_]+)-(\d+)$')
+
+
+def run_migration(db):
+    try:
+        engine = db.session.get_bind()
+        inspector = inspect(engine)
+        tables = set(inspector.get_table_names())
+
+        if 'id_sequences' not in tables:
+            db.session.execute(text("""
+                CREATE TABLE id_sequences (
+                    prefix     VARCHAR(50) PRIMARY KEY,
+                    last_value INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """))
+            logger.info("Created id_sequences table")
+
+        max_by_prefix = {}
+        rows = db.session.execute(text("SELECT main_id FROM objects WHERE main_id IS NOT NULL")).fetchall()
+        for (main_id,) in rows:
+            match = BASE_ID_PATTERN.match(str(main_id or '').strip().split('.')[0])
+            if not match:
+                continue
+            prefix = match.group(1).upper()
+            number = int(match.group(2))
+            if number > max_by_prefix.get(prefix, 0):
+                max_by_prefix[prefix] = number
+
+        existing = {
+            row[0]: int(row[1] or 0)
+            for row in db.session.execute(text("SELECT prefix, last_value FROM id_sequences")).fetchall()
+        }
+
+        seeded = 0
+        for prefix, max_number in max_by_prefix.items():
+            if prefix not in existing:
+                db.session.execute(
+                    text("INSERT INTO id_sequences (prefix, last_value) VALUES (:prefix, :last_value)"),
+                    {'prefix': prefix, 'last_value': max_number}
+                )
+                seeded += 1
+            elif existing[prefix] < max_number:
+                # Never move a sequence backwards; only catch up with IDs created outside it.
+                db.session.execute(
+                    text("UPDATE id_sequences SET last_value = :last_value WHERE prefix = :prefix"),
+                    {'prefix': prefix, 'last_value': max_number}
+                )
+                seeded += 1
+
+        db.session.commit()
+        logger.info(f"ID sequence migration completed successfully ({seeded} prefixes seeded)")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error running ID sequence migration: {str(e)}")
+        raise
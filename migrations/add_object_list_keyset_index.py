@@ -0,0 +1,18 @@
+"""Migration: add composite (created_at, id) index for keyset pagination of objects."""
+from sqlalchemy import text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def run_migration(db):
+    try:
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_objects_created_at_id ON objects(created_at, id)"
+        ))
+        db.session.commit()
+        logger.info("Object list keyset index migration completed successfully")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error running object list keyset index migration: {str(e)}")
+        raise
@@ -0,0 +1,106 @@
+"""Migration: add the full-text index over object_search_documents and backfill it."""
+from sqlalchemy import inspect, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _create_sqlite_index(db):
+    exists = db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'object_search_fts'")
+    ).first()
+    if exists:
+        return False
+
+    # External-content FTS5 table over object_search_documents; the trigram
+    # tokenizer makes MATCH a case-folded substring search.
+    db.session.execute(text("""
+        CREATE VIRTUAL TABLE object_search_fts USING fts5(
+            content,
+            content='object_search_documents',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS object_search_documents_ai AFTER INSERT ON object_search_documents BEGIN
+            INSERT INTO object_search_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS object_search_documents_ad AFTER DELETE ON object_search_documents BEGIN
+            INSERT INTO object_search_fts(object_search_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        END
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS object_search_documents_au AFTER UPDATE ON object_search_documents BEGIN
+            INSERT INTO object_search_fts(object_search_fts, rowid, content) VALUES ('delete', old.id, old.content);
+            INSERT INTO object_search_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    """))
+    # Index documents written before the FTS table existed.
+    db.session.execute(text("INSERT INTO object_search_fts(object_search_fts) VALUES ('rebuild')"))
+    return True
+
+
+def _create_postgresql_index(db, inspector):
+    indexes = {index['name'] for index in inspector.get_indexes('object_search_documents')}
+    # Trigram GIN index: LIKE '%...%' substring search, the same matches as FTS5 trigram on SQLite.
+    db.session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    db.session.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_object_search_documents_trgm
+        ON object_search_documents USING GIN (content gin_trgm_ops)
+    """))
+    # The earlier word-prefix tsvector index is no longer queried.
+    db.session.execute(text("DROP INDEX IF EXISTS idx_object_search_documents_vector"))
+    db.session.execute(text("ALTER TABLE object_search_documents DROP COLUMN IF EXISTS search_vector"))
+    return 'idx_object_search_documents_trgm' not in indexes
+
+
+def run_migration(db):
+    try:
+        engine = db.session.get_bind()
+        inspector = inspect(engine)
+        tables = set(inspector.get_table_names())
+
+        if 'object_search_documents' not in tables:
+            id_column = 'SERIAL PRIMARY KEY' if engine.dialect.name == 'postgresql' else 'INTEGER PRIMARY KEY'
+            db.session.execute(text(f"""
+                CREATE TABLE object_search_documents (
+                    id             {id_column},
+                    object_id      INTEGER NOT NULL REFERENCES objects(id) ON DELETE CASCADE,
+                    object_type_id INTEGER NOT NULL,
+                    field_id       INTEGER,
+                    content        TEXT NOT NULL
+                )
+            """))
+            db.session.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_object_search_documents_object ON object_search_documents (object_id)"
+            ))
+            db.session.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_object_search_documents_type ON object_search_documents (object_type_id)"
+            ))
+            logger.info("Created object_search_documents table")
+
+        if engine.dialect.name == 'postgresql':
+            created = _create_postgresql_index(db, inspector)
+        else:
+            created = _create_sqlite_index(db)
+        if created:
+            logger.info("Created full-text index for object search")
+        db.session.commit()
+
+        from utils.cache_versions import get_cache_version, bump_cache_version
+        from utils.search_index import rebuild_search_index, SEARCH_DOCUMENT_FORMAT, SEARCH_DOCUMENT_FORMAT_SCOPE
+        document_format = get_cache_version(SEARCH_DOCUMENT_FORMAT_SCOPE)
+        # Documents written by an older builder are replaced once.
+        written = rebuild_search_index(only_missing=document_format >= SEARCH_DOCUMENT_FORMAT)
+        while document_format < SEARCH_DOCUMENT_FORMAT:
+            bump_cache_version(SEARCH_DOCUMENT_FORMAT_SCOPE)
+            document_format += 1
+        db.session.commit()
+        logger.info(f"Object search index migration completed successfully ({written} documents indexed)")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error running object search index migration: {str(e)}")
+        raise
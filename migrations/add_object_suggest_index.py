@@ -0,0 +1,93 @@
+"""Migration: add the trigram index over object_suggest_terms and backfill typeahead terms."""
+from sqlalchemy import inspect, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _create_sqlite_index(db):
+    exists = db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'object_suggest_fts'")
+    ).first()
+    if exists:
+        return False
+
+    # External-content trigram table: a local n-gram index over the terms.
+    db.session.execute(text("""
+        CREATE VIRTUAL TABLE object_suggest_fts USING fts5(
+            term,
+            content='object_suggest_terms',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS object_suggest_terms_ai AFTER INSERT ON object_suggest_terms BEGIN
+            INSERT INTO object_suggest_fts(rowid, term) VALUES (new.id, new.term);
+        END
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS object_suggest_terms_ad AFTER DELETE ON object_suggest_terms BEGIN
+            INSERT INTO object_suggest_fts(object_suggest_fts, rowid, term) VALUES ('delete', old.id, old.term);
+        END
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS object_suggest_terms_au AFTER UPDATE ON object_suggest_terms BEGIN
+            INSERT INTO object_suggest_fts(object_suggest_fts, rowid, term) VALUES ('delete', old.id, old.term);
+            INSERT INTO object_suggest_fts(rowid, term) VALUES (new.id, new.term);
+        END
+    """))
+    db.session.execute(text("INSERT INTO object_suggest_fts(object_suggest_fts) VALUES ('rebuild')"))
+    return True
+
+
+def _create_postgresql_index(db):
+    db.session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    db.session.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_object_suggest_terms_trgm
+        ON object_suggest_terms USING GIN (term gin_trgm_ops)
+    """))
+    return True
+
+
+def run_migration(db):
+    try:
+        engine = db.session.get_bind()
+        inspector = inspect(engine)
+        tables = set(inspector.get_table_names())
+
+        if 'object_suggest_terms' not in tables:
+            id_column = 'SERIAL PRIMARY KEY' if engine.dialect.name == 'postgresql' else 'INTEGER PRIMARY KEY'
+            db.session.execute(text(f"""
+                CREATE TABLE object_suggest_terms (
+                    id             {id_column},
+                    object_id      INTEGER NOT NULL REFERENCES objects(id) ON DELETE CASCADE,
+                    object_type_id INTEGER NOT NULL,
+                    term           VARCHAR(255) NOT NULL
+                )
+            """))
+            logger.info("Created object_suggest_terms table")
+
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_object_suggest_terms_term ON object_suggest_terms (term)"
+        ))
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_object_suggest_terms_type_term ON object_suggest_terms (object_type_id, term)"
+        ))
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_object_suggest_terms_object ON object_suggest_terms (object_id)"
+        ))
+
+        if engine.dialect.name == 'postgresql':
+            _create_postgresql_index(db)
+        elif _create_sqlite_index(db):
+            logger.info("Created trigram index for object suggestions")
+        db.session.commit()
+
+        from utils.search_index import rebuild_search_index
+        written = rebuild_search_index(only_missing=True)
+        logger.info(f"Object suggest index migration completed successfully ({written} documents indexed)")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error running object suggest index migration: {str(e)}")
+        raise
@@ -0,0 +1,27 @@
+"""
+Migration: Remove the object_summaries table.
+
+Summaries are computed when /api/objects/summaries is read, so the table and
+its format marker in cache_versions are no longer maintained.
+"""
+from sqlalchemy import inspect, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def run_migration(db):
+    try:
+        engine = db.session.get_bind()
+        if 'object_summaries' not in set(inspect(engine).get_table_names()):
+            logger.info("object_summaries table already removed")
+            return
+
+        db.session.execute(text("DROP TABLE object_summaries"))
+        db.session.execute(text("DELETE FROM cache_versions WHERE scope = 'object_summary_format'"))
+        db.session.commit()
+        logger.info("Removed object_summaries table")
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error removing object summaries: {str(e)}")
+        raise
@@ -1,8 +1,29 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from datetime import datetime
+import sqlite3
 
 db = SQLAlchemy()
 
+
+@event.listens_for(Engine, 'connect')
+def register_sqlite_functions(dbapi_connection, connection_record):
+    """Make SQLite lower() Unicode-aware (å/ä/ö) so SQL-side search matches PostgreSQL."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function(
+            'lower', 1,
+            lambda value: value.lower() if isinstance(value, str) else value,
+            deterministic=True
+        )
+
+
+@event.listens_for(db.session, 'before_commit')
+def flush_before_commit(session):
+    """Flush pending writes so the after_flush collectors have run before the
+    model and cache before_commit listeners (registered after this one) act."""
+    session.flush()
+
 # Import all models
 from models.object_type import ObjectType
 from models.object_field import ObjectField
@@ -26,7 +47,12 @@ from models.change_management_item import ChangeManagementItem
 from models.change_management_impact import ChangeManagementImpact
 from models.classification_system import ClassificationSystem
 from models.category_node import CategoryNode
+from models.category_node_closure import CategoryNodeClosure
 from models.object_category_assignment import ObjectCategoryAssignment
+from models.id_sequence import IdSequence
+from models.cache_version import CacheVersion
+from models.object_search_document import ObjectSearchDocument
+from models.object_suggest_term import ObjectSuggestTerm
 
 __all__ = [
     'db',
@@ -52,5 +78,10 @@ __all__ = [
     'ChangeManagementImpact',
     'ClassificationSystem',
     'CategoryNode',
+    'CategoryNodeClosure',
     'ObjectCategoryAssignment',
+    'IdSequence',
+    'CacheVersion',
+    'ObjectSearchDocument',
+    'ObjectSuggestTerm',
 ]
@@ -0,0 +1,18 @@
+from models import db
+from datetime import datetime
+
+
+class CacheVersion(db.Model):
+    """CacheVersion model - monotonic version counter per cache scope (e.g. 'schema')"""
+    __tablename__ = 'cache_versions'
+
+    scope = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'scope': self.scope,
+            'version': self.version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
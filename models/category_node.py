@@ -1,5 +1,6 @@
 from datetime import datetime
 from models import db
+from models.category_node_closure import CategoryNodeClosure
 
 VALID_LEVELS = (1, 2, 3)
 
@@ -68,20 +69,18 @@ class CategoryNode(db.Model):
 
     def get_ancestors(self):
         """Return list of ancestor nodes from root down to (but not including) self."""
-        ancestors = []
-        node = self.parent
-        while node:
-            ancestors.append(node)
-            node = node.parent
-        ancestors.reverse()
-        return ancestors
+        return (
+            CategoryNode.query
+            .join(CategoryNodeClosure, CategoryNodeClosure.ancestor_id == CategoryNode.id)
+            .filter(CategoryNodeClosure.descendant_id == self.id, CategoryNodeClosure.depth > 0)
+            .order_by(CategoryNodeClosure.depth.desc())
+            .all()
+        )
 
     def get_descendant_ids(self):
         """Return set of all descendant node IDs (recursive)."""
-        ids = set()
-        stack = list(self.children)
-        while stack:
-            child = stack.pop()
-            ids.add(child.id)
-            stack.extend(child.children)
-        return ids
+        rows = db.session.query(CategoryNodeClosure.descendant_id).filter(
+            CategoryNodeClosure.ancestor_id == self.id,
+            CategoryNodeClosure.depth > 0,
+        ).all()
+        return {row.descendant_id for row in rows}
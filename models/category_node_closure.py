@@ -0,0 +1,21 @@
+from models import db
+
+
+class CategoryNodeClosure(db.Model):
+    """CategoryNodeClosure model - one row per (ancestor, descendant) pair, including self at depth 0"""
+    __tablename__ = 'category_node_closure'
+
+    ancestor_id = db.Column(db.Integer, db.ForeignKey('category_nodes.id', ondelete='CASCADE'), primary_key=True)
+    descendant_id = db.Column(db.Integer, db.ForeignKey('category_nodes.id', ondelete='CASCADE'), primary_key=True)
+    depth = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_category_node_closure_descendant', 'descendant_id', 'depth'),
+    )
+
+    def to_dict(self):
+        return {
+            'ancestor_id': self.ancestor_id,
+            'descendant_id': self.descendant_id,
+            'depth': self.depth
+        }
@@ -0,0 +1,19 @@
+from models import db
+from datetime import datetime
+
+
+class IdSequence(db.Model):
+    """IdSequence model - last issued base-ID number per ID prefix (e.g. BYG -> 42)"""
+    __tablename__ = 'id_sequences'
+
+    prefix = db.Column(db.String(50), primary_key=True)
+    last_value = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'prefix': self.prefix,
+            'last_value': self.last_value,
+            'next_value': (self.last_value or 0) + 1,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -1,4 +1,6 @@
 from models import db
+from sqlalchemy import event
+from sqlalchemy.orm import selectinload
 from datetime import datetime
 import logging
 import re
@@ -33,29 +35,55 @@ class Object(db.Model):
     parent_instances = db.relationship('Instance', foreign_keys='Instance.child_object_id',
                                        back_populates='child_object', cascade='all, delete-orphan')
     documents = db.relationship('Document', back_populates='object', cascade='all, delete-orphan')
+
+    # Indexes
+    __table_args__ = (
+        db.Index('idx_objects_created_at_id', 'created_at', 'id'),
+    )
     
     @property
     def data(self):
         """Get object data as a dictionary"""
+        from utils.schema_cache import get_schema
+        schema = get_schema()
+        if schema is None:
+            return self._decode_data(None, None)
+
+        # Decoded once per schema version and kept until object_data changes
+        # (see invalidate_data_cache); callers get a copy they may modify.
+        field_decoder = schema.get_field_decoder(self.object_type_id)
+        cached = self.__dict__.get('_data_cache')
+        if cached is None or cached[0] is not field_decoder:
+            cached = (field_decoder, self._decode_data(field_decoder, schema.field_decoder))
+            self._data_cache = cached
+        return dict(cached[1])
+
+    def _decode_data(self, field_decoder, fallback_decoder):
+        from utils.schema_cache import get_field_value_decoder
         data = {}
         for od in self.object_data:
             try:
-                if od.field:
-                    field_type = od.field.field_type
-                    if field_type == 'number':
-                        data[od.field.field_name] = float(od.value_number) if od.value_number is not None else None
-                    elif field_type == 'date':
-                        data[od.field.field_name] = od.value_date.isoformat() if od.value_date else None
-                    elif field_type == 'boolean':
-                        data[od.field.field_name] = od.value_boolean
-                    else:
-                        data[od.field.field_name] = od.value_json if od.value_json is not None else od.value_text
+                if field_decoder is not None:
+                    decoded = field_decoder.get(od.field_id) or fallback_decoder.get(od.field_id)
+                    if decoded is None:
+                        # The snapshot holds every field; rows of deleted fields are skipped without a lookup.
+                        continue
+                else:
+                    field = od.field
+                    if not field:
+                        continue
+                    decoded = (field.field_name, get_field_value_decoder(field.field_type))
+                field_name, decode = decoded
+                data[field_name] = decode(od)
             except Exception as e:
                 # Log but don't fail - skip problematic field
                 logger.warning(f"Error processing field data for object {self.id}, field {od.field_id if od else 'unknown'}: {str(e)}")
                 continue
         return data
 
+    def invalidate_data_cache(self):
+        self.__dict__.pop('_data_cache', None)
+
     def normalized_base_id(self):
         source = str(self.main_id or '').strip()
         if not source:
@@ -89,10 +117,18 @@ class Object(db.Model):
         version = self.normalized_version()
         full_id = self.normalized_full_id()
 
+        from utils.schema_cache import get_schema
+        schema = get_schema()
+        schema_type = schema.types_by_id.get(self.object_type_id) if schema is not None else None
+        if schema_type is not None:
+            object_type_payload = schema_type.to_dict(include_fields=include_object_type_fields)
+        else:
+            object_type_payload = self.object_type.to_dict(include_fields=include_object_type_fields) if self.object_type else None
+
         result = {
             'id': self.id,
             'base_id': base_id,
-            'object_type': self.object_type.to_dict(include_fields=include_object_type_fields) if self.object_type else None,
+            'object_type': object_type_payload,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'created_by': self.created_by,
@@ -106,19 +142,47 @@ class Object(db.Model):
             result['data'] = self.data
         
         if include_relations:
-            relations = {}
-            for rel in self.source_relations:
-                if rel.relation_type not in relations:
-                    relations[rel.relation_type] = []
-                relations[rel.relation_type].append({
-                    'id': rel.id,
-                    'target': rel.target_object.to_dict(include_data=True, include_relations=False) if rel.target_object else None,
-                    'description': rel.description,
-                    'metadata': rel.relation_metadata
-                })
-            result['relations'] = relations
+            result['relations'] = self.relations_to_dict()
         
         if include_documents:
             result['documents'] = [doc.to_dict() for doc in self.documents]
         
         return result
+
+    def relations_to_dict(self, source_relations=None):
+        """Outgoing relations grouped by relation type, each with its target serialized with data."""
+        relations = {}
+        for rel in (self.source_relations if source_relations is None else source_relations):
+            if rel.relation_type not in relations:
+                relations[rel.relation_type] = []
+            relations[rel.relation_type].append({
+                'id': rel.id,
+                'target': rel.target_object.to_dict(include_data=True, include_relations=False) if rel.target_object else None,
+                'description': rel.description,
+                'metadata': rel.relation_metadata
+            })
+        return relations
+
+
+def object_data_loader():
+    """
+    Loader option for batches of objects whose data will be read: one extra
+    SELECT ... WHERE object_id IN (...) instead of one lazy load per object.
+    """
+    return selectinload(Object.object_data)
+
+
+@event.listens_for(Object.object_data, 'append')
+@event.listens_for(Object.object_data, 'remove')
+def _object_data_changed(target, value, initiator):
+    target.invalidate_data_cache()
+
+
+@event.listens_for(Object, 'expire')
+def _object_expired(target, attrs):
+    target.invalidate_data_cache()
+
+
+@event.listens_for(Object, 'refresh')
+def _object_refreshed(target, context, attrs):
+    target.invalidate_data_cache()
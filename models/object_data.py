@@ -1,6 +1,9 @@
 from models import db
+from models.object import Object
 from datetime import datetime
-from sqlalchemy import JSON
+from sqlalchemy import JSON, event
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.dialects.postgresql import JSONB
 from decimal import Decimal
 
@@ -44,3 +47,29 @@ class ObjectData(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+def _invalidate_owner_data_cache(target, value, oldvalue, initiator):
+    # Only an already-loaded owner can hold decoded data worth dropping. Rows
+    # loaded through Object.object_data don't have .object set, so fall back
+    # to the session's identity map.
+    owner = target.__dict__.get('object')
+    if owner is None:
+        session = object_session(target)
+        object_id = target.__dict__.get('object_id')
+        if session is None or object_id is None:
+            return
+        owner = session.identity_map.get(identity_key(Object, object_id))
+    if owner is not None:
+        owner.invalidate_data_cache()
+
+
+for _column in (
+    ObjectData.field_id,
+    ObjectData.value_text,
+    ObjectData.value_number,
+    ObjectData.value_date,
+    ObjectData.value_boolean,
+    ObjectData.value_json,
+):
+    event.listen(_column, 'set', _invalidate_owner_data_cache)
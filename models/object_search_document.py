@@ -0,0 +1,88 @@
+from models import db
+from models.object import Object
+from models.object_data import ObjectData
+from models.relation import ObjectRelation
+from models.managed_list import ManagedList
+from models.managed_list_item import ManagedListItem
+from itertools import chain
+from sqlalchemy import event
+
+PENDING_SEARCH_IDS_KEY = 'object_search_ids'
+# Objects whose own values changed: related objects show their names in relation_list fields.
+PENDING_SEARCH_NEIGHBOUR_IDS_KEY = 'object_search_neighbour_ids'
+# Managed lists whose item labels changed: objects selecting those items show the labels.
+PENDING_SEARCH_LIST_IDS_KEY = 'object_search_list_ids'
+PENDING_SEARCH_KEYS = (PENDING_SEARCH_IDS_KEY, PENDING_SEARCH_NEIGHBOUR_IDS_KEY, PENDING_SEARCH_LIST_IDS_KEY)
+
+
+class ObjectSearchDocument(db.Model):
+    """ObjectSearchDocument model - one lower-cased searchable text per object identifier or text value.
+
+    The full-text structures over ``content`` are dialect specific and created
+    by migrations/add_object_search_index.py (FTS5 trigram on SQLite, pg_trgm
+    GIN on PostgreSQL).
+    """
+    __tablename__ = 'object_search_documents'
+
+    id = db.Column(db.Integer, primary_key=True)
+    object_id = db.Column(db.Integer, db.ForeignKey('objects.id', ondelete='CASCADE'), nullable=False)
+    object_type_id = db.Column(db.Integer, nullable=False)
+    # NULL for identifier rows (id_full/main_id), which match regardless of field=.
+    field_id = db.Column(db.Integer)
+    content = db.Column(db.Text, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_object_search_documents_object', 'object_id'),
+        db.Index('idx_object_search_documents_type', 'object_type_id'),
+    )
+
+
+@event.listens_for(db.session, 'after_flush')
+def _collect_object_search_changes(session, flush_context):
+    object_ids = session.info.setdefault(PENDING_SEARCH_IDS_KEY, set())
+    neighbour_ids = session.info.setdefault(PENDING_SEARCH_NEIGHBOUR_IDS_KEY, set())
+    list_ids = session.info.setdefault(PENDING_SEARCH_LIST_IDS_KEY, set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Object):
+            neighbour_ids.add(instance.id)
+        elif isinstance(instance, ObjectData):
+            neighbour_ids.add(instance.object_id)
+        elif isinstance(instance, ObjectRelation):
+            object_ids.update((instance.source_object_id, instance.target_object_id))
+        elif isinstance(instance, ManagedListItem):
+            list_ids.add(instance.list_id)
+        elif isinstance(instance, ManagedList):
+            list_ids.add(instance.id)
+    object_ids.update(neighbour_ids)
+    object_ids.discard(None)
+    neighbour_ids.discard(None)
+    list_ids.discard(None)
+
+
+@event.listens_for(db.session, 'before_commit')
+def _refresh_object_search_before_commit(session):
+    object_ids = session.info.pop(PENDING_SEARCH_IDS_KEY, set())
+    neighbour_ids = session.info.pop(PENDING_SEARCH_NEIGHBOUR_IDS_KEY, set())
+    list_ids = session.info.pop(PENDING_SEARCH_LIST_IDS_KEY, set())
+    if not object_ids and not list_ids:
+        return
+
+    from utils.search_index import refresh_search_index, expand_search_refresh_ids
+    from utils.memory_search_index import record_search_document_changes
+    documents_by_object = {}
+    refresh_search_index(expand_search_refresh_ids(object_ids, neighbour_ids, list_ids), documents_by_object)
+    record_search_document_changes(session, documents_by_object)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _apply_object_search_changes(session):
+    from utils.memory_search_index import apply_committed_search_document_changes
+    apply_committed_search_document_changes(session)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_object_search_changes(session):
+    for key in PENDING_SEARCH_KEYS:
+        session.info.pop(key, None)
+    from utils.memory_search_index import discard_search_document_changes
+    discard_search_document_changes(session)
@@ -0,0 +1,23 @@
+from models import db
+
+
+class ObjectSuggestTerm(db.Model):
+    """ObjectSuggestTerm model - lower-cased id_full/main_id/name terms used by the object picker typeahead.
+
+    Rows are written together with the search documents (utils/search_index.py).
+    The trigram index over ``term`` is created by
+    migrations/add_object_suggest_index.py (FTS5 on SQLite, pg_trgm on PostgreSQL).
+    """
+    __tablename__ = 'object_suggest_terms'
+
+    id = db.Column(db.Integer, primary_key=True)
+    object_id = db.Column(db.Integer, db.ForeignKey('objects.id', ondelete='CASCADE'), nullable=False)
+    object_type_id = db.Column(db.Integer, nullable=False)
+    term = db.Column(db.String(255), nullable=False)
+
+    __table_args__ = (
+        # Prefix lookups are range scans on (term); the type index serves types= filters.
+        db.Index('idx_object_suggest_terms_term', 'term'),
+        db.Index('idx_object_suggest_terms_type_term', 'object_type_id', 'term'),
+        db.Index('idx_object_suggest_terms_object', 'object_id'),
+    )
@@ -1,6 +1,5 @@
 from models import db
 from datetime import datetime
-import re
 
 class ObjectType(db.Model):
     """ObjectType model - represents types of objects in the system"""
@@ -19,18 +18,13 @@ class ObjectType(db.Model):
     fields = db.relationship('ObjectField', back_populates='object_type', cascade='all, delete-orphan')
     objects = db.relationship('Object', back_populates='object_type')
 
-    def _calculate_next_base_id_number(self):
-        max_number = 0
-        pattern = re.compile(r'^[A-Za-z0-9_]+-(\d+)$')
-        for obj in self.objects:
-            candidate = str(obj.main_id or '').strip().split('.')[0]
-            match = pattern.match(candidate)
-            if not match:
-                continue
-            number = int(match.group(1))
-            if number > max_number:
-                max_number = number
-        return max_number + 1
+    def resolve_id_prefix(self):
+        from utils.auto_id_generator import resolve_object_type_prefix
+        return resolve_object_type_prefix(self.name, self.id_prefix)
+
+    def next_base_id_number(self):
+        from utils.auto_id_generator import peek_next_base_number
+        return peek_next_base_number(self.resolve_id_prefix())
     
     def to_dict(self, include_fields=False):
         result = {
@@ -39,7 +33,7 @@ class ObjectType(db.Model):
             'description': self.description,
             'icon': self.icon,
             'id_prefix': self.id_prefix,
-            'next_base_id_number': self._calculate_next_base_id_number(),
+            'next_base_id_number': self.next_base_id_number(),
             'color': self.color,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'is_system': self.is_system
@@ -1,4 +1,5 @@
 """CRUD + tree navigation API for CategoryNode."""
+import itertools
 import logging
 
 from flask import Blueprint, jsonify, request
@@ -7,6 +8,12 @@ from models import db
 from models.category_node import CategoryNode, VALID_LEVELS
 from models.classification_system import ClassificationSystem
 from models.object_category_assignment import ObjectCategoryAssignment
+from utils.category_closure import (
+    add_category_node_closure,
+    move_category_node_closure,
+    delete_category_node_closure,
+)
+from utils.json_stream import stream_json_response
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('category_nodes', __name__, url_prefix='/api/category-nodes')
@@ -146,6 +153,8 @@ def create_node():
         is_active=bool(data.get('is_active', True)),
     )
     db.session.add(node)
+    db.session.flush()
+    add_category_node_closure(node)
     db.session.commit()
     logger.info("Created CategoryNode id=%s code=%s level=%s", node.id, node.code, node.level)
     return jsonify(node.to_dict()), 201
@@ -225,6 +234,7 @@ def delete_node(node_id):
             'error': f'Cannot delete node — {active_assignments} object(s) are classified under it.'
         }), 409
 
+    delete_category_node_closure(node_id)
     db.session.delete(node)
     db.session.commit()
     logger.info("Deleted CategoryNode id=%s", node_id)
@@ -238,6 +248,8 @@ def delete_node(node_id):
 def object_tree():
     """Return category nodes with assigned objects and their direct relations as children."""
     from models import Object as ObjModel, ObjectRelation
+    from models.object import object_data_loader
+    from sqlalchemy.orm import selectinload
 
     system_name = (request.args.get('system_name') or '').strip()
     if not system_name:
@@ -250,23 +262,26 @@ def object_tree():
         logger.warning('object_tree: no classification system named %r', system_name)
         return jsonify([]), 200
 
-    # Load root nodes; children are lazy-loaded via relationship
-    root_nodes = (
+    # Load every node of the system at once and link them in memory, in the
+    # same order as the CategoryNode.children relationship.
+    system_nodes = (
         CategoryNode.query
-        .filter_by(system_id=system.id, parent_id=None)
+        .filter_by(system_id=system.id)
         .order_by(CategoryNode.sort_order, CategoryNode.code)
         .all()
     )
+    children_by_parent = {}
+    for n in system_nodes:
+        children_by_parent.setdefault(n.parent_id, []).append(n)
+    root_nodes = children_by_parent.get(None, [])
 
     # Collect all node IDs in the system tree
     all_node_ids = []
-
-    def _collect_ids(nodes):
-        for n in nodes:
-            all_node_ids.append(n.id)
-            _collect_ids(n.children)
-
-    _collect_ids(root_nodes)
+    stack = list(reversed(root_nodes))
+    while stack:
+        n = stack.pop()
+        all_node_ids.append(n.id)
+        stack.extend(reversed(children_by_parent.get(n.id, [])))
     if not all_node_ids:
         return jsonify([]), 200
 
@@ -284,7 +299,9 @@ def object_tree():
     primary_obj_ids = list({row.object_id for row in assignment_rows})
     objects_map = {}
     if primary_obj_ids:
-        objs = ObjModel.query.filter(ObjModel.id.in_(primary_obj_ids)).all()
+        objs = ObjModel.query.options(
+            object_data_loader(), selectinload(ObjModel.object_type)
+        ).filter(ObjModel.id.in_(primary_obj_ids)).all()
         objects_map = {obj.id: obj for obj in objs}
 
     # Batch-load relations for all primary objects (both directions)
@@ -312,7 +329,9 @@ def object_tree():
         if tid not in objects_map
     }
     if all_related_ids:
-        related_objs = ObjModel.query.filter(ObjModel.id.in_(all_related_ids)).all()
+        related_objs = ObjModel.query.options(
+            object_data_loader(), selectinload(ObjModel.object_type)
+        ).filter(ObjModel.id.in_(all_related_ids)).all()
         for obj in related_objs:
             objects_map[obj.id] = obj
 
@@ -356,7 +375,7 @@ def object_tree():
         return node
 
     def _build_cat_node(cat_node):
-        children = [_build_cat_node(c) for c in cat_node.children]
+        children = [_build_cat_node(c) for c in children_by_parent.get(cat_node.id, [])]
         for obj in sorted(objects_by_node.get(cat_node.id, []), key=lambda o: o.id_full or ''):
             if obj and obj.object_type:
                 children.append(_build_obj_node(obj))
@@ -367,8 +386,11 @@ def object_tree():
             'children': children,
         }
 
-    result = [_build_cat_node(n) for n in root_nodes]
-    return jsonify(result), 200
+    # The first category subtree is built here, so an error in it is still a
+    # 500; the others are built one at a time while the earlier ones are sent.
+    built_roots = [_build_cat_node(n) for n in root_nodes[:1]]
+    remaining_roots = (_build_cat_node(n) for n in root_nodes[1:])
+    return stream_json_response(itertools.chain(built_roots, remaining_roots)), 200
 
 
 # ---------------------------------------------------------------------------
@@ -421,6 +443,7 @@ def move_node(node_id):
             return jsonify({'error': err}), 400
 
     node.parent_id = new_parent_id
+    move_category_node_closure(node_id, new_parent_id)
     db.session.commit()
     logger.info("Moved CategoryNode id=%s to parent_id=%s", node_id, new_parent_id)
     return jsonify(node.to_dict()), 200
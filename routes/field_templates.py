@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request
 from models import db, FieldTemplate
+from utils.schema_cache import bump_schema_version
 import logging
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,7 @@ def create_field_template():
             is_active=bool(data.get('is_active', True))
         )
         db.session.add(item)
+        bump_schema_version()
         db.session.commit()
         return jsonify(item.to_dict()), 201
     except Exception as e:
@@ -120,6 +122,7 @@ def update_field_template(template_id):
         if 'is_active' in data:
             item.is_active = bool(data.get('is_active'))
 
+        bump_schema_version()
         db.session.commit()
         return jsonify(item.to_dict()), 200
     except Exception as e:
@@ -133,6 +136,7 @@ def delete_field_template(template_id):
     try:
         item = FieldTemplate.query.get_or_404(template_id)
         db.session.delete(item)
+        bump_schema_version()
         db.session.commit()
         return jsonify({'message': 'Field template deleted successfully'}), 200
     except Exception as e:
@@ -15,6 +15,7 @@ from models.managed_list_item_link import ManagedListItemLink
 from models.field_list_binding import FieldListBinding
 from models.object_type import ObjectType
 from models.object_field import ObjectField
+from utils.schema_cache import bump_schema_version
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('lists_admin', __name__, url_prefix='/api')
@@ -694,6 +695,7 @@ def create_field_binding():
         db.session.add(binding)
         db.session.flush()
         sync_binding_to_object_field(binding)
+        bump_schema_version()
         db.session.commit()
         return jsonify(binding.to_dict()), 201
     except Exception as e:
@@ -720,6 +722,7 @@ def update_field_binding(binding_id):
         if 'is_required' in data:
             binding.is_required = normalize_bool(data.get('is_required'), default=False)
         sync_binding_to_object_field(binding)
+        bump_schema_version()
         db.session.commit()
         return jsonify(binding.to_dict()), 200
     except Exception as e:
@@ -733,6 +736,7 @@ def delete_field_binding(binding_id):
     try:
         binding = FieldListBinding.query.get_or_404(binding_id)
         db.session.delete(binding)
+        bump_schema_version()
         db.session.commit()
         return jsonify({'message': 'Binding deleted'}), 200
     except Exception as e:
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from models import db, ObjectType, ObjectField, Object, ObjectData, FieldTemplate, RelationTypeRule, RelationType
 from routes.relation_type_rules import ensure_complete_relation_rule_matrix
+from utils.schema_cache import bump_schema_version
 import json
 import logging
 
@@ -267,6 +268,7 @@ def create_object_type():
             name_field.force_presence_on_all_objects = True
         db.session.add(name_field)
         ensure_complete_relation_rule_matrix()
+        bump_schema_version()
         db.session.commit()
         
         logger.info(f"Created object type: {object_type.name}")
@@ -307,6 +309,7 @@ def update_object_type(id):
                 return jsonify({'error': 'Invalid color. Choose a value from the fixed color palette'}), 400
             object_type.color = normalized_color
         
+        bump_schema_version()
         db.session.commit()
         
         logger.info(f"Updated object type: {object_type.name}")
@@ -347,6 +350,7 @@ def delete_object_type(id):
                 relation_type.target_object_type_id = None
         
         db.session.delete(object_type)
+        bump_schema_version()
         db.session.commit()
         
         logger.info(
@@ -423,6 +427,7 @@ def add_field(id):
                     except Exception:
                         incoming_options = {}
                 existing.field_options = incoming_options
+                bump_schema_version()
                 db.session.commit()
                 return jsonify(existing.to_dict()), 200
             return jsonify({'error': 'Field with this name already exists for this object type'}), 400
@@ -462,6 +467,7 @@ def add_field(id):
         db.session.flush()
         if field.force_presence_on_all_objects:
             ensure_field_presence_for_all_objects(field)
+        bump_schema_version()
         db.session.commit()
         
         logger.info(f"Added field {field.field_name} to object type {object_type.name}")
@@ -542,6 +548,7 @@ def update_field_with_type(type_id, field_id):
         if field.force_presence_on_all_objects:
             ensure_field_presence_for_all_objects(field)
         
+        bump_schema_version()
         db.session.commit()
         
         logger.info(f"Updated field {field.field_name} for object type {object_type.name}")
@@ -581,6 +588,7 @@ def delete_field_with_type(type_id, field_id):
             db.session.delete(row)
         
         db.session.delete(field)
+        bump_schema_version()
         db.session.commit()
         
         logger.info(f"Deleted field {field.field_name} from object type {object_type.name}")
@@ -1,26 +1,68 @@
-from flask import Blueprint, request, jsonify
-from models import db, Object, ObjectType, ObjectField, ObjectData, ObjectRelation, ObjectFieldOverride, ViewConfiguration, ManagedListItem, Instance, ObjectCategoryAssignment
+from flask import Blueprint, request, jsonify, Response, stream_with_context, current_app
+from models import db, Object, ObjectType, ObjectField, ObjectData, ObjectRelation, ObjectFieldOverride, ViewConfiguration, ManagedListItem, Instance, ObjectCategoryAssignment, Document
 from utils.auto_id_generator import (
     generate_base_id,
+    observe_base_id,
     compose_full_id,
     normalize_version,
     normalize_base_id,
     get_next_version_for_base_id
 )
 from utils.validators import validate_object_data
-from datetime import datetime, date
-from decimal import Decimal
+from utils.schema_cache import get_schema, get_object_type_fields, compile_field_decoder
+from utils.search_index import build_search_match_query, escape_like, suggest_object_ids
+from utils.object_facets import parse_facet_args, build_object_facets
+from utils.managed_list_cache import get_shared_managed_list_lookup
+from utils.tree_cache import (
+    get_tree_versions,
+    build_tree_cache_key,
+    build_tree_etag,
+    get_cached_tree,
+    store_cached_tree,
+    get_tree_cache_stream_max_bytes
+)
+from utils.json_stream import stream_json_response
+from utils.object_summaries import build_object_summaries
+from utils.tree_display_cache import get_tree_display_projection
+from models.object import object_data_loader
+from sqlalchemy.orm import Session, selectinload
+from datetime import datetime, date, timezone
+from decimal import Decimal, InvalidOperation
 from copy import deepcopy
 import re
 import logging
 import os
 import json
 import html
+import base64
+import csv
+import io
+import itertools
+import time
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('objects', __name__, url_prefix='/api/objects')
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 UPLOAD_FOLDER = os.path.join(PROJECT_ROOT, 'static', 'uploads')
+OBJECT_LIST_CURSOR_PAGE_SIZE = 100
+# Object attributes that ?fields= can select next to data fields.
+SPARSE_OBJECT_ATTRIBUTES = ('base_id', 'main_id', 'version', 'status', 'created_at', 'updated_at', 'created_by')
+OBJECT_LIST_INCLUDES = {'files', 'relation_lists'}
+OBJECT_DETAIL_INCLUDES = {'files', 'relation_lists', 'relations', 'documents'}
+OBJECT_EXPORT_BATCH_SIZE = 500
+OBJECT_SUGGEST_LIMIT = 20
+OBJECT_SUGGEST_MAX_LIMIT = 50
+OBJECT_LIST_FILTER_ARG = re.compile(r'^filter\[(.+)\]$')
+# Filter operators allowed per column kind; the first one is used when ?filter[x]=value has no op.
+OBJECT_LIST_FILTER_OPS = {
+    'text': ('contains', 'eq', 'ne', 'startswith', 'in'),
+    'number': ('eq', 'ne', 'lt', 'lte', 'gt', 'gte', 'between', 'in'),
+    'date': ('eq', 'ne', 'lt', 'lte', 'gt', 'gte', 'between', 'in'),
+    'datetime': ('gte', 'lt', 'lte', 'gt', 'between'),
+    'boolean': ('eq', 'ne'),
+}
+# List-view columns that only exist in the UI and have no exportable value.
+OBJECT_EXPORT_SKIPPED_COLUMNS = {'__select__', 'files', 'files_indicator'}
 
 
 def get_display_name(obj, object_type_name, view_config):
@@ -60,6 +102,20 @@ def get_display_name(obj, object_type_name, view_config):
     return obj.id_full
 
 
+def load_tree_view_config(object_type_ids=None):
+    """Return the get_display_name view_config {object_type_name: {'tree_view_name_field': ...}}."""
+    query = ViewConfiguration.query
+    if object_type_ids is not None:
+        query = query.filter(ViewConfiguration.object_type_id.in_(list(object_type_ids)))
+    view_config = {}
+    for config in query.all():
+        if config.object_type:
+            view_config[config.object_type.name] = {
+                'tree_view_name_field': config.tree_view_name_field
+            }
+    return view_config
+
+
 def get_data_value_case_insensitive(data, field_name):
     """Get a field value from object data with case-insensitive fallback."""
     if not isinstance(data, dict):
@@ -120,7 +176,7 @@ def get_object_field_value_by_template_names(obj, template_names):
         return None
 
     object_data = obj.data or {}
-    for field in obj.object_type.fields or []:
+    for field in get_object_type_fields(obj.object_type):
         template = getattr(field, 'field_template', None)
         candidate_names = {
             normalize_field_key(getattr(field, 'field_name', '')),
@@ -183,7 +239,6 @@ def get_tree_view_category_aliases(tree_view):
 
 def get_tree_view_category_value(obj, tree_view):
     object_data = obj.data or {}
-    object_fields = obj.object_type.fields if obj and obj.object_type else []
     normalized_data = {
         normalize_lookup_key(key): value
         for key, value in object_data.items()
@@ -218,7 +273,7 @@ def get_category_field_definition(obj, tree_view):
         return None
 
     alias_keys = {normalize_lookup_key(alias) for alias in get_tree_view_category_aliases(tree_view)}
-    for field in obj.object_type.fields or []:
+    for field in get_object_type_fields(obj.object_type):
         field_name = normalize_lookup_key(field.field_name)
         display_name = normalize_lookup_key(field.display_name)
         if field_name in alias_keys or display_name in alias_keys:
@@ -227,31 +282,14 @@ def get_category_field_definition(obj, tree_view):
 
 
 def get_managed_list_lookup(list_id, cache):
+    """Return the shared ManagedListLookup for list_id, memoized in cache for this call site."""
     safe_list_id = int(list_id or 0)
     if safe_list_id <= 0:
         return None
 
-    if safe_list_id in cache:
-        return cache[safe_list_id]
-
-    items = ManagedListItem.query.filter_by(list_id=safe_list_id).all()
-    by_id = {}
-    by_value = {}
-    for item in items:
-        item_id = int(item.id or 0)
-        label = str(item.resolve_display_value() or item.label or item.value or '').strip()
-        value_key = str(item.value or '').strip()
-        if item_id > 0 and label:
-            by_id[item_id] = {
-                'label': label,
-                'parent_item_id': int(item.parent_item_id or 0) or None
-            }
-        if value_key and label:
-            by_value[value_key] = item_id
-
-    lookup = {'by_id': by_id, 'by_value': by_value}
-    cache[safe_list_id] = lookup
-    return lookup
+    if safe_list_id not in cache:
+        cache[safe_list_id] = get_shared_managed_list_lookup(safe_list_id)
+    return cache[safe_list_id]
 
 
 def resolve_managed_list_path(raw_value, list_id, cache):
@@ -261,10 +299,10 @@ def resolve_managed_list_path(raw_value, list_id, cache):
 
     item_id = None
     numeric_value = int(raw_value) if str(raw_value or '').strip().isdigit() else None
-    if numeric_value and numeric_value in lookup['by_id']:
+    if numeric_value and numeric_value in lookup.by_id:
         item_id = numeric_value
     else:
-        item_id = lookup['by_value'].get(str(raw_value or '').strip())
+        item_id = lookup.by_value.get(str(raw_value or '').strip())
 
     if not item_id:
         return []
@@ -272,9 +310,9 @@ def resolve_managed_list_path(raw_value, list_id, cache):
     path = []
     visited = set()
     current_id = item_id
-    while current_id and current_id in lookup['by_id'] and current_id not in visited:
+    while current_id and current_id in lookup.by_id and current_id not in visited:
         visited.add(current_id)
-        item = lookup['by_id'][current_id]
+        item = lookup.by_id[current_id]
         label = str(item.get('label') or '').strip()
         if label:
             path.append(label)
@@ -299,7 +337,7 @@ def resolve_tree_field_display_value(field, raw_value, managed_list_cache=None):
 
     if str(field_options.get('source') or '').strip().lower() == 'managed_list':
         list_id = field_options.get('list_id')
-        path = resolve_managed_list_path(raw_value, list_id, managed_list_cache or {})
+        path = resolve_managed_list_path(raw_value, list_id, managed_list_cache if managed_list_cache is not None else {})
         if path:
             return ' > '.join(path)
 
@@ -312,7 +350,7 @@ def build_tree_display_data(obj, managed_list_cache=None):
         return object_data
 
     display_data = dict(object_data)
-    for field in obj.object_type.fields or []:
+    for field in get_object_type_fields(obj.object_type):
         field_name = getattr(field, 'field_name', None)
         if not field_name:
             continue
@@ -355,131 +393,556 @@ def get_tree_view_category_path(obj, tree_view, managed_list_cache=None):
     return [fallback_label]
 
 
-def build_instance_child_nodes(parent_object, view_config, managed_list_cache=None, visited_ids=None):
-    managed_list_cache = managed_list_cache or {}
-    visited_ids = set(visited_ids or set())
-    if parent_object.id in visited_ids:
-        return []
+def build_tree_display_projection(obj, managed_list_cache=None):
+    """Return (display data, requirement text, short description) of a tree object node."""
+    return (
+        build_tree_display_data(obj, managed_list_cache),
+        get_tree_requirement_text(obj),
+        get_tree_short_description(obj)
+    )
+
+
+TREE_NODE_FIELDS = ('id_full', 'created_at', 'data', 'kravtext', 'beskrivning', 'files', 'direction', 'instance_type')
+TREE_DISPLAY_FIELDS = ('data', 'kravtext', 'beskrivning')
+
+
+def parse_tree_expansion_args(args):
+    """
+    Read ?depth=, ?node= and ?fields= for the object tree.
+
+    depth counts the returned levels (groups included; 1 = only the returned
+    nodes). fields limits the optional object node keys to TREE_NODE_FIELDS;
+    id, name, type and children are always present. Returns
+    (depth or None, node or None, fields set or None); raises ValueError.
+    """
+    depth = None
+    raw_depth = str(args.get('depth') or '').strip()
+    if raw_depth:
+        try:
+            depth = int(raw_depth)
+        except ValueError:
+            raise ValueError('depth must be an integer')
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+
+    node_id = str(args.get('node') or '').strip() or None
+
+    fields = None
+    raw_fields = str(args.get('fields') or '').strip()
+    if raw_fields:
+        fields = {field.strip() for field in raw_fields.split(',') if field.strip()}
+        unknown = sorted(fields - set(TREE_NODE_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown tree fields: {', '.join(unknown)}")
+    return depth, node_id, fields
+
+
+def build_tree_object_node(obj, type_name, view_config, managed_list_cache, files_lookup, fields=None, **extra):
+    """Payload of one object node; fields limits the optional keys (None = all)."""
+    node = {
+        'id': str(obj.id),
+        'name': get_display_name(obj, type_name, view_config),
+        'type': type_name,
+    }
+    if fields is None or 'id_full' in fields:
+        node['id_full'] = obj.id_full
+    if fields is None or 'created_at' in fields:
+        node['created_at'] = obj.created_at.isoformat() if obj.created_at else None
+    if fields is None or not fields.isdisjoint(TREE_DISPLAY_FIELDS):
+        display_data, requirement_text, short_description = get_tree_display_projection(
+            obj, lambda item: build_tree_display_projection(item, managed_list_cache)
+        )
+        if fields is None or 'data' in fields:
+            # The projection is shared across requests; the node gets its own dict.
+            node['data'] = dict(display_data)
+        if fields is None or 'kravtext' in fields:
+            node['kravtext'] = requirement_text
+        if fields is None or 'beskrivning' in fields:
+            node['beskrivning'] = short_description
+    if fields is None or 'files' in fields:
+        node['files'] = get_object_files(obj, files_lookup)
+    for key, value in extra.items():
+        if fields is None or key in fields:
+            node[key] = value
+    return node
+
+
+def build_tree_group_node(group_id, name, children, tree_options=None):
+    node = {'id': group_id, 'name': name, 'type': 'group', 'children': children}
+    if tree_options is not None:
+        # Groups only exist for non-empty sets of objects.
+        node['has_children'] = True
+    return node
+
+
+def set_tree_node_children(node, object_id, children, tree_options=None):
+    """Attach children to an object node; None means the level was cut off by depth."""
+    node['children'] = children if children is not None else []
+    if tree_options is None:
+        return
+    if children is None:
+        tree_options['pending_has_children'].append((node, object_id))
+    else:
+        node['has_children'] = bool(children)
+
+
+class TreeBudget:
+    """
+    Node and time limit of one tree response.
+
+    Every node built takes one unit. Once the nodes or the time run out, each
+    child list still being built ends in a truncated marker instead (see
+    build_budgeted_tree_nodes). continuation is the (parent node id, offset)
+    of the list a continuation request resumes.
+    """
+
+    def __init__(self, max_nodes=None, max_seconds=None, continuation=None):
+        self.remaining_nodes = max_nodes
+        self.deadline = time.monotonic() + max_seconds if max_seconds else None
+        self.continuation = continuation
+        self.exhausted = False
+        self.timed_out = False
+        self.truncated_lists = 0
+
+    def take(self):
+        if not self.exhausted:
+            if self.remaining_nodes is not None and self.remaining_nodes <= 0:
+                self.exhausted = True
+            elif self.deadline is not None and time.monotonic() > self.deadline:
+                self.exhausted = self.timed_out = True
+            else:
+                if self.remaining_nodes is not None:
+                    self.remaining_nodes -= 1
+                return True
+        return False
+
+    def resumes(self, parent_node_id):
+        return self.continuation is not None and self.continuation[0] == parent_node_id
+
+
+def create_tree_budget(continuation=None):
+    """TreeBudget from TREE_MAX_NODES / TREE_MAX_SECONDS (0 disables a limit)."""
+    max_nodes = int(current_app.config.get('TREE_MAX_NODES') or 0)
+    max_seconds = float(current_app.config.get('TREE_MAX_SECONDS') or 0)
+    return TreeBudget(max_nodes or None, max_seconds or None, continuation)
+
+
+def encode_tree_continuation(tree_view, parent_node_id, offset):
+    payload = json.dumps([tree_view, parent_node_id, offset], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_tree_continuation(token):
+    """Return (view, parent node id or None, offset) of a continuation token; raises ValueError."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        tree_view, parent_node_id, offset = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid continuation token')
+    if (
+        tree_view not in TREE_VIEWS
+        or not (parent_node_id is None or isinstance(parent_node_id, str))
+        or not isinstance(offset, int)
+        or offset < 0
+    ):
+        raise ValueError('Invalid continuation token')
+    return tree_view, parent_node_id, offset
+
+
+def build_tree_truncated_node(tree_view, parent_node_id, offset, child_count, tree_options=None):
+    """Marker for the child_count nodes left out of a list from offset on."""
+    node = {
+        'id': f"truncated-{parent_node_id or 'root'}-{offset}",
+        'name': f'… {child_count} till',
+        'type': 'truncated',
+        'truncated': True,
+        'child_count': child_count,
+        'continuation': encode_tree_continuation(tree_view, parent_node_id, offset),
+        'children': [],
+    }
+    if tree_options is not None:
+        node['has_children'] = False
+    return node
+
+
+def build_budgeted_tree_nodes(entries, build_entry, tree_view, parent_node_id, tree_budget=None, tree_options=None):
+    """
+    Build the child list of parent_node_id from entries, in order, within tree_budget.
+
+    When the budget runs out, the entries left are replaced by one truncated
+    marker whose continuation token resumes this list at the first of them.
+    A list resumed by the current request starts at the token's offset and
+    always gets that first node, so following continuations makes progress.
+    """
+    if tree_budget is None:
+        return [build_entry(entry) for entry in entries]
+
+    resumed = tree_budget.resumes(parent_node_id)
+    start = tree_budget.continuation[1] if resumed else 0
+    nodes = []
+    for index in range(start, len(entries)):
+        if not tree_budget.take() and not (resumed and index == start):
+            tree_budget.truncated_lists += 1
+            nodes.append(build_tree_truncated_node(tree_view, parent_node_id, index, len(entries) - index, tree_options))
+            break
+        nodes.append(build_entry(entries[index]))
+    return nodes
+
+
+def build_tree_type_group_nodes(parent_object_id, entries_by_type, build_entry, view_config, tree_view, tree_options=None, tree_budget=None):
+    """
+    Type groups below an object: groups by type name, their objects by display name.
+
+    entries_by_type maps a type name to (object, ...) tuples in stored order;
+    build_entry(entry, type_name) builds one object node. Both levels are
+    sorted before any node is built, so a budget cut keeps the full tree's order.
+    """
+    def build_group(type_name):
+        group_id = f'group-{parent_object_id}-{type_name}'
+        entries = sorted(
+            entries_by_type[type_name],
+            key=lambda entry: natural_sort_key(get_display_name(entry[0], type_name, view_config))
+        )
+        children = build_budgeted_tree_nodes(
+            entries, lambda entry: build_entry(entry, type_name), tree_view, group_id, tree_budget, tree_options
+        )
+        return build_tree_group_node(group_id, type_name, children, tree_options)
+
+    return build_budgeted_tree_nodes(
+        sorted(entries_by_type.keys(), key=natural_sort_key),
+        build_group,
+        tree_view,
+        str(parent_object_id),
+        tree_budget,
+        tree_options
+    )
+
+
+def resolve_tree_has_children(tree_options, tree_view):
+    """Set has_children on the nodes cut off by depth with one EXISTS query."""
+    pending = tree_options['pending_has_children']
+    if not pending:
+        return
+    if tree_view == 'system':
+        has_children = db.exists().where(
+            Instance.parent_object_id == Object.id,
+            Instance.child_object_id != Object.id
+        )
+    else:
+        has_children = db.exists().where(
+            (ObjectRelation.source_object_id == Object.id) |
+            (ObjectRelation.target_object_id == Object.id)
+        )
+    object_ids = list({object_id for _, object_id in pending})
+    flags = dict(db.session.query(Object.id, has_children).filter(Object.id.in_(object_ids)).all())
+    for node, object_id in pending:
+        node['has_children'] = bool(flags.get(object_id))
+    tree_options['pending_has_children'] = []
+
+
+def load_instance_tree_graph(root_objects, depth=None):
+    """Load everything reachable from root_objects through instances in a fixed number of queries.
+
+    One WITH RECURSIVE query walks the instance graph (UNION drops objects
+    already reached, so cycles terminate) and returns its edges; the child
+    objects are then loaded with their data in one batch. depth is that of
+    the roots' child lists (see build_instance_child_nodes) and stops the walk
+    where the tree is cut off. Returns
+    {'children': {parent_id: [instance rows by id]}, 'objects': {object_id: obj}}.
+    """
+    objects_by_id = {root_object.id: root_object for root_object in root_objects}
+    if not objects_by_id:
+        return {'children': {}, 'objects': objects_by_id}
+
+    if depth is None:
+        reachable = db.select(Object.id.label('object_id')).where(
+            Object.id.in_(list(objects_by_id.keys()))
+        ).cte('reachable_objects', recursive=True)
+        reachable = reachable.union(
+            db.select(Instance.child_object_id).join(
+                reachable, Instance.parent_object_id == reachable.c.object_id
+            )
+        )
+    else:
+        # Objects at hop h have child lists of depth - 2 * h; only those with
+        # at least one level left need their edges.
+        max_hops = max((depth - 1) // 2, 0)
+        reachable = db.select(Object.id.label('object_id'), db.literal(0).label('hops')).where(
+            Object.id.in_(list(objects_by_id.keys()))
+        ).cte('reachable_objects', recursive=True)
+        reachable = reachable.union(
+            db.select(Instance.child_object_id, reachable.c.hops + 1).join(
+                reachable, Instance.parent_object_id == reachable.c.object_id
+            ).where(reachable.c.hops < max_hops)
+        )
+    edge_rows = db.session.execute(
+        db.select(
+            Instance.id,
+            Instance.parent_object_id,
+            Instance.child_object_id,
+            Instance.instance_type
+        ).where(
+            Instance.parent_object_id.in_(db.select(reachable.c.object_id))
+        ).order_by(Instance.id.asc())
+    ).all()
+
+    children = {}
+    for row in edge_rows:
+        children.setdefault(row.parent_object_id, []).append(row)
+
+    child_ids = {row.child_object_id for row in edge_rows if row.child_object_id not in objects_by_id}
+    if child_ids:
+        objects_by_id.update({
+            obj.id: obj
+            for obj in Object.query.options(object_data_loader()).filter(Object.id.in_(list(child_ids))).all()
+        })
+    return {'children': children, 'objects': objects_by_id}
+
 
-    next_visited_ids = set(visited_ids)
-    next_visited_ids.add(parent_object.id)
-    child_instances = Instance.query.filter_by(parent_object_id=parent_object.id).order_by(Instance.id.asc()).all()
+def build_instance_child_nodes(parent_object, view_config, managed_list_cache=None, visited_ids=None, files_lookup=None, instance_graph=None, depth=None, tree_options=None, tree_budget=None, only_type_name=None):
+    """Build the instance subtree of parent_object from instance_graph.
 
-    children_by_type = {}
-    for instance in child_instances:
-        child_object = instance.child_object
-        if not child_object or child_object.id in next_visited_ids:
+    visited_ids holds the objects on the current path and is updated in place
+    during the walk; a child already on the path closes a cycle and is left out.
+    depth counts the returned levels: type groups, then child objects, then
+    their groups and so on (None = the whole subtree). only_type_name limits
+    the result to one type group.
+    """
+    managed_list_cache = managed_list_cache if managed_list_cache is not None else {}
+    if instance_graph is None:
+        instance_graph = load_instance_tree_graph([parent_object], depth)
+    visited_ids = visited_ids if visited_ids is not None else set()
+    if parent_object.id in visited_ids:
+        return []
+    fields = tree_options['fields'] if tree_options is not None else None
+    child_depth = None if depth is None else depth - 2
+
+    visited_ids.add(parent_object.id)
+    entries_by_type = {}
+    for instance in instance_graph['children'].get(parent_object.id, []):
+        child_object = instance_graph['objects'].get(instance.child_object_id)
+        if not child_object or child_object.id in visited_ids:
             continue
 
         type_name = child_object.object_type.name if child_object.object_type else 'Objekt'
-        children_by_type.setdefault(type_name, [])
+        if only_type_name is not None and type_name != only_type_name:
+            continue
+        entries_by_type.setdefault(type_name, [])
+        if depth is None or depth >= 2:
+            entries_by_type[type_name].append((child_object, instance))
 
-        display_name = get_display_name(child_object, type_name, view_config)
-        child_object_data = build_tree_display_data(child_object, managed_list_cache)
-        nested_children = build_instance_child_nodes(
+    def build_child(entry, type_name):
+        child_object, instance = entry
+        child_node = build_tree_object_node(
             child_object,
+            type_name,
             view_config,
-            managed_list_cache=managed_list_cache,
-            visited_ids=next_visited_ids,
+            managed_list_cache,
+            files_lookup,
+            fields,
+            direction='outgoing',
+            instance_type=instance.instance_type
         )
+        nested_children = None
+        if child_depth is None or child_depth > 0:
+            nested_children = build_instance_child_nodes(
+                child_object,
+                view_config,
+                managed_list_cache=managed_list_cache,
+                visited_ids=visited_ids,
+                files_lookup=files_lookup,
+                instance_graph=instance_graph,
+                depth=child_depth,
+                tree_options=tree_options,
+                tree_budget=tree_budget,
+            )
+        set_tree_node_children(child_node, child_object.id, nested_children, tree_options)
+        return child_node
+
+    children = build_tree_type_group_nodes(
+        parent_object.id, entries_by_type, build_child, view_config, 'system', tree_options, tree_budget
+    )
+    visited_ids.discard(parent_object.id)
+    return children
 
-        children_by_type[type_name].append({
-            'id': str(child_object.id),
-            'id_full': child_object.id_full,
-            'name': display_name,
-            'type': type_name,
-            'direction': 'outgoing',
-            'created_at': child_object.created_at.isoformat() if child_object.created_at else None,
-            'data': child_object_data,
-            'kravtext': get_tree_requirement_text(child_object),
-            'beskrivning': get_tree_short_description(child_object),
-            'files': collect_tree_files_for_object(child_object),
-            'instance_type': instance.instance_type,
-            'children': nested_children,
-        })
 
-    children = []
-    for type_name in sorted(children_by_type.keys(), key=natural_sort_key):
-        type_children = sorted(children_by_type[type_name], key=lambda item: natural_sort_key(item.get('name')))
-        children.append({
-            'id': f'group-{parent_object.id}-{type_name}',
-            'name': type_name,
-            'type': 'group',
-            'children': type_children
+def load_tree_relation_graph(root_objects, include_files=True, unexpanded_objects=()):
+    """Load the relation neighbourhood of tree roots in a fixed number of queries.
+
+    Returns {'links': {root_id: [(linked_object, direction)]}, 'files_lookup': ...}.
+    Links keep the order of the former per-root queries: outgoing relations
+    by id, then incoming relations by id (a self-relation appears in both).
+    Queries: relations, neighbour objects with their data, and the files
+    lookup for roots, neighbours and unexpanded_objects (roots shown without
+    children).
+    """
+    root_ids = [root_object.id for root_object in root_objects]
+    extra_file_ids = [obj.id for obj in unexpanded_objects]
+    if not root_ids:
+        return {'links': {}, 'files_lookup': build_files_lookup(extra_file_ids) if include_files else {}}
+
+    relation_rows = db.session.query(
+        ObjectRelation.source_object_id,
+        ObjectRelation.target_object_id
+    ).filter(
+        (ObjectRelation.source_object_id.in_(root_ids)) |
+        (ObjectRelation.target_object_id.in_(root_ids))
+    ).order_by(ObjectRelation.id).all()
+
+    requested = set(root_ids)
+    outgoing_ids = {root_id: [] for root_id in root_ids}
+    incoming_ids = {root_id: [] for root_id in root_ids}
+    for source_id, target_id in relation_rows:
+        if source_id in requested:
+            outgoing_ids[source_id].append(target_id)
+        if target_id in requested:
+            incoming_ids[target_id].append(source_id)
+
+    objects_by_id = {root_object.id: root_object for root_object in root_objects}
+    neighbour_ids = {
+        linked_id
+        for source_id, target_id in relation_rows
+        for linked_id in (source_id, target_id)
+        if linked_id is not None and linked_id not in objects_by_id
+    }
+    if neighbour_ids:
+        objects_by_id.update({
+            obj.id: obj
+            for obj in Object.query.options(object_data_loader()).filter(Object.id.in_(list(neighbour_ids))).all()
         })
-    return children
 
+    links = {}
+    for root_id in root_ids:
+        links[root_id] = [
+            (objects_by_id.get(linked_id), 'outgoing') for linked_id in outgoing_ids[root_id]
+        ] + [
+            (objects_by_id.get(linked_id), 'incoming') for linked_id in incoming_ids[root_id]
+        ]
 
-def build_tree_root_nodes(root_objects, view_config, managed_list_cache=None, tree_view='byggdelar'):
-    tree_nodes = []
-    for root_object in root_objects:
-        if tree_view == 'system':
-            children = build_instance_child_nodes(root_object, view_config, managed_list_cache=managed_list_cache)
-        else:
-            outgoing = ObjectRelation.query.filter_by(source_object_id=root_object.id).all()
-            incoming = ObjectRelation.query.filter_by(target_object_id=root_object.id).all()
-            relations = outgoing + incoming
+    if not include_files:
+        return {'links': links, 'files_lookup': {}}
+    node_ids = list(root_ids) + [
+        linked_object.id
+        for root_links in links.values()
+        for linked_object, _ in root_links
+        if linked_object is not None
+    ] + extra_file_ids
+    return {'links': links, 'files_lookup': build_files_lookup(node_ids)}
+
+
+def sort_tree_root_objects(root_objects, view_config):
+    """Roots in tree order: by display name, keeping the given order on ties."""
+    return sorted(
+        root_objects,
+        key=lambda obj: natural_sort_key(get_display_name(obj, obj.object_type.name if obj.object_type else 'Objekt', view_config))
+    )
 
-            children = []
-            children_by_type = {}
 
-            for relation in relations:
-                linked_object = relation.target_object if relation.source_object_id == root_object.id else relation.source_object
-                direction = 'outgoing' if relation.source_object_id == root_object.id else 'incoming'
+def prepare_tree_root_builder(root_objects, view_config, managed_list_cache=None, tree_view='byggdelar', relation_graph=None, depth=None, tree_options=None, tree_budget=None):
+    """Load what the root nodes need and return build_root(root_object, only_type_name=None).
 
+    depth is that of the list holding the roots (1 = roots without children);
+    only_type_name limits a root's children to one type group.
+    """
+    managed_list_cache = managed_list_cache if managed_list_cache is not None else {}
+    fields = tree_options['fields'] if tree_options is not None else None
+    include_files = fields is None or 'files' in fields
+    child_depth = None if depth is None else depth - 1
+    expand_roots = child_depth is None or child_depth > 0
+
+    if tree_view == 'system':
+        instance_graph = load_instance_tree_graph(root_objects, child_depth) if expand_roots else None
+        file_object_ids = list(instance_graph['objects'].keys()) if instance_graph else [obj.id for obj in root_objects]
+        files_lookup = build_files_lookup(file_object_ids) if include_files else {}
+    else:
+        if relation_graph is None:
+            if expand_roots:
+                relation_graph = load_tree_relation_graph(root_objects, include_files)
+            else:
+                relation_graph = load_tree_relation_graph([], include_files, unexpanded_objects=root_objects)
+        files_lookup = relation_graph['files_lookup']
+
+    def build_linked_node(entry, type_name):
+        linked_object, direction = entry
+        linked_node = build_tree_object_node(
+            linked_object,
+            type_name,
+            view_config,
+            managed_list_cache,
+            files_lookup,
+            fields,
+            direction=direction
+        )
+        if tree_options is not None:
+            # Related objects are leaves in these views.
+            linked_node['has_children'] = False
+        return linked_node
+
+    def build_root(root_object, only_type_name=None):
+        children = None
+        if not expand_roots:
+            pass
+        elif tree_view == 'system':
+            children = build_instance_child_nodes(
+                root_object,
+                view_config,
+                managed_list_cache=managed_list_cache,
+                files_lookup=files_lookup,
+                instance_graph=instance_graph,
+                depth=child_depth,
+                tree_options=tree_options,
+                tree_budget=tree_budget,
+                only_type_name=only_type_name
+            )
+        else:
+            entries_by_type = {}
+            for linked_object, direction in relation_graph['links'].get(root_object.id, []):
                 if linked_object:
                     type_name = linked_object.object_type.name
-                    if type_name not in children_by_type:
-                        children_by_type[type_name] = []
-
-                    display_name = get_display_name(linked_object, type_name, view_config)
-                    linked_object_data = build_tree_display_data(linked_object, managed_list_cache)
-
-                    children_by_type[type_name].append({
-                        'id': str(linked_object.id),
-                        'id_full': linked_object.id_full,
-                        'name': display_name,
-                        'type': type_name,
-                        'direction': direction,
-                        'created_at': linked_object.created_at.isoformat() if linked_object.created_at else None,
-                        'data': linked_object_data,
-                        'kravtext': get_tree_requirement_text(linked_object),
-                        'beskrivning': get_tree_short_description(linked_object),
-                        'files': collect_tree_files_for_object(linked_object)
-                    })
-
-            for type_name in sorted(children_by_type.keys(), key=natural_sort_key):
-                type_children = sorted(children_by_type[type_name], key=lambda item: natural_sort_key(item.get('name')))
-                children.append({
-                    'id': f'group-{root_object.id}-{type_name}',
-                    'name': type_name,
-                    'type': 'group',
-                    'children': type_children
-                })
+                    if only_type_name is not None and type_name != only_type_name:
+                        continue
+                    entries_by_type.setdefault(type_name, [])
+                    if child_depth is None or child_depth >= 2:
+                        entries_by_type[type_name].append((linked_object, direction))
+            children = build_tree_type_group_nodes(
+                root_object.id, entries_by_type, build_linked_node, view_config, tree_view, tree_options, tree_budget
+            )
 
         root_type_name = root_object.object_type.name if root_object.object_type else 'Objekt'
-        root_display_name = get_display_name(root_object, root_type_name, view_config)
-        root_data = build_tree_display_data(root_object, managed_list_cache)
-
-        tree_nodes.append({
-            'id': str(root_object.id),
-            'id_full': root_object.id_full,
-            'name': root_display_name,
-            'type': root_type_name,
-            'created_at': root_object.created_at.isoformat() if root_object.created_at else None,
-            'data': root_data,
-            'kravtext': get_tree_requirement_text(root_object),
-            'beskrivning': get_tree_short_description(root_object),
-            'files': collect_tree_files_for_object(root_object),
-            'children': children
-        })
+        root_node = build_tree_object_node(root_object, root_type_name, view_config, managed_list_cache, files_lookup, fields)
+        set_tree_node_children(root_node, root_object.id, children, tree_options)
+        return root_node
+
+    return build_root
+
+
+def build_tree_root_nodes(root_objects, view_config, managed_list_cache=None, tree_view='byggdelar', relation_graph=None, depth=None, tree_options=None, tree_budget=None, parent_node_id=None):
+    """Build root object nodes in name order; depth counts the returned levels (1 = roots without children)."""
+    build_root = prepare_tree_root_builder(
+        root_objects,
+        view_config,
+        managed_list_cache,
+        tree_view=tree_view,
+        relation_graph=relation_graph,
+        depth=depth,
+        tree_options=tree_options,
+        tree_budget=tree_budget
+    )
+    return build_budgeted_tree_nodes(
+        sort_tree_root_objects(root_objects, view_config), build_root, tree_view, parent_node_id, tree_budget, tree_options
+    )
 
-    return sorted(tree_nodes, key=lambda item: natural_sort_key(item.get('name')))
 
+def build_category_group_tree(root_objects, tree_view, view_config, depth=None, tree_options=None, node_id=None, tree_budget=None):
+    """Group root objects by their category path.
 
-def build_category_group_tree(root_objects, tree_view, view_config):
+    depth counts the returned levels (None = everything). With node_id only
+    the children of that category group are returned, or None if there is no
+    such group. A group's children are its subgroups followed by its roots,
+    built as one list within tree_budget.
+    """
     managed_list_cache = {}
-    relations_lookup = build_relations_lookup([obj.id for obj in root_objects])
+    include_files = tree_options is None or tree_options['fields'] is None or 'files' in tree_options['fields']
     category_tree = {}
 
     for root_object in root_objects:
@@ -496,23 +959,70 @@ def build_category_group_tree(root_objects, tree_view, view_config):
             continue
         current_group['objects'].append(root_object)
 
-    def serialize_group_nodes(tree_level, path_segments=None):
-        path_segments = path_segments or []
-        nodes = []
+    def iter_groups(tree_level, path_segments):
         for index, group_name in enumerate(sorted(tree_level.keys(), key=natural_sort_key), start=1):
-            group_data = tree_level[group_name]
             current_path = path_segments + [group_name]
-            child_groups = serialize_group_nodes(group_data['children'], current_path)
             group_slug = re.sub(r'[^a-z0-9]+', '-', normalize_lookup_key('-'.join(current_path))) or f'kategori-{index}'
-            nodes.append({
-                'id': f"category-{tree_view}-{group_slug}-{index}",
-                'name': group_name,
-                'type': 'group',
-                'children': child_groups + build_tree_root_nodes(group_data['objects'], view_config, managed_list_cache, tree_view=tree_view)
-            })
-        return nodes
+            yield f"category-{tree_view}-{group_slug}-{index}", group_name, tree_level[group_name], current_path
+
+    def find_group(tree_level, path_segments):
+        for group_id, _, group_data, current_path in iter_groups(tree_level, path_segments):
+            if group_id == node_id:
+                return group_data, current_path
+            found = find_group(group_data['children'], current_path)
+            if found:
+                return found
+        return None
+
+    def collect_roots(group_data, depth, expanded, unexpanded):
+        """Split the roots shown in the children of group_data (at depth) by whether they get children."""
+        if depth == 0:
+            return
+        (expanded if depth is None or depth > 1 else unexpanded).extend(group_data['objects'])
+        for child_group in group_data['children'].values():
+            collect_roots(child_group, None if depth is None else depth - 1, expanded, unexpanded)
+
+    def serialize_group_children(group_data, group_node_id, path_segments, depth):
+        build_root = prepare_tree_root_builder(
+            group_data['objects'],
+            view_config,
+            managed_list_cache,
+            tree_view=tree_view,
+            relation_graph=relation_graph,
+            depth=depth,
+            tree_options=tree_options,
+            tree_budget=tree_budget
+        )
+
+        def build_entry(entry):
+            kind, value = entry
+            if kind == 'object':
+                return build_root(value)
+            group_id, group_name, child_group, current_path = value
+            child_depth = None if depth is None else depth - 1
+            children = serialize_group_children(child_group, group_id, current_path, child_depth) if child_depth != 0 else []
+            return build_tree_group_node(group_id, group_name, children, tree_options)
+
+        entries = [
+            ('group', group) for group in iter_groups(group_data['children'], path_segments)
+        ] + [
+            ('object', root_object) for root_object in sort_tree_root_objects(group_data['objects'], view_config)
+        ]
+        return build_budgeted_tree_nodes(entries, build_entry, tree_view, group_node_id, tree_budget, tree_options)
+
+    start_group, start_path = {'children': category_tree, 'objects': []}, []
+    if node_id is not None:
+        found = find_group(category_tree, [])
+        if found is None:
+            return None
+        start_group, start_path = found
+
+    # One graph load for every category group instead of one per group.
+    expanded_roots, unexpanded_roots = [], []
+    collect_roots(start_group, depth, expanded_roots, unexpanded_roots)
+    relation_graph = load_tree_relation_graph(expanded_roots, include_files, unexpanded_objects=unexpanded_roots)
 
-    return serialize_group_nodes(category_tree)
+    return serialize_group_children(start_group, node_id, start_path, depth)
 
 
 def is_document_object_type(type_name):
@@ -558,9 +1068,10 @@ def apply_connection_name_rules(object_type, object_data):
     if not isinstance(object_data, dict):
         return False, ['Data payload must be an object'], object_data
 
-    del_a_field_name = find_field_name_by_aliases(object_type.fields, ['del_a', 'dela', 'del a'])
-    del_b_field_name = find_field_name_by_aliases(object_type.fields, ['del_b', 'delb', 'del b'])
-    name_field_name = find_field_name_by_aliases(object_type.fields, ['namn', 'name'])
+    fields = get_object_type_fields(object_type)
+    del_a_field_name = find_field_name_by_aliases(fields, ['del_a', 'dela', 'del a'])
+    del_b_field_name = find_field_name_by_aliases(fields, ['del_b', 'delb', 'del b'])
+    name_field_name = find_field_name_by_aliases(fields, ['namn', 'name'])
 
     errors = []
     if not del_a_field_name:
@@ -659,7 +1170,13 @@ def set_object_data_value(record, field_type, value, field_options=None):
             result.append(parsed)
         return result
 
-    def resolve_path_payload(item_id):
+    def resolve_path_payload(item_id, list_id):
+        lookup = get_managed_list_lookup(list_id, {})
+        payload = lookup.get_path_payload(item_id, locale='sv', fallback_language_code='en') if lookup else None
+        if payload is not None:
+            return payload
+
+        # Items outside the field's list are resolved from the database.
         from models import ManagedListItem
         item = ManagedListItem.query.get(item_id)
         if not item:
@@ -748,7 +1265,7 @@ def set_object_data_value(record, field_type, value, field_options=None):
 
         selected = []
         for selected_id in selected_ids:
-            payload = resolve_path_payload(selected_id)
+            payload = resolve_path_payload(selected_id, field_options.get('list_id'))
             if payload:
                 selected.append(payload)
 
@@ -953,7 +1470,10 @@ def build_relations_lookup(object_ids):
     """
     if not object_ids:
         return {}
-    all_relations = ObjectRelation.query.filter(
+    all_relations = ObjectRelation.query.options(
+        selectinload(ObjectRelation.source_object).selectinload(Object.object_data),
+        selectinload(ObjectRelation.target_object).selectinload(Object.object_data)
+    ).filter(
         (ObjectRelation.source_object_id.in_(object_ids)) |
         (ObjectRelation.target_object_id.in_(object_ids))
     ).all()
@@ -1009,9 +1529,106 @@ def collect_tree_files_for_object(obj, relations_lookup=None):
     return files
 
 
+def build_files_lookup(object_ids):
+    """Resolve tree file payloads for many objects in a fixed number of queries.
+
+    Returns {object_id: files} with the same content and order as
+    collect_tree_files_for_object: direct documents first, then documents of
+    related document/drawing objects. Queries: relations, neighbour types,
+    documents, and the owners of those documents (with their data).
+    """
+    object_ids = list(dict.fromkeys(object_ids or []))
+    if not object_ids:
+        return {}
+
+    relation_rows = db.session.query(
+        ObjectRelation.source_object_id,
+        ObjectRelation.target_object_id
+    ).filter(
+        (ObjectRelation.source_object_id.in_(object_ids)) |
+        (ObjectRelation.target_object_id.in_(object_ids))
+    ).order_by(ObjectRelation.id).all()
+
+    requested = set(object_ids)
+    linked_ids_by_object = {object_id: [] for object_id in object_ids}
+    for source_id, target_id in relation_rows:
+        if source_id in requested:
+            linked_ids_by_object[source_id].append(target_id)
+        if target_id in requested and target_id != source_id:
+            linked_ids_by_object[target_id].append(source_id)
+
+    neighbour_ids = {linked_id for linked_ids in linked_ids_by_object.values() for linked_id in linked_ids}
+    document_object_ids = set()
+    if neighbour_ids:
+        schema = get_schema()
+        type_rows = db.session.query(Object.id, Object.object_type_id, ObjectType.name).join(
+            ObjectType, ObjectType.id == Object.object_type_id
+        ).filter(Object.id.in_(list(neighbour_ids))).all()
+        for object_id, object_type_id, type_name in type_rows:
+            schema_type = schema.types_by_id.get(object_type_id) if schema is not None else None
+            if is_document_object_type(schema_type.name if schema_type is not None else type_name):
+                document_object_ids.add(object_id)
+
+    owner_ids = requested | document_object_ids
+    documents_by_owner = {}
+    for document in Document.query.filter(Document.object_id.in_(list(owner_ids))).order_by(Document.id).all():
+        documents_by_owner.setdefault(document.object_id, []).append(document)
+
+    owners = {}
+    if documents_by_owner:
+        owners = {
+            owner.id: owner
+            for owner in Object.query.options(object_data_loader()).filter(
+                Object.id.in_(list(documents_by_owner.keys()))
+            ).all()
+        }
+
+    document_payloads = {}
+
+    def document_payload(document):
+        if document.id not in document_payloads:
+            payload = document.to_dict()
+            payload['description'] = get_document_link_description(document, owners.get(document.object_id))
+            document_payloads[document.id] = payload
+        return document_payloads[document.id]
+
+    lookup = {}
+    for object_id in object_ids:
+        files = []
+        seen_ids = set()
+        candidates = [(object_id, 'direct')] + [
+            (linked_id, 'indirect')
+            for linked_id in linked_ids_by_object[object_id]
+            if linked_id in document_object_ids
+        ]
+        for owner_id, source in candidates:
+            for document in documents_by_owner.get(owner_id, []):
+                if document.id in seen_ids:
+                    continue
+                seen_ids.add(document.id)
+                files.append({**document_payload(document), 'source': source})
+        lookup[object_id] = files
+    return lookup
+
+
+def build_relation_list_lookup(objects):
+    """build_relations_lookup for the objects whose type has relation_list fields."""
+    return build_relations_lookup([
+        obj.id for obj in objects
+        if any(field.field_type == 'relation_list' for field in get_object_type_fields(obj.object_type))
+    ])
+
+
+def get_object_files(obj, files_lookup=None, relations_lookup=None):
+    """Return tree files for obj from files_lookup when it covers obj."""
+    if files_lookup is not None and obj.id in files_lookup:
+        return files_lookup[obj.id]
+    return collect_tree_files_for_object(obj, relations_lookup)
+
+
 def compute_relation_list_values(obj, relations_lookup=None):
     """Return a dict of {field_name: "Name A, Name B"} for all relation_list fields on obj."""
-    fields = getattr(obj.object_type, 'fields', []) or []
+    fields = get_object_type_fields(obj.object_type)
     rel_list_fields = [f for f in fields if f.field_type == 'relation_list']
     if not rel_list_fields:
         return {}
@@ -1046,9 +1663,9 @@ def compute_relation_list_values(obj, relations_lookup=None):
     return result
 
 
-def enrich_object_with_file_metadata(payload, obj, relations_lookup=None):
+def enrich_object_with_file_metadata(payload, obj, relations_lookup=None, files_lookup=None):
     """Attach file metadata and relation_list field values."""
-    files = collect_tree_files_for_object(obj, relations_lookup)
+    files = get_object_files(obj, files_lookup, relations_lookup)
     payload['files'] = files
     payload['file_count'] = len(files)
     payload['has_files'] = len(files) > 0
@@ -1058,9 +1675,396 @@ def enrich_object_with_file_metadata(payload, obj, relations_lookup=None):
     return payload
 
 
+def parse_sparse_fieldset_args(allowed_includes):
+    """Read the ``fields`` and ``include`` query arguments.
+
+    Returns (field_keys, includes). Without either argument both are None and
+    the caller returns its full payload. Otherwise field_keys is the set of
+    normalized names to return (None = all data fields) and includes is the
+    set of requested enrichments. Raises ValueError for unknown includes.
+    """
+    raw_fields = request.args.get('fields')
+    raw_include = request.args.get('include')
+    if raw_fields is None and raw_include is None:
+        return None, None
+
+    field_keys = None
+    if raw_fields is not None:
+        field_keys = {normalize_field_key(name) for name in raw_fields.split(',') if name.strip()}
+
+    includes = {item.strip().lower() for item in (raw_include or '').split(',') if item.strip()}
+    unknown = includes - allowed_includes
+    if unknown:
+        raise ValueError(f"Unknown include: {', '.join(sorted(unknown))}")
+    return field_keys, includes
+
+
+def load_sparse_object_data(objects, field_keys):
+    """Decode only the ObjectData rows whose field name is in field_keys.
+
+    Returns {object_id: {field_name: value}} from a single query filtered by
+    field_id, without loading the objects' full object_data collections.
+    """
+    data_by_object = {obj.id: {} for obj in objects}
+    if not data_by_object or not field_keys:
+        return data_by_object
+
+    schema = get_schema()
+    candidate_fields = schema.fields_by_id.values() if schema is not None else ObjectField.query.all()
+    field_decoder = compile_field_decoder(
+        field for field in candidate_fields
+        if normalize_field_key(field.field_name) in field_keys
+    )
+    if not field_decoder:
+        return data_by_object
+
+    rows = db.session.query(
+        ObjectData.object_id,
+        ObjectData.field_id,
+        ObjectData.value_text,
+        ObjectData.value_number,
+        ObjectData.value_date,
+        ObjectData.value_boolean,
+        ObjectData.value_json
+    ).filter(
+        ObjectData.object_id.in_(list(data_by_object.keys())),
+        ObjectData.field_id.in_(list(field_decoder.keys()))
+    ).order_by(ObjectData.id).all()
+
+    for row in rows:
+        field_name, decode = field_decoder[row.field_id]
+        try:
+            data_by_object[row.object_id][field_name] = decode(row)
+        except Exception as e:
+            logger.warning(f"Error processing field data for object {row.object_id}, field {row.field_id}: {str(e)}")
+    return data_by_object
+
+
+def build_sparse_object_payload(obj, field_keys, includes, data, relations_lookup=None, files_lookup=None):
+    """Serialize obj with only the requested attributes, data and enrichments."""
+    schema = get_schema()
+    object_type = schema.types_by_id.get(obj.object_type_id) if schema is not None else None
+    if object_type is None:
+        object_type = obj.object_type
+
+    payload = {
+        'id': obj.id,
+        'id_full': obj.normalized_full_id(),
+        'object_type': {
+            'id': object_type.id if object_type else None,
+            'name': object_type.name if object_type else None
+        }
+    }
+
+    attributes = {
+        'base_id': obj.normalized_base_id,
+        'main_id': obj.normalized_base_id,
+        'version': obj.normalized_version,
+        'status': lambda: obj.status,
+        'created_at': lambda: obj.created_at.isoformat() if obj.created_at else None,
+        'updated_at': lambda: obj.updated_at.isoformat() if obj.updated_at else None,
+        'created_by': lambda: obj.created_by
+    }
+    for name in SPARSE_OBJECT_ATTRIBUTES:
+        if field_keys is None or normalize_field_key(name) in field_keys:
+            payload[name] = attributes[name]()
+
+    payload['data'] = data
+    if 'relation_lists' in includes:
+        # Relation-list values are derived, so they come with the include
+        # rather than being selected through fields.
+        payload['data'].update(compute_relation_list_values(obj, relations_lookup))
+    if 'files' in includes:
+        files = get_object_files(obj, files_lookup, relations_lookup)
+        payload['files'] = files
+        payload['file_count'] = len(files)
+        payload['has_files'] = len(files) > 0
+    return payload
+
+
+def load_object_relations_payload(obj):
+    """The 'relations' of the detail payload, with the targets and their data loaded in batches."""
+    source_relations = (
+        ObjectRelation.query
+        .options(selectinload(ObjectRelation.target_object).options(object_data_loader()))
+        .filter(ObjectRelation.source_object_id == obj.id)
+        .order_by(ObjectRelation.id)
+        .all()
+    )
+    return obj.relations_to_dict(source_relations)
+
+
+def get_object_data_value_column(field_type):
+    """Return (kind, ObjectData column) holding values of field_type (see set_object_data_value)."""
+    if field_type in ('number', 'date', 'boolean'):
+        return field_type, getattr(ObjectData, f'value_{field_type}')
+    return 'text', ObjectData.value_text
+
+
+def resolve_object_list_column(name, object_type_name=None):
+    """Resolve a sort/filter column to ('attribute', kind, expression) or ('data', kind, field_ids).
+
+    Data fields are matched by field_name (case-insensitive) within the listed
+    type, or across all types; the typed value column comes from field_type.
+    Raises ValueError for unknown or ambiguous names.
+    """
+    key = str(name or '').strip().lower()
+    attribute_columns = {
+        'id_full': ('text', Object.id_full),
+        'main_id': ('text', Object.main_id),
+        'status': ('text', Object.status),
+        'version': ('text', Object.version),
+        'created_by': ('text', Object.created_by),
+        'created_at': ('datetime', Object.created_at),
+        'updated_at': ('datetime', Object.updated_at),
+        'object_type': (
+            'text',
+            db.select(ObjectType.name).where(ObjectType.id == Object.object_type_id).scalar_subquery()
+        ),
+    }
+    if key in attribute_columns:
+        kind, expression = attribute_columns[key]
+        return 'attribute', kind, expression
+
+    schema = get_schema()
+    if schema is not None:
+        if object_type_name:
+            schema_type = schema.types_by_name.get(object_type_name)
+            candidate_fields = schema_type.fields if schema_type is not None else []
+        else:
+            candidate_fields = schema.fields_by_id.values()
+    else:
+        field_query = ObjectField.query
+        if object_type_name:
+            field_query = field_query.join(ObjectType).filter(ObjectType.name == object_type_name)
+        candidate_fields = field_query.all()
+
+    matching = [field for field in candidate_fields if str(field.field_name or '').strip().lower() == key]
+    if not matching:
+        raise ValueError(f"Unknown field: {name}")
+    kinds = {get_object_data_value_column(field.field_type)[0] for field in matching}
+    if len(kinds) > 1:
+        raise ValueError(f"Field {name} has conflicting types")
+    return 'data', kinds.pop(), [field.id for field in matching]
+
+
+def parse_object_list_filter_value(kind, raw_value):
+    text = str(raw_value).strip()
+    if kind == 'number':
+        return Decimal(text)
+    if kind == 'date':
+        return date.fromisoformat(text)
+    if kind == 'datetime':
+        value = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        # created_at/updated_at are naive UTC columns.
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if kind == 'boolean':
+        lowered = text.lower()
+        if lowered in ('true', '1', 'yes', 'ja'):
+            return True
+        if lowered in ('false', '0', 'no', 'nej'):
+            return False
+        raise ValueError(text)
+    return text.lower()
+
+
+def build_object_list_condition(expression, kind, op, raw_value):
+    """Compile one typed comparison; text comparisons are case-insensitive."""
+    if kind == 'text':
+        expression = db.func.lower(expression)
+
+    if op == 'in':
+        return expression.in_([
+            parse_object_list_filter_value(kind, part)
+            for part in raw_value.split(',') if part.strip()
+        ])
+    if op == 'between':
+        low, separator, high = raw_value.partition(',')
+        if not separator:
+            raise ValueError(raw_value)
+        return expression.between(
+            parse_object_list_filter_value(kind, low),
+            parse_object_list_filter_value(kind, high)
+        )
+
+    value = parse_object_list_filter_value(kind, raw_value)
+    if op == 'contains':
+        return expression.like(f"%{escape_like(value)}%", escape='\\')
+    if op == 'startswith':
+        return expression.like(f"{escape_like(value)}%", escape='\\')
+    if op in ('eq', 'ne'):
+        return expression == value
+    return {
+        'lt': expression < value,
+        'lte': expression <= value,
+        'gt': expression > value,
+        'gte': expression >= value,
+    }[op]
+
+
+def apply_object_list_filters(query, filters, object_type_name=None):
+    """Apply {column: '<op>:<value>'} filters, compiled against typed object_data columns."""
+    for name, spec in (filters or {}).items():
+        source, kind, target = resolve_object_list_column(name, object_type_name)
+        allowed_ops = OBJECT_LIST_FILTER_OPS[kind]
+        op, separator, raw_value = str(spec or '').partition(':')
+        if not separator or op.strip().lower() not in allowed_ops:
+            op, raw_value = allowed_ops[0], str(spec or '')
+        op = op.strip().lower()
+        if not raw_value.strip():
+            raise ValueError(f"Missing filter value for {name}")
+
+        try:
+            if source == 'attribute':
+                condition = build_object_list_condition(target, kind, 'eq' if op == 'ne' else op, raw_value)
+                query = query.filter(~condition if op == 'ne' else condition)
+                continue
+
+            value_column = get_object_data_value_column(kind)[1]
+            condition = build_object_list_condition(value_column, kind, 'eq' if op == 'ne' else op, raw_value)
+        except (ValueError, InvalidOperation):
+            raise ValueError(f"Invalid filter value for {name}")
+
+        matching_data = (
+            db.session.query(ObjectData.id)
+            .filter(
+                ObjectData.object_id == Object.id,
+                ObjectData.field_id.in_(target),
+                condition
+            )
+            .exists()
+        )
+        # ne also keeps objects that have no value for the field.
+        query = query.filter(~matching_data if op == 'ne' else matching_data)
+    return query
+
+
+def apply_object_list_sort(query, sort, object_type_name=None):
+    """Order by sort ('field' or '-field' for descending), then newest first."""
+    descending = sort.startswith('-')
+    source, kind, target = resolve_object_list_column(sort.lstrip('-'), object_type_name)
+    if source == 'attribute':
+        sort_expression = db.func.lower(target) if kind == 'text' else target
+    else:
+        value_column = get_object_data_value_column(kind)[1]
+        if kind == 'text':
+            value_column = db.func.lower(value_column)
+        # A subquery rather than a join: an object with several rows for the
+        # field ids (one name across types) must still be one row of the list.
+        aggregate = db.func.max if descending else db.func.min
+        sort_expression = (
+            db.select(aggregate(value_column))
+            .where(ObjectData.object_id == Object.id, ObjectData.field_id.in_(target))
+            .scalar_subquery()
+        )
+    sort_expression = sort_expression.desc() if descending else sort_expression.asc()
+    return query.order_by(None).order_by(
+        sort_expression.nulls_last(),
+        Object.created_at.desc().nulls_last(),
+        Object.id.desc()
+    )
+
+
+def parse_object_list_filter_args():
+    """Collect filter[<field>]=<op>:<value> query arguments."""
+    filters = {}
+    for key, value in request.args.items(multi=True):
+        match = OBJECT_LIST_FILTER_ARG.match(key)
+        if match:
+            filters[match.group(1)] = value
+    return filters
+
+
+def build_object_list_query(object_type_name=None, search=None, load_data=True, filters=None, sort=None):
+    """Build the filtered, ordered object query used by the object register.
+
+    Type, free-text search, typed column filters and sorting are resolved in
+    SQL so callers can paginate with LIMIT/OFFSET instead of loading every
+    object of the type into memory. Raises ValueError for invalid filters/sort.
+    """
+    query = Object.query
+    if load_data:
+        query = query.options(object_data_loader())
+
+    if object_type_name:
+        query = query.join(ObjectType).filter(ObjectType.name == object_type_name)
+
+    search_matches = build_search_match_query(search)
+    if search_matches is not None:
+        query = query.filter(Object.id.in_(db.select(search_matches.subquery().c.object_id)))
+
+    query = apply_object_list_filters(query, filters, object_type_name)
+    query = query.order_by(Object.created_at.desc().nulls_last(), Object.id.desc())
+    sort = str(sort or '').strip()
+    if sort:
+        query = apply_object_list_sort(query, sort, object_type_name)
+    return query
+
+
+def encode_object_list_cursor(obj):
+    """Encode the (created_at, id) keyset position of obj as an opaque token."""
+    payload = {
+        'created_at': obj.created_at.isoformat() if obj.created_at else None,
+        'id': obj.id
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_object_list_cursor(token):
+    """Decode a token from encode_object_list_cursor. Raises ValueError if malformed."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        created_at = payload.get('created_at')
+        return (
+            datetime.fromisoformat(created_at) if created_at else None,
+            int(payload['id'])
+        )
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise ValueError(f'Invalid cursor: {token}') from e
+
+
+def apply_object_list_cursor(query, created_at, object_id):
+    """Restrict an ordered object list query to rows after a keyset position.
+
+    Mirrors ORDER BY created_at DESC NULLS LAST, id DESC so each page is an
+    index range scan on objects(created_at, id) instead of an OFFSET skip.
+    """
+    if created_at is None:
+        return query.filter(Object.created_at.is_(None), Object.id < object_id)
+    return query.filter(
+        db.or_(
+            Object.created_at < created_at,
+            db.and_(Object.created_at == created_at, Object.id < object_id),
+            Object.created_at.is_(None)
+        )
+    )
+
+
+def build_object_list_response(items, page_meta=None, facets=None):
+    """Plain list without paging/facets, otherwise an ``items`` envelope."""
+    if page_meta is None and facets is None:
+        return jsonify(items), 200
+    response = {'items': items, **(page_meta or {})}
+    if facets is not None:
+        response['facets'] = facets
+    return jsonify(response), 200
+
+
 @bp.route('', methods=['GET'])
 def list_objects():
-    """List all objects with optional filtering and optional pagination."""
+    """List all objects with optional filtering and optional pagination.
+
+    Pagination is either page/per_page (with totals) or keyset via ``cursor``;
+    pass an empty cursor for the first page and then each ``next_cursor``.
+    ``sort=<field>`` (``-<field>`` descending) and ``filter[<field>]=<op>:<value>``
+    are evaluated in SQL on the field's typed value column; sort needs page paging.
+    ``facets=true`` (or a list of facet keys) adds counts over the whole filtered
+    set; the response is then always an ``items`` envelope.
+    """
     try:
         object_type_name = request.args.get('type')
         search = request.args.get('search')
@@ -1068,29 +2072,99 @@ def list_objects():
         page = request.args.get('page', type=int)
         per_page = request.args.get('per_page', type=int)
 
-        query = Object.query
+        cursor = request.args.get('cursor')
 
-        if object_type_name:
-            query = query.join(ObjectType).filter(ObjectType.name == object_type_name)
+        try:
+            field_keys, includes = parse_sparse_fieldset_args(OBJECT_LIST_INCLUDES)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        sparse = includes is not None
 
-        objects = query.order_by(Object.created_at.desc()).all()
+        sort = str(request.args.get('sort') or '').strip()
+        if sort and cursor is not None:
+            return jsonify({'error': 'sort cannot be combined with cursor paging'}), 400
 
-        # Pre-fetch all relations in one query to avoid N+1 per object
-        relations_lookup = build_relations_lookup([obj.id for obj in objects])
+        try:
+            facet_keys, facet_limit = parse_facet_args(request.args)
+            filters = parse_object_list_filter_args()
+            query = build_object_list_query(
+                object_type_name=object_type_name,
+                search=search,
+                # Sparse fieldsets load only the selected ObjectData rows below.
+                load_data=not (sparse and field_keys is not None),
+                filters=filters,
+                sort=sort
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        facets = None
+        if facet_keys is not None:
+            facet_object_ids = build_object_list_query(
+                object_type_name=object_type_name,
+                search=search,
+                load_data=False,
+                filters=filters
+            ).with_entities(Object.id).order_by(None)
+            object_type = ObjectType.query.filter_by(name=object_type_name).first() if object_type_name else None
+            facets = build_object_facets(
+                facet_object_ids,
+                facet_keys,
+                facet_limit,
+                object_type_id=object_type.id if object_type else None
+            )
 
-        if search:
-            search_lower = search.lower()
-            filtered_objects = []
-            for obj in objects:
-                if search_lower in (obj.id_full or '').lower():
-                    filtered_objects.append(obj)
-                    continue
+        page_meta = None
+        if cursor is not None:
+            # Keyset mode: an empty cursor starts from the newest object.
+            per_page = max(per_page or OBJECT_LIST_CURSOR_PAGE_SIZE, 1)
+            cursor = cursor.strip()
+            if cursor:
+                try:
+                    cursor_created_at, cursor_id = decode_object_list_cursor(cursor)
+                except ValueError:
+                    return jsonify({'error': 'Invalid cursor'}), 400
+                query = apply_object_list_cursor(query, cursor_created_at, cursor_id)
+
+            rows = query.limit(per_page + 1).all()
+            objects = rows[:per_page]
+            page_meta = {
+                'per_page': per_page,
+                'next_cursor': encode_object_list_cursor(objects[-1]) if len(rows) > per_page else None
+            }
+        elif page and per_page:
+            per_page = max(per_page, 1)
+            total = query.order_by(None).count()
+            total_pages = max((total + per_page - 1) // per_page, 1)
+            page = min(max(page, 1), total_pages)
+            objects = query.limit(per_page).offset((page - 1) * per_page).all()
+            page_meta = {
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'total_pages': total_pages
+            }
+        else:
+            objects = query.all()
 
-                for od in obj.object_data:
-                    if od.value_text and search_lower in od.value_text.lower():
-                        filtered_objects.append(obj)
-                        break
-            objects = filtered_objects
+        if sparse:
+            relations_lookup = build_relation_list_lookup(objects) if 'relation_lists' in includes else None
+            files_lookup = build_files_lookup([obj.id for obj in objects]) if 'files' in includes else None
+            if field_keys is not None:
+                data_by_object = load_sparse_object_data(objects, field_keys)
+            else:
+                data_by_object = {obj.id: obj.data for obj in objects}
+            items = [
+                build_sparse_object_payload(
+                    obj, field_keys, includes, data_by_object[obj.id], relations_lookup, files_lookup
+                )
+                for obj in objects
+            ]
+            return build_object_list_response(items, page_meta, facets)
+
+        # Batch-resolve files and relation-list relations for the returned rows only
+        files_lookup = build_files_lookup([obj.id for obj in objects])
+        relations_lookup = build_relation_list_lookup(objects)
 
         def to_minimal_payload(obj):
             data = obj.to_dict(include_data=True).get('data', {})
@@ -1116,45 +2190,191 @@ def list_objects():
                     if key.lower() in minimal_fields
                 }
             }
-            return enrich_object_with_file_metadata(payload, obj, relations_lookup)
-
-        if page and per_page:
-            total = len(objects)
-            total_pages = max((total + per_page - 1) // per_page, 1)
-            page = min(max(page, 1), total_pages)
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-            page_objects = objects[start_index:end_index]
+            return enrich_object_with_file_metadata(payload, obj, relations_lookup, files_lookup)
 
-            items = [to_minimal_payload(obj) for obj in page_objects] if minimal else [
-                enrich_object_with_file_metadata(obj.to_dict(include_data=True), obj, relations_lookup)
-                for obj in page_objects
-            ]
-            return jsonify({
-                'items': items,
-                'page': page,
-                'per_page': per_page,
-                'total': total,
-                'total_pages': total_pages
-            }), 200
-
-        if minimal:
-            return jsonify([to_minimal_payload(obj) for obj in objects]), 200
-
-        return jsonify([
-            enrich_object_with_file_metadata(obj.to_dict(include_data=True), obj, relations_lookup)
+        items = [to_minimal_payload(obj) for obj in objects] if minimal else [
+            enrich_object_with_file_metadata(obj.to_dict(include_data=True), obj, relations_lookup, files_lookup)
             for obj in objects
-        ]), 200
+        ]
+        return build_object_list_response(items, page_meta, facets)
     except Exception as e:
         logger.error(f"Error listing objects: {str(e)}")
         return jsonify({'error': 'Failed to list objects'}), 500
 
 
+def resolve_object_export_columns(object_type):
+    """Return export column names in the type's configured list-view order."""
+    from routes.view_config import build_list_view_columns
+
+    config = ViewConfiguration.query.filter_by(object_type_id=object_type.id).first()
+    columns = build_list_view_columns(object_type, config)
+    hidden = {
+        column.get('field_name')
+        for column in columns['visible_columns']
+        if column.get('visible') is False
+    }
+    ordered = list(columns['column_order'])
+    # Visible columns missing from a stale column_order are appended, as in the table.
+    ordered += [column.get('field_name') for column in columns['visible_columns'] if column.get('field_name') not in ordered]
+
+    result = ['id']
+    for name in ordered:
+        if name and name not in hidden and name not in OBJECT_EXPORT_SKIPPED_COLUMNS and name not in result:
+            result.append(name)
+    return result
+
+
+def get_object_export_value(obj, data, column):
+    if column == 'id':
+        return obj.id
+    if column == 'id_full':
+        return obj.normalized_full_id()
+    if column == 'object_type':
+        return obj.object_type.name if obj.object_type else None
+    if column in ('base_id', 'main_id'):
+        return obj.normalized_base_id()
+    if column == 'version':
+        return obj.normalized_version()
+    if column in ('created_at', 'updated_at'):
+        value = getattr(obj, column)
+        return value.isoformat() if value else None
+    if column in ('status', 'created_by'):
+        return getattr(obj, column)
+    return data.get(column)
+
+
+def format_csv_export_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+@bp.route('/export', methods=['GET'])
+def export_objects():
+    """Stream all objects of a type as NDJSON (default) or CSV.
+
+    Accepts the same search, filter[<field>] and sort arguments as the list.
+
+    Rows are read in batches through a server-side cursor (yield_per) and
+    written as they are produced, so memory stays flat regardless of how many
+    objects the type has. Columns follow the type's list-view configuration.
+
+    All rows come from one statement, read through a session of its own that
+    lives until the response is closed. Its first batch is read before the
+    response starts, so early failures are a 500. A failure after that cannot change the status any more: NDJSON ends
+    with an {"error": ...} line and the connection is aborted, so a truncated
+    file never looks complete.
+    """
+    export_session = None
+    try:
+        object_type_name = str(request.args.get('type') or '').strip()
+        export_format = str(request.args.get('format') or 'ndjson').strip().lower()
+        if not object_type_name:
+            return jsonify({'error': 'type is required'}), 400
+        if export_format not in ('ndjson', 'csv'):
+            return jsonify({'error': 'format must be ndjson or csv'}), 400
+
+        object_type = ObjectType.query.filter_by(name=object_type_name).first()
+        if not object_type:
+            return jsonify({'error': 'Object type not found'}), 404
+
+        columns = resolve_object_export_columns(object_type)
+        try:
+            query = build_object_list_query(
+                object_type_name=object_type.name,
+                search=request.args.get('search'),
+                filters=parse_object_list_filter_args(),
+                sort=request.args.get('sort')
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # The request's session is closed when the view returns, before the
+        # body is sent; the export's result has to outlive it.
+        export_session = Session(db.engine)
+        rows = (
+            [get_object_export_value(obj, obj.data, column) for column in columns]
+            for obj in query.with_session(export_session).yield_per(OBJECT_EXPORT_BATCH_SIZE)
+        )
+        first_rows = list(itertools.islice(rows, OBJECT_EXPORT_BATCH_SIZE))
+    except Exception as e:
+        if export_session is not None:
+            export_session.close()
+        logger.error(f"Error preparing object export: {str(e)}")
+        return jsonify({'error': 'Failed to export objects'}), 500
+
+    def iter_rows():
+        yield from first_rows
+        yield from rows
+
+    def generate_ndjson():
+        try:
+            for row in iter_rows():
+                yield json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) + '\n'
+        except Exception as e:
+            # Headers are already sent; mark the file as incomplete and abort the connection.
+            logger.error(f"Error streaming object export: {str(e)}")
+            yield json.dumps({'error': 'Export failed; the file is incomplete'}) + '\n'
+            raise
+
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush():
+            content = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return content
+
+        try:
+            writer.writerow(columns)
+            yield flush()
+            for row in iter_rows():
+                writer.writerow([format_csv_export_value(value) for value in row])
+                yield flush()
+        except Exception as e:
+            # Headers are already sent and CSV has no error row; abort the connection.
+            logger.error(f"Error streaming object export: {str(e)}")
+            raise
+
+    filename = f"{re.sub(r'[^A-Za-z0-9_-]+', '_', object_type.name) or 'objects'}_export.{export_format}"
+    if export_format == 'csv':
+        body, mimetype = generate_csv(), 'text/csv'
+    else:
+        body, mimetype = generate_ndjson(), 'application/x-ndjson'
+    response = Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+    response.call_on_close(export_session.close)
+    return response
+
+
 @bp.route('/<int:id>', methods=['GET'])
 def get_object(id):
     """Get a specific object with all data and relations"""
     try:
         obj = Object.query.get_or_404(id)
+
+        try:
+            field_keys, includes = parse_sparse_fieldset_args(OBJECT_DETAIL_INCLUDES)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if includes is not None:
+            if field_keys is not None:
+                data = load_sparse_object_data([obj], field_keys)[obj.id]
+            else:
+                data = obj.data
+            result = build_sparse_object_payload(obj, field_keys, includes, data)
+            if 'relations' in includes:
+                result['relations'] = load_object_relations_payload(obj)
+            if 'documents' in includes:
+                result['documents'] = [doc.to_dict() for doc in obj.documents]
+            return jsonify(result), 200
         
         # Try to serialize the object with detailed error handling
         try:
@@ -1230,7 +2450,7 @@ def create_object():
             return jsonify({'error': 'Validation failed', 'details': connection_errors}), 400
         
         # Validate object data against fields
-        is_valid, errors = validate_object_data(object_type.fields, object_data, {})
+        is_valid, errors = validate_object_data(get_object_type_fields(object_type), object_data, {})
         if not is_valid:
             return jsonify({'error': 'Validation failed', 'details': errors}), 400
         
@@ -1240,6 +2460,7 @@ def create_object():
             main_id = requested_main_id
             requested_version = data.get('version')
             version = normalize_version(requested_version) if requested_version else get_next_version_for_base_id(main_id)
+            observe_base_id(main_id)
         else:
             main_id = generate_base_id(object_type.name)
             version = normalize_version(data.get('version') or 'v1')
@@ -1345,7 +2566,7 @@ def update_object(id):
                     pending_required_overrides[field_id] = bool(override_value)
 
         # Validate object data against fields and pending overrides
-        is_valid, errors = validate_object_data(obj.object_type.fields, object_data, pending_required_overrides)
+        is_valid, errors = validate_object_data(get_object_type_fields(obj.object_type), object_data, pending_required_overrides)
         if not is_valid:
             return jsonify({'error': 'Validation failed', 'details': errors}), 400
         
@@ -1476,7 +2697,7 @@ def update_object_field_overrides(id):
         db.session.flush()
 
         required_overrides = get_required_overrides_map(obj.id)
-        is_valid, errors = validate_object_data(obj.object_type.fields, obj.data or {}, required_overrides)
+        is_valid, errors = validate_object_data(get_object_type_fields(obj.object_type), obj.data or {}, required_overrides)
         if not is_valid:
             db.session.rollback()
             return jsonify({'error': 'Override validation failed', 'details': errors}), 400
@@ -1506,7 +2727,7 @@ def duplicate_object(id):
             return jsonify({'error': 'Validation failed', 'details': connection_errors}), 400
 
         source_required_overrides = get_required_overrides_map(source.id)
-        is_valid, errors = validate_object_data(object_type.fields, object_data, source_required_overrides)
+        is_valid, errors = validate_object_data(get_object_type_fields(object_type), object_data, source_required_overrides)
         if not is_valid:
             return jsonify({'error': 'Validation failed', 'details': errors}), 400
 
@@ -1540,6 +2761,7 @@ def duplicate_object(id):
         if requested_main_id:
             main_id = requested_main_id
             version = normalize_version(requested_version) if requested_version else get_next_version_for_base_id(main_id)
+            observe_base_id(main_id)
         else:
             main_id = generate_base_id(object_type.name)
             version = normalize_version(requested_version or 'v1')
@@ -1643,6 +2865,102 @@ def duplicate_object(id):
         return jsonify({'error': 'Failed to duplicate object', 'details': str(e)}), 500
 
 
+@bp.route('/summaries', methods=['GET'])
+def list_object_summaries():
+    """Return object summaries (display name, short texts, file and relation counts).
+
+    Query params: type=<object type name>, ids=1,2,3 and optional page/per_page.
+    Summaries are computed for the returned objects only (see utils/object_summaries.py).
+    """
+    try:
+        object_type_name = request.args.get('type')
+        raw_ids = request.args.get('ids', '')
+        page = request.args.get('page', type=int)
+        per_page = request.args.get('per_page', type=int)
+
+        query = Object.query.options(object_data_loader(), selectinload(Object.object_type))
+        if object_type_name:
+            object_type = ObjectType.query.filter_by(name=object_type_name).first()
+            if not object_type:
+                return jsonify({'error': f'Object type {object_type_name} not found'}), 404
+            query = query.filter(Object.object_type_id == object_type.id)
+        if raw_ids:
+            object_ids = [int(x) for x in raw_ids.split(',') if x.strip().isdigit()]
+            query = query.filter(Object.id.in_(object_ids))
+        query = query.order_by(Object.id.asc())
+
+        if page and per_page:
+            per_page = max(per_page, 1)
+            total = query.order_by(None).count()
+            total_pages = max((total + per_page - 1) // per_page, 1)
+            page = min(max(page, 1), total_pages)
+            objects = query.limit(per_page).offset((page - 1) * per_page).all()
+            return jsonify({
+                'items': build_object_summaries(objects),
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'total_pages': total_pages
+            }), 200
+
+        return jsonify(build_object_summaries(query.all())), 200
+    except Exception as e:
+        logger.error(f"Error listing object summaries: {str(e)}")
+        return jsonify({'error': 'Failed to list object summaries'}), 500
+
+
+@bp.route('/suggest', methods=['GET'])
+def suggest_objects():
+    """Typeahead for object pickers.
+
+    Query params: q, types=<type name>,<type name> and limit (default 20, max 50).
+    Matches id_full, main_id and the name field by prefix, then by substring,
+    and returns only what a picker row shows.
+    """
+    try:
+        query_string = request.args.get('q', '').strip()
+        limit = min(max(request.args.get('limit', OBJECT_SUGGEST_LIMIT, type=int), 1), OBJECT_SUGGEST_MAX_LIMIT)
+        type_names = [name.strip() for name in request.args.get('types', '').split(',') if name.strip()]
+        if not query_string:
+            return jsonify([]), 200
+
+        object_type_ids = None
+        if type_names:
+            object_type_ids = [
+                type_id for (type_id,) in
+                db.session.query(ObjectType.id).filter(ObjectType.name.in_(type_names)).all()
+            ]
+            if not object_type_ids:
+                return jsonify([]), 200
+
+        object_ids = suggest_object_ids(query_string, object_type_ids, limit)
+        if not object_ids:
+            return jsonify([]), 200
+
+        objects = Object.query.options(
+            object_data_loader(), selectinload(Object.object_type)
+        ).filter(Object.id.in_(object_ids)).all()
+        objects_by_id = {obj.id: obj for obj in objects}
+        view_config = load_tree_view_config({obj.object_type_id for obj in objects})
+
+        suggestions = []
+        for object_id in object_ids:
+            obj = objects_by_id.get(object_id)
+            if obj is None or not obj.object_type:
+                continue
+            type_name = obj.object_type.name
+            suggestions.append({
+                'id': object_id,
+                'id_full': obj.id_full,
+                'name': get_display_name(obj, type_name, view_config) or obj.id_full,
+                'object_type': {'id': obj.object_type.id, 'name': type_name}
+            })
+        return jsonify(suggestions), 200
+    except Exception as e:
+        logger.error(f"Error suggesting objects: {str(e)}")
+        return jsonify({'error': 'Failed to suggest objects'}), 500
+
+
 @bp.route('/files-batch', methods=['GET'])
 def files_batch():
     """Return files for a batch of object IDs.
@@ -1655,13 +2973,14 @@ def files_batch():
         if not object_ids:
             return jsonify({}), 200
 
-        objects = Object.query.filter(Object.id.in_(object_ids)).all()
-        relations_lookup = build_relations_lookup([o.id for o in objects])
+        existing_ids = [
+            object_id for (object_id,) in db.session.query(Object.id).filter(Object.id.in_(object_ids)).all()
+        ]
+        files_lookup = build_files_lookup(existing_ids)
 
         result = {}
-        for obj in objects:
-            raw_files = collect_tree_files_for_object(obj, relations_lookup)
-            result[str(obj.id)] = [
+        for object_id, raw_files in files_lookup.items():
+            result[str(object_id)] = [
                 {
                     'id': f['id'],
                     'filename': f.get('original_filename') or f.get('filename') or '',
@@ -1701,45 +3020,188 @@ def delete_object(id):
         return jsonify({'error': 'Failed to delete object'}), 500
 
 
+TREE_VIEWS = ('byggdelar', 'utrymmen', 'system')
+
+
+def build_object_tree(tree_view, depth=None, node_id=None, tree_options=None, tree_budget=None):
+    """
+    Build the object tree for a view, or the subtree below node_id.
+
+    node_id is an object id, a type group id (group-<object id>-<type>) or a
+    category group id. Returns the list of nodes, or None if node_id does not
+    exist in the view. Lists that do not fit tree_budget end in a truncated
+    marker.
+    """
+    view_config = load_tree_view_config()
+
+    object_types = ObjectType.query.all()
+    root_type_ids = [
+        object_type.id
+        for object_type in object_types
+        if matches_tree_view_type(object_type.name, tree_view)
+    ]
+
+    group_match = re.fullmatch(r'group-(\d+)-(.+)', node_id or '')
+    if group_match or (node_id or '').isdigit():
+        node_object = Object.query.options(object_data_loader()).filter_by(
+            id=int(group_match.group(1) if group_match else node_id)
+        ).first()
+        if not node_object:
+            return None
+        if tree_view != 'system' and node_object.object_type_id not in root_type_ids:
+            # Only roots have children in the relation views.
+            return None if group_match else []
+
+        # Build the object as a root with enough levels for the requested
+        # subtree; for a type group only that group is built.
+        build_root = prepare_tree_root_builder(
+            [node_object],
+            view_config,
+            tree_view=tree_view,
+            depth=None if depth is None else depth + (2 if group_match else 1),
+            tree_options=tree_options,
+            tree_budget=tree_budget
+        )
+        root_node = build_root(node_object, only_type_name=group_match.group(2) if group_match else None)
+        if not group_match:
+            return root_node['children']
+        group = next((child for child in root_node['children'] if child['id'] == node_id), None)
+        return group['children'] if group else None
+
+    if not root_type_ids:
+        return None if node_id else []
+
+    root_objects = Object.query.options(object_data_loader()).filter(Object.object_type_id.in_(root_type_ids)).all()
+    if not root_objects:
+        return None if node_id else []
+
+    if tree_view == 'system':
+        if node_id:
+            return None
+        # For system view, system objects themselves should be top-level nodes.
+        return build_tree_root_nodes(
+            root_objects, view_config, tree_view=tree_view, depth=depth, tree_options=tree_options, tree_budget=tree_budget
+        )
+
+    return build_category_group_tree(
+        root_objects, tree_view, view_config, depth=depth, tree_options=tree_options, node_id=node_id, tree_budget=tree_budget
+    )
+
+
+def serve_cached_tree(endpoint, tree_view, build_nodes, tree_options=None, tree_budget=None):
+    """
+    Respond with a tree from the tree cache, building it on a miss.
+
+    The ETag is derived from the query and the data/schema versions, so a
+    matching If-None-Match is answered with 304 before anything is built.
+    A freshly built tree is streamed (see utils/json_stream.py) and stored in
+    the cache once it has been sent in full, if its body stayed within
+    TREE_CACHE_STREAM_MAX_BYTES; larger bodies are not held a second time
+    while they are sent. A tree cut off by the time budget
+    depends on load, not on the data, so it is neither cached nor given an ETag.
+    """
+    cache_key = build_tree_cache_key(endpoint, request.args)
+    versions = get_tree_versions()
+    etag = build_tree_etag(cache_key, versions)
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        body = get_cached_tree(cache_key, versions)
+        if body is None:
+            nodes = build_nodes()
+            if nodes is None:
+                return jsonify({'error': 'Tree node not found'}), 404
+            if tree_options is not None:
+                resolve_tree_has_children(tree_options, tree_view)
+            if tree_budget is not None and tree_budget.truncated_lists:
+                logger.warning(
+                    f"Tree {endpoint} ({tree_view}) truncated {tree_budget.truncated_lists} lists "
+                    f"({'time' if tree_budget.timed_out else 'node'} budget)"
+                )
+            if tree_budget is not None and tree_budget.timed_out:
+                response = stream_json_response(nodes)
+                response.headers['Cache-Control'] = 'no-store'
+                return response
+            response = stream_json_response(
+                nodes,
+                on_complete=lambda body: store_cached_tree(cache_key, versions, body),
+                collect_limit=get_tree_cache_stream_max_bytes()
+            )
+        else:
+            response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
 @bp.route('/tree', methods=['GET'])
 def get_tree():
-    """Get hierarchical tree structure of objects, grouped by selected tree view mode."""
+    """
+    Get hierarchical tree structure of objects, grouped by selected tree view mode.
+
+    Optional ?depth= limits the returned levels, ?node= returns the subtree
+    below one node and ?fields= limits the object node payload. With any of
+    them every node carries has_children, so clients can expand on demand.
+
+    The response is bounded by TREE_MAX_NODES and TREE_MAX_SECONDS: child
+    lists that do not fit end in a node of type 'truncated' with child_count
+    and a continuation token for /tree/children.
+    """
     try:
         tree_view = (request.args.get('view') or 'byggdelar').strip().lower()
-        valid_views = {'byggdelar', 'utrymmen', 'system'}
-        if tree_view not in valid_views:
+        if tree_view not in TREE_VIEWS:
             return jsonify({'error': 'Invalid view. Allowed values: byggdelar, utrymmen, system'}), 400
+        try:
+            depth, node_id, fields = parse_tree_expansion_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        tree_options = None
+        if depth is not None or node_id is not None or fields is not None:
+            tree_options = {'fields': fields, 'pending_has_children': []}
+
+        tree_budget = create_tree_budget()
+        return serve_cached_tree('tree', tree_view, lambda: build_object_tree(
+            tree_view, depth=depth, node_id=node_id, tree_options=tree_options, tree_budget=tree_budget
+        ), tree_options, tree_budget)
+    except Exception as e:
+        logger.error(f"Error getting tree: {str(e)}")
+        return jsonify({'error': 'Failed to get tree'}), 500
 
-        # Get all view configurations
-        view_configs_query = ViewConfiguration.query.all()
-        view_config = {}
-        for config in view_configs_query:
-            if config.object_type:
-                view_config[config.object_type.name] = {
-                    'tree_view_name_field': config.tree_view_name_field
-                }
-
-        object_types = ObjectType.query.all()
-        root_type_ids = [
-            object_type.id
-            for object_type in object_types
-            if matches_tree_view_type(object_type.name, tree_view)
-        ]
-
-        if not root_type_ids:
-            return jsonify([]), 200
 
-        root_objects = Object.query.filter(Object.object_type_id.in_(root_type_ids)).all()
-        if not root_objects:
-            return jsonify([]), 200
+@bp.route('/tree/children', methods=['GET'])
+def get_tree_children():
+    """
+    Get the next level below ?node= in a tree view, for expanding a branch on demand.
 
-        if tree_view == 'system':
-            # For system view, system objects themselves should be top-level nodes.
-            return jsonify(build_tree_root_nodes(root_objects, view_config, tree_view=tree_view)), 200
-            relations_lookup = build_relations_lookup([obj.id for obj in root_objects])
-            return jsonify(build_tree_root_nodes(root_objects, view_config, relations_lookup=relations_lookup)), 200
+    With ?continuation= (from a truncated node) the cut-off list is resumed
+    instead; the token carries the view, the node and the offset.
+    """
+    try:
+        tree_view = (request.args.get('view') or 'byggdelar').strip().lower()
+        if tree_view not in TREE_VIEWS:
+            return jsonify({'error': 'Invalid view. Allowed values: byggdelar, utrymmen, system'}), 400
+        try:
+            _, node_id, fields = parse_tree_expansion_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-        return jsonify(build_category_group_tree(root_objects, tree_view, view_config)), 200
+        continuation = None
+        token = str(request.args.get('continuation') or '').strip()
+        if token:
+            try:
+                tree_view, node_id, offset = decode_tree_continuation(token)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            continuation = (node_id, offset)
+        elif node_id is None:
+            return jsonify({'error': 'node is required'}), 400
+
+        tree_options = {'fields': fields, 'pending_has_children': []}
+        tree_budget = create_tree_budget(continuation)
+        return serve_cached_tree('tree_children', tree_view, lambda: build_object_tree(
+            tree_view, depth=1, node_id=node_id, tree_options=tree_options, tree_budget=tree_budget
+        ), tree_options, tree_budget)
     except Exception as e:
-        logger.error(f"Error getting tree: {str(e)}")
-        return jsonify({'error': 'Failed to get tree'}), 500
+        logger.error(f"Error getting tree children: {str(e)}")
+        return jsonify({'error': 'Failed to get tree children'}), 500
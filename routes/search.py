@@ -1,6 +1,14 @@
 from flask import Blueprint, request, jsonify
 from models import db, Object, ObjectType, ObjectData
-from sqlalchemy import or_
+from models.object import object_data_loader
+from utils.search_index import build_search_match_query, get_search_field_ids
+from utils.object_facets import parse_facet_args, build_object_facets
+from routes.objects import build_object_list_response
+from utils.memory_search_index import (
+    get_memory_search_index_stats,
+    is_memory_search_index_enabled,
+    rebuild_memory_search_index
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,63 +17,92 @@ bp = Blueprint('search', __name__, url_prefix='/api')
 
 @bp.route('/search', methods=['GET'])
 def search():
-    """Search across all objects"""
+    """Search across all objects.
+
+    Matches id_full, main_id and text field values (restricted to one field
+    with ``field=``) through the full-text index, best matches first.
+    Optional page/per_page return a paginated envelope like the object list;
+    ``facets=true`` (or a list of facet keys) adds counts over all matches.
+    """
     try:
         # Get search parameters
         query_string = request.args.get('q', '').strip()
         object_type_name = request.args.get('type')
         field_name = request.args.get('field')
+        page = request.args.get('page', type=int)
+        per_page = request.args.get('per_page', type=int)
         
         if not query_string:
             return jsonify([]), 200
+
+        try:
+            facet_keys, facet_limit = parse_facet_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # Build base query
-        query = Object.query
-        
-        # Filter by object type if specified
+        object_type_id = None
         if object_type_name:
-            query = query.join(ObjectType).filter(ObjectType.name == object_type_name)
-        
-        # Get all objects
-        objects = query.all()
-        
-        # Filter by search term
-        results = []
-        query_lower = query_string.lower()
-        
-        for obj in objects:
-            if query_lower in str(obj.id_full or '').lower():
-                results.append(obj)
-                continue
-            if query_lower in str(obj.main_id or '').lower():
-                results.append(obj)
-                continue
-            
-            # Check object data
-            for od in obj.object_data:
-                # If field is specified, only search in that field
-                if field_name and od.field and od.field.field_name != field_name:
-                    continue
-                
-                # Search in text values
-                if od.value_text and query_lower in od.value_text.lower():
-                    results.append(obj)
-                    break
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_results = []
-        for obj in results:
-            if obj.id not in seen:
-                seen.add(obj.id)
-                unique_results.append(obj)
-        
-        return jsonify([obj.to_dict(include_data=True) for obj in unique_results]), 200
+            object_type = ObjectType.query.filter_by(name=object_type_name).first()
+            if not object_type:
+                return jsonify([]), 200
+            object_type_id = object_type.id
+
+        field_ids = get_search_field_ids(field_name) if field_name else None
+        matches = build_search_match_query(query_string, object_type_id, field_ids).subquery()
+        query = Object.query.join(matches, Object.id == matches.c.object_id).order_by(
+            matches.c.rank.asc(), Object.id.asc()
+        )
+
+        facets = None
+        if facet_keys is not None:
+            facets = build_object_facets(
+                db.select(matches.c.object_id), facet_keys, facet_limit, object_type_id=object_type_id
+            )
+
+        page_meta = None
+        if page and per_page:
+            per_page = max(per_page, 1)
+            total = query.order_by(None).count()
+            total_pages = max((total + per_page - 1) // per_page, 1)
+            page = min(max(page, 1), total_pages)
+            query = query.limit(per_page).offset((page - 1) * per_page)
+            page_meta = {
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'total_pages': total_pages
+            }
+
+        items = [obj.to_dict(include_data=True) for obj in query.options(object_data_loader()).all()]
+        return build_object_list_response(items, page_meta, facets)
     except Exception as e:
         logger.error(f"Error searching: {str(e)}")
         return jsonify({'error': 'Search failed'}), 500
 
 
+@bp.route('/search/index', methods=['GET'])
+def search_index_status():
+    """Report the in-process search index: size, memory footprint and last rebuild time."""
+    try:
+        return jsonify(get_memory_search_index_stats()), 200
+    except Exception as e:
+        logger.error(f"Error reading search index status: {str(e)}")
+        return jsonify({'error': 'Failed to read search index status'}), 500
+
+
+@bp.route('/search/index/rebuild', methods=['POST'])
+def rebuild_search_index_route():
+    """Rebuild the in-process search index of this worker from the search documents."""
+    try:
+        if not is_memory_search_index_enabled():
+            return jsonify({'error': 'In-process search index is not enabled'}), 400
+        rebuild_memory_search_index()
+        return jsonify(get_memory_search_index_stats()), 200
+    except Exception as e:
+        logger.error(f"Error rebuilding search index: {str(e)}")
+        return jsonify({'error': 'Failed to rebuild search index'}), 500
+
+
 @bp.route('/stats', methods=['GET'])
 def stats():
     """Get statistics about objects"""
@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify
 from models import db, Object, ObjectType
+from models.object import object_data_loader
 from sqlalchemy import func
 
 stats_bp = Blueprint('stats', __name__)
@@ -45,7 +46,7 @@ def get_stats():
             objects_by_type[name] = count
         
         # Recent objects
-        recent_objects = Object.query.order_by(Object.created_at.desc()).limit(10).all()
+        recent_objects = Object.query.options(object_data_loader()).order_by(Object.created_at.desc()).limit(10).all()
         
         return jsonify({
             'total_objects': total_objects,
@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from models import db, ViewConfiguration, ObjectType, ObjectField
+from utils.schema_cache import get_schema
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +11,21 @@ DEFAULT_DISPLAY_ORDER = 999
 DEFAULT_COLUMNS = ['id_full', 'object_type', 'created_at']  # Default columns for list view
 
 
+def _get_object_types():
+    """All object types with fields, served from the schema cache when available."""
+    schema = get_schema()
+    if schema is not None:
+        return list(schema.types_by_id.values())
+    return ObjectType.query.all()
+
+
+def _get_object_type(object_type_id):
+    schema = get_schema()
+    if schema is not None and object_type_id in schema.types_by_id:
+        return schema.types_by_id[object_type_id]
+    return ObjectType.query.get(object_type_id)
+
+
 def _normalize_identifier_field_name(field_name):
     return 'id_full' if field_name == 'auto_id' else field_name
 
@@ -33,6 +49,51 @@ def _normalize_column_order(column_order):
     return [_normalize_identifier_field_name(name) for name in column_order]
 
 
+def build_list_view_columns(object_type, config):
+    """Resolve available fields, visible columns and column order for one type's list view."""
+    # Expose all fields as selectable columns, but keep the table visibility flag
+    # as the source for default visible columns.
+    available_fields = [
+        {
+            'field_name': field.field_name,
+            'display_name': field.display_name or field.field_name,
+            'field_type': field.field_type,
+            'is_table_visible': field.is_table_visible,
+            'is_tree_visible': bool(field.is_tree_visible),
+            'field_options': field.field_options
+        }
+        for field in sorted(object_type.fields, key=lambda f: f.display_order or DEFAULT_DISPLAY_ORDER)
+    ]
+    default_table_fields = [field for field in available_fields if field.get('is_table_visible')]
+
+    # Build default visible columns if not configured
+    visible_columns = config.visible_columns if config and config.visible_columns else None
+    visible_columns = _normalize_visible_columns(visible_columns)
+    if not visible_columns:
+        # Default: show ID, first 3 metadata fields, and created_at
+        visible_columns = []
+        visible_columns.append({'field_name': 'id_full', 'visible': True, 'width': 120})
+        for field in default_table_fields[:3]:
+            visible_columns.append({
+                'field_name': field['field_name'],
+                'visible': True,
+                'width': 150
+            })
+        visible_columns.append({'field_name': 'created_at', 'visible': True, 'width': 150})
+
+    column_order = config.column_order if config and config.column_order else None
+    column_order = _normalize_column_order(column_order)
+    if not column_order:
+        # Default order: ID, metadata fields, created_at
+        column_order = ['id_full'] + [f['field_name'] for f in default_table_fields[:3]] + ['created_at']
+
+    return {
+        'available_fields': available_fields,
+        'visible_columns': visible_columns,
+        'column_order': column_order
+    }
+
+
 @bp.route('/tree-display', methods=['GET'])
 def get_tree_display_config():
     """Get tree display configuration for all object types"""
@@ -40,7 +101,7 @@ def get_tree_display_config():
         configs = ViewConfiguration.query.all()
         
         # Get all object types
-        object_types = ObjectType.query.all()
+        object_types = _get_object_types()
         
         # Build response with all object types and their configs
         result = {}
@@ -136,56 +197,21 @@ def get_list_view_config():
         configs = ViewConfiguration.query.all()
         
         # Get all object types
-        object_types = ObjectType.query.all()
+        object_types = _get_object_types()
         
         # Build response with all object types and their configs
         result = {}
         for obj_type in object_types:
             config = next((c for c in configs if c.object_type_id == obj_type.id), None)
-            
-            # Expose all fields as selectable columns, but keep the table visibility flag
-            # as the source for default visible columns.
-            available_fields = [
-                {
-                    'field_name': field.field_name,
-                    'display_name': field.display_name or field.field_name,
-                    'field_type': field.field_type,
-                    'is_table_visible': field.is_table_visible,
-                    'is_tree_visible': bool(field.is_tree_visible),
-                    'field_options': field.field_options
-                }
-                for field in sorted(obj_type.fields, key=lambda f: f.display_order or DEFAULT_DISPLAY_ORDER)
-            ]
-            default_table_fields = [field for field in available_fields if field.get('is_table_visible')]
-            
-            # Build default visible columns if not configured
-            visible_columns = config.visible_columns if config and config.visible_columns else None
-            visible_columns = _normalize_visible_columns(visible_columns)
-            if not visible_columns:
-                # Default: show ID, first 3 metadata fields, and created_at
-                visible_columns = []
-                visible_columns.append({'field_name': 'id_full', 'visible': True, 'width': 120})
-                for i, field in enumerate(default_table_fields[:3]):
-                    visible_columns.append({
-                        'field_name': field['field_name'],
-                        'visible': True,
-                        'width': 150
-                    })
-                visible_columns.append({'field_name': 'created_at', 'visible': True, 'width': 150})
-            
-            column_order = config.column_order if config and config.column_order else None
-            column_order = _normalize_column_order(column_order)
-            if not column_order:
-                # Default order: ID, metadata fields, created_at
-                column_order = ['id_full'] + [f['field_name'] for f in default_table_fields[:3]] + ['created_at']
+            columns = build_list_view_columns(obj_type, config)
             
             result[obj_type.name] = {
                 'object_type_id': obj_type.id,
                 'object_type_name': obj_type.name,
-                'visible_columns': visible_columns,
-                'column_order': column_order,
+                'visible_columns': columns['visible_columns'],
+                'column_order': columns['column_order'],
                 'column_widths': config.column_widths if config and config.column_widths else {},
-                'available_fields': available_fields
+                'available_fields': columns['available_fields']
             }
         
         return jsonify(result), 200
@@ -264,53 +290,20 @@ def get_list_view_config_by_type(object_type_id):
     """Get list view configuration for a specific object type"""
     try:
         # Check if object type exists
-        object_type = ObjectType.query.get(object_type_id)
+        object_type = _get_object_type(object_type_id)
         if not object_type:
             return jsonify({'error': 'Object type not found'}), 404
         
         config = ViewConfiguration.query.filter_by(object_type_id=object_type_id).first()
-        
-        # Expose all fields as selectable columns, but keep the table visibility flag
-        # as the source for default visible columns.
-        available_fields = [
-                {
-                    'field_name': field.field_name,
-                    'display_name': field.display_name or field.field_name,
-                    'field_type': field.field_type,
-                    'is_table_visible': field.is_table_visible,
-                    'is_tree_visible': bool(field.is_tree_visible),
-                    'field_options': field.field_options
-                }
-            for field in sorted(object_type.fields, key=lambda f: f.display_order or DEFAULT_DISPLAY_ORDER)
-        ]
-        default_table_fields = [field for field in available_fields if field.get('is_table_visible')]
-        
-        # Build default visible columns if not configured
-        visible_columns = config.visible_columns if config and config.visible_columns else None
-        visible_columns = _normalize_visible_columns(visible_columns)
-        if not visible_columns:
-            visible_columns = []
-            visible_columns.append({'field_name': 'id_full', 'visible': True, 'width': 120})
-            for i, field in enumerate(default_table_fields[:3]):
-                visible_columns.append({
-                    'field_name': field['field_name'],
-                    'visible': True,
-                    'width': 150
-                })
-            visible_columns.append({'field_name': 'created_at', 'visible': True, 'width': 150})
-        
-        column_order = config.column_order if config and config.column_order else None
-        column_order = _normalize_column_order(column_order)
-        if not column_order:
-            column_order = ['id_full'] + [f['field_name'] for f in default_table_fields[:3]] + ['created_at']
+        columns = build_list_view_columns(object_type, config)
         
         result = {
             'object_type_id': object_type.id,
             'object_type_name': object_type.name,
-            'visible_columns': visible_columns,
-            'column_order': column_order,
+            'visible_columns': columns['visible_columns'],
+            'column_order': columns['column_order'],
             'column_widths': config.column_widths if config and config.column_widths else {},
-            'available_fields': available_fields
+            'available_fields': columns['available_fields']
         }
         
         return jsonify(result), 200
@@ -0,0 +1,21 @@
+"""Rebuild the category_node_closure table from category_nodes.parent_id."""
+
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app import app
+from utils.category_closure import rebuild_category_node_closure
+
+
+def rebuild():
+    with app.app_context():
+        return rebuild_category_node_closure()
+
+
+if __name__ == '__main__':
+    written = rebuild()
+    print(f'Rebuilt {written} category node closure rows')
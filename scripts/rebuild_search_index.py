@@ -0,0 +1,23 @@
+"""Rebuild the full-text search documents for all objects."""
+
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app import app
+from utils.search_index import rebuild_search_index
+
+
+def rebuild(only_missing=False):
+    with app.app_context():
+        return rebuild_search_index(only_missing=only_missing)
+
+
+if __name__ == '__main__':
+    only_missing = '--missing' in sys.argv[1:]
+    written = rebuild(only_missing=only_missing)
+    scope = 'missing objects' if only_missing else 'all objects'
+    print(f'Indexed {written} search documents ({scope})')
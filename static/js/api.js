@@ -138,12 +138,57 @@ const ObjectsAPI = {
         if (filters.search) params.append('search', filters.search);
         if (filters.page) params.append('page', filters.page);
         if (filters.per_page) params.append('per_page', filters.per_page);
+        // Keyset paging: pass '' for the first page, then the returned next_cursor.
+        if (typeof filters.cursor === 'string') params.append('cursor', filters.cursor);
         if (filters.minimal) params.append('minimal', 'true');
+        // Sparse fieldsets: arrays of field names / enrichments ('files', 'relation_lists').
+        if (Array.isArray(filters.fields)) params.append('fields', filters.fields.join(','));
+        if (Array.isArray(filters.include)) params.append('include', filters.include.join(','));
+        // Server-side sort ('field' or '-field') and typed column filters: { field: 'op:value' }.
+        if (filters.sort) params.append('sort', filters.sort);
+        if (filters.columnFilters) {
+            Object.entries(filters.columnFilters).forEach(([field, spec]) => {
+                if (spec !== undefined && spec !== null && spec !== '') params.append(`filter[${field}]`, spec);
+            });
+        }
+        // Facet counts over the whole filtered set: true or an array of facet keys.
+        if (filters.facets) params.append('facets', Array.isArray(filters.facets) ? filters.facets.join(',') : 'true');
+        if (filters.facet_limit) params.append('facet_limit', filters.facet_limit);
 
         const query = params.toString();
         return fetchAPI(`/objects${query ? '?' + query : ''}`);
     },
-    
+
+    // Typeahead for object pickers: [{ id, id_full, name, object_type: { id, name } }].
+    suggest: (q, { types = [], limit } = {}) => {
+        const params = new URLSearchParams();
+        params.append('q', q);
+        if (types.length) params.append('types', types.join(','));
+        if (limit) params.append('limit', limit);
+        return fetchAPI(`/objects/suggest?${params.toString()}`);
+    },
+
+    // Object tree; depth/node/fields give a partial tree whose nodes carry has_children.
+    getTree: (view = 'byggdelar', { depth, node, fields = [] } = {}) => {
+        const params = new URLSearchParams();
+        params.append('view', view);
+        if (depth) params.append('depth', depth);
+        if (node) params.append('node', node);
+        if (fields.length) params.append('fields', fields.join(','));
+        return fetchAPI(`/objects/tree?${params.toString()}`);
+    },
+
+    // Next level below one tree node, for expanding a branch on demand; with
+    // continuation (from a truncated node) the rest of a cut-off list instead.
+    getTreeChildren: (view, node, { fields = [], continuation } = {}) => {
+        const params = new URLSearchParams();
+        params.append('view', view);
+        if (node) params.append('node', node);
+        if (continuation) params.append('continuation', continuation);
+        if (fields.length) params.append('fields', fields.join(','));
+        return fetchAPI(`/objects/tree/children?${params.toString()}`);
+    },
+
     create: (data) => {
         return fetchAPI('/objects', {
             method: 'POST',
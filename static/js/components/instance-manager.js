@@ -284,13 +284,12 @@ class InstanceManagerComponent {
 
     async loadObjectOptions() {
         const collected = [];
-        let page = 1;
-        let totalPages = 1;
+        let cursor = '';
 
         do {
             const response = await ObjectsAPI.getAllPaginated({
                 minimal: true,
-                page,
+                cursor,
                 per_page: 250
             });
 
@@ -301,14 +300,8 @@ class InstanceManagerComponent {
                     : [];
 
             collected.push(...items);
-
-            if (Array.isArray(response)) {
-                totalPages = 1;
-            } else {
-                totalPages = Number(response?.total_pages || 1);
-            }
-            page += 1;
-        } while (page <= totalPages);
+            cursor = Array.isArray(response) ? null : (response?.next_cursor || null);
+        } while (cursor);
 
         this.objectOptions = collected
             .filter(obj => Number(obj?.id) !== this.objectId)
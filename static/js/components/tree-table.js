@@ -3,6 +3,10 @@
  * Hierarchical table built on SystemTable.
  * Data: array of objects with nested children arrays.
  * Expand/collapse via toggle clicks. Search filters matching tree paths.
+ * With options.loadChildren(node), nodes flagged has_children but without
+ * loaded children are fetched when first expanded. Truncated markers
+ * (truncated: true) are passed to loadChildren as well; the nodes it returns
+ * replace the marker among its siblings.
  */
 class TreeTable {
     constructor(options = {}) {
@@ -16,6 +20,7 @@ class TreeTable {
         this.emptyText = options.emptyText || 'Inga rader hittades';
         this.indentPx = Number.isFinite(options.indentPx) ? options.indentPx : 16;
         this.expandedNodes = new Set();
+        this.loadingNodes = new Set();
         this.systemTable = null;
         this._options = options;
 
@@ -41,6 +46,16 @@ class TreeTable {
         return Array.isArray(node?.[this.nodeChildren]) ? node[this.nodeChildren] : [];
     }
 
+    _hasUnloadedChildren(node) {
+        return typeof this._options.loadChildren === 'function'
+            && node?.has_children === true
+            && this._getChildren(node).length === 0;
+    }
+
+    _isTruncated(node) {
+        return typeof this._options.loadChildren === 'function' && node?.truncated === true;
+    }
+
     // --- Search ---
 
     _hasActiveSearch(table) {
@@ -85,7 +100,7 @@ class TreeTable {
         if (hasSearch && !this._treeHasMatch(node, table)) return;
 
         const children = this._getChildren(node);
-        const hasChildren = children.length > 0;
+        const hasChildren = children.length > 0 || this._hasUnloadedChildren(node) || this._isTruncated(node);
         const nodeId = this._getNodeId(node);
         const isExpanded = hasSearch || (nodeId != null && this.expandedNodes.has(nodeId));
 
@@ -151,10 +166,50 @@ class TreeTable {
     // --- Expand / collapse ---
 
     toggleNode(nodeId) {
+        const node = this._findNode(this.rows, nodeId);
+        if (this._isTruncated(node)) {
+            this._loadContinuation(node, nodeId);
+            return;
+        }
         if (this.expandedNodes.has(nodeId)) {
             this.expandedNodes.delete(nodeId);
         } else {
             this.expandedNodes.add(nodeId);
+            if (node && this._hasUnloadedChildren(node)) {
+                this._loadChildren(node, nodeId);
+                return;
+            }
+        }
+        this._renderPreservingScroll();
+    }
+
+    async _loadChildren(node, nodeId) {
+        if (this.loadingNodes.has(nodeId)) return;
+        this.loadingNodes.add(nodeId);
+        try {
+            const children = await this._options.loadChildren(node);
+            node[this.nodeChildren] = Array.isArray(children) ? children : [];
+            if (!node[this.nodeChildren].length) node.has_children = false;
+        } catch (_e) {
+            this.expandedNodes.delete(nodeId);
+        } finally {
+            this.loadingNodes.delete(nodeId);
+        }
+        this._renderPreservingScroll();
+    }
+
+    async _loadContinuation(marker, nodeId) {
+        if (this.loadingNodes.has(nodeId)) return;
+        this.loadingNodes.add(nodeId);
+        try {
+            const nodes = await this._options.loadChildren(marker);
+            const siblings = this._findSiblings(this.rows, nodeId);
+            const index = siblings ? siblings.indexOf(marker) : -1;
+            if (index >= 0) siblings.splice(index, 1, ...(Array.isArray(nodes) ? nodes : []));
+        } catch (_e) {
+            // The marker stays, so the rest can be requested again.
+        } finally {
+            this.loadingNodes.delete(nodeId);
         }
         this._renderPreservingScroll();
     }
@@ -196,6 +251,15 @@ class TreeTable {
         return null;
     }
 
+    _findSiblings(nodes, targetId) {
+        if (nodes.some(node => this._getNodeId(node) === targetId)) return nodes;
+        for (const node of nodes) {
+            const found = this._findSiblings(this._getChildren(node), targetId);
+            if (found) return found;
+        }
+        return null;
+    }
+
     expandAll() {
         const addAll = (nodes) => {
             nodes.forEach(node => {
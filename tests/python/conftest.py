@@ -0,0 +1,76 @@
+"""
+Shared fixtures for the Python tests.
+
+The app runs against a copy of plm.db in a temporary directory, so the tests
+see the sample register but never write to the tracked database. The copy is
+shared by the whole session: tests create the objects and nodes they change
+and compare against state they read themselves.
+"""
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+# Config reads DATABASE_URL when it is imported, so this has to happen first.
+_database_dir = tempfile.mkdtemp(prefix='plm-tests-')
+_database_path = Path(_database_dir) / 'plm.db'
+shutil.copy(ROOT_DIR / 'plm.db', _database_path)
+os.environ['DATABASE_URL'] = f'sqlite:///{_database_path}'
+os.environ.pop('RENDER_GIT_BRANCH', None)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_database_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def app():
+    from app import app as flask_app
+
+    flask_app.config['TESTING'] = True
+    return flask_app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def app_context(app):
+    """Request context with a clean session afterwards (uncommitted writes are rolled back)."""
+    from models import db
+
+    with app.test_request_context():
+        yield
+        db.session.rollback()
+        db.session.remove()
+
+
+@pytest.fixture
+def create_object(client):
+    """POST a Product named name (plus extra data) and return the created payload."""
+
+    def create(name, **data):
+        response = client.post('/api/objects', json={
+            'object_type_id': _get_product_type_id(client),
+            'data': {'namn': name, **data}
+        })
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+
+    return create
+
+
+def _get_product_type_id(client):
+    for object_type in client.get('/api/object-types').get_json():
+        if object_type['name'] == 'Product':
+            return object_type['id']
+    raise AssertionError('Sample database has no Product type')
@@ -0,0 +1,99 @@
+import pytest
+
+from models import db, CategoryNode, CategoryNodeClosure
+from utils.category_closure import rebuild_category_node_closure
+from utils.category_utils import get_all_descendant_node_ids, get_category_breadcrumb
+
+
+def expected_closure():
+    """{(ancestor_id, descendant_id): depth} walked from category_nodes.parent_id."""
+    parents = dict(db.session.query(CategoryNode.id, CategoryNode.parent_id).all())
+    rows = {}
+    for node_id in parents:
+        ancestor_id, depth = node_id, 0
+        while ancestor_id is not None:
+            rows[(ancestor_id, node_id)] = depth
+            ancestor_id, depth = parents.get(ancestor_id), depth + 1
+    return rows
+
+
+def stored_closure():
+    return {
+        (row.ancestor_id, row.descendant_id): row.depth
+        for row in db.session.query(CategoryNodeClosure).all()
+    }
+
+
+def assert_closure_matches_parents():
+    db.session.expire_all()
+    assert stored_closure() == expected_closure()
+
+
+@pytest.fixture
+def create_node(client):
+    system_id = client.get('/api/category-nodes').get_json()[0]['system_id']
+
+    def create(code, level, parent_id=None):
+        response = client.post('/api/category-nodes', json={
+            'system_id': system_id,
+            'code': code,
+            'name': code.lower(),
+            'level': level,
+            'parent_id': parent_id
+        })
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['id']
+
+    return create
+
+
+def test_sample_closure_matches_parents(app_context):
+    assert_closure_matches_parents()
+
+
+def test_create_move_and_delete_keep_closure_in_sync(app_context, client, create_node):
+    first_root = create_node('CLOSURE-A', 1)
+    child = create_node('CLOSURE-A1', 2, first_root)
+    grandchild = create_node('CLOSURE-A11', 3, child)
+    second_root = create_node('CLOSURE-B', 1)
+    assert_closure_matches_parents()
+    assert get_all_descendant_node_ids(first_root) == {child, grandchild}
+
+    response = client.post(f'/api/category-nodes/{child}/move', json={'new_parent_id': second_root})
+    assert response.status_code == 200, response.get_json()
+    assert_closure_matches_parents()
+    assert get_all_descendant_node_ids(first_root) == set()
+    assert [entry['id'] for entry in get_category_breadcrumb(grandchild)] == [second_root, child, grandchild]
+    assert [node['id'] for node in client.get(f'/api/category-nodes/{grandchild}/ancestors').get_json()] == [
+        second_root, child
+    ]
+
+    assert client.delete(f'/api/category-nodes/{child}').status_code == 409
+    assert client.delete(f'/api/category-nodes/{grandchild}').status_code == 200
+    assert_closure_matches_parents()
+    assert get_all_descendant_node_ids(second_root) == {child}
+
+    assert client.delete(f'/api/category-nodes/{child}').status_code == 200
+    assert_closure_matches_parents()
+    assert get_all_descendant_node_ids(second_root) == set()
+
+
+def test_move_into_own_subtree_is_rejected(app_context, client, create_node):
+    root = create_node('CLOSURE-C', 1)
+    child = create_node('CLOSURE-C1', 2, root)
+    grandchild = create_node('CLOSURE-C11', 3, child)
+
+    response = client.post(f'/api/category-nodes/{child}/move', json={'new_parent_id': grandchild})
+
+    assert response.status_code == 400
+    assert_closure_matches_parents()
+
+
+def test_rebuild_restores_closure(app_context):
+    db.session.execute(CategoryNodeClosure.__table__.delete())
+    db.session.commit()
+
+    written = rebuild_category_node_closure()
+
+    assert written == len(expected_closure())
+    assert_closure_matches_parents()
@@ -0,0 +1,74 @@
+from models import db, IdSequence
+from utils.auto_id_generator import (
+    generate_base_id,
+    lock_id_sequence,
+    observe_base_id,
+    peek_next_base_number,
+    scan_max_base_number,
+)
+
+
+def test_lock_seeds_missing_sequence_from_existing_objects(app_context):
+    prefix = 'PROD'
+    db.session.execute(IdSequence.__table__.delete().where(IdSequence.prefix == prefix))
+
+    sequence = lock_id_sequence(prefix)
+
+    assert sequence.last_value == scan_max_base_number(prefix)
+
+
+def test_generate_base_id_reserves_consecutive_numbers(app_context):
+    first = generate_base_id('Product')
+    second = generate_base_id('Product')
+
+    first_number = int(first.split('-')[1])
+    assert first.startswith('PROD-')
+    assert second == f'PROD-{first_number + 1}'
+
+
+def test_rollback_releases_reserved_number(app_context):
+    before = peek_next_base_number('PROD')
+    assert generate_base_id('Product') == f'PROD-{before}'
+    db.session.rollback()
+
+    assert peek_next_base_number('PROD') == before
+
+
+def test_observe_base_id_only_moves_sequence_forward(app_context):
+    current = lock_id_sequence('PROD').last_value
+
+    observe_base_id(f'PROD-{current + 50}')
+    assert lock_id_sequence('PROD').last_value == current + 50
+
+    observe_base_id('PROD-1')
+    assert lock_id_sequence('PROD').last_value == current + 50
+    assert generate_base_id('Product') == f'PROD-{current + 51}'
+
+
+def test_observe_base_id_ignores_ids_without_number(app_context):
+    observe_base_id('not an id')
+    observe_base_id('')
+
+    assert IdSequence.query.filter_by(prefix='NOT AN ID').first() is None
+
+
+def test_created_objects_get_distinct_ids(create_object):
+    first = create_object('Id sequence A')
+    second = create_object('Id sequence B')
+
+    assert first['main_id'] != second['main_id']
+    assert int(second['main_id'].split('-')[1]) == int(first['main_id'].split('-')[1]) + 1
+
+
+def test_explicit_main_id_advances_sequence(client, create_object):
+    created = create_object('Id sequence explicit')
+    number = int(created['main_id'].split('-')[1]) + 100
+
+    response = client.post('/api/objects', json={
+        'object_type_id': created['object_type']['id'],
+        'main_id': f'PROD-{number}',
+        'data': {'namn': 'Id sequence explicit 2'}
+    })
+    assert response.status_code == 201, response.get_json()
+
+    assert create_object('Id sequence after explicit')['main_id'] == f'PROD-{number + 1}'
@@ -0,0 +1,75 @@
+import pytest
+from flask import jsonify
+
+from utils.json_stream import STREAM_CHUNK_SIZE, stream_json_response
+
+TREE = [
+    {'id': 1, 'name': 'Vägg', 'children': [{'id': 2, 'name': 'Skiva', 'data': {'b': 1, 'a': None}, 'children': []}]},
+    {'id': 3, 'children': [], 'files': []},
+]
+
+
+@pytest.fixture
+def request_context(app):
+    with app.test_request_context():
+        yield
+
+
+def read_body(response):
+    return b''.join(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8') for chunk in response.response)
+
+
+def test_body_matches_jsonify(request_context, monkeypatch):
+    monkeypatch.setattr('utils.json_stream.STREAM_CHUNK_SIZE', 1)
+    completed = []
+
+    response = stream_json_response(TREE, on_complete=completed.append)
+
+    assert read_body(response) == jsonify(TREE).get_data()
+    assert completed == [jsonify(TREE).get_data()]
+
+
+def test_error_before_first_byte_is_raised(request_context):
+    with pytest.raises(TypeError):
+        stream_json_response([{'id': 1, 'children': [], 'data': object()}])
+
+
+def test_error_mid_stream_aborts_without_completing(request_context):
+    completed = []
+    value = [{'id': index, 'name': 'x' * 1024, 'children': []} for index in range(200)]
+    value.append({'id': 'broken', 'data': object(), 'children': []})
+
+    response = stream_json_response(value, on_complete=completed.append)
+
+    with pytest.raises(TypeError):
+        read_body(response)
+    assert completed == []
+
+
+def test_iterator_is_encoded_while_streaming(request_context, monkeypatch):
+    monkeypatch.setattr('utils.json_stream.STREAM_CHUNK_SIZE', 1)
+    built = []
+
+    def build(node):
+        built.append(node['id'])
+        return node
+
+    response = stream_json_response(build(node) for node in TREE)
+    assert len(built) < len(TREE)
+
+    assert read_body(response) == jsonify(TREE).get_data()
+    assert built == [node['id'] for node in TREE]
+
+
+def test_error_in_later_item_aborts_without_completing(request_context):
+    completed = []
+
+    def build_roots():
+        yield {'id': 1, 'name': 'x' * STREAM_CHUNK_SIZE, 'children': []}
+        raise RuntimeError('broken root')
+
+    response = stream_json_response(build_roots(), on_complete=completed.append)
+
+    with pytest.raises(RuntimeError):
+        read_body(response)
+    assert completed == []
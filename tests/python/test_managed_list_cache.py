@@ -0,0 +1,53 @@
+from models import db, ManagedListItem
+from utils import managed_list_cache
+from utils.managed_list_cache import get_shared_managed_list_lookup
+
+
+def load_lookup(app, list_id):
+    with app.test_request_context():
+        return get_shared_managed_list_lookup(list_id)
+
+
+def get_list_id(client):
+    return client.get('/api/managed-lists').get_json()[0]['id']
+
+
+def test_lookup_is_reused_within_a_version(app, client):
+    list_id = get_list_id(client)
+
+    assert load_lookup(app, list_id) is load_lookup(app, list_id)
+
+
+def test_item_changes_evict_lookup(app, client):
+    list_id = get_list_id(client)
+    before = load_lookup(app, list_id)
+
+    response = client.post(f'/api/lists/{list_id}/items', json={'label': 'Listcachetest ny post'})
+    assert response.status_code == 201, response.get_json()
+    item_id = response.get_json()['id']
+    created = load_lookup(app, list_id)
+    assert client.delete(f'/api/list-items/{item_id}').status_code == 200
+    deleted = load_lookup(app, list_id)
+
+    assert item_id not in before.items
+    assert created.version > before.version
+    assert created.by_id[item_id]['label'] == 'Listcachetest ny post'
+    assert deleted.version > created.version
+    assert item_id not in deleted.items
+
+
+def test_list_written_in_transaction_bypasses_shared_lookup(app_context, client):
+    list_id = get_list_id(client)
+    shared = get_shared_managed_list_lookup(list_id)
+
+    item = ManagedListItem(list_id=list_id, label='Listcachetest ej sparad', value='Listcachetest ej sparad')
+    db.session.add(item)
+    db.session.flush()
+    pending = get_shared_managed_list_lookup(list_id)
+
+    assert pending is not shared
+    assert pending.version is None
+    assert pending.by_id[item.id]['label'] == 'Listcachetest ej sparad'
+    # The shared cache keeps the committed lookup for other requests.
+    assert managed_list_cache._lookups[list_id] is shared
+    assert item.id not in shared.items
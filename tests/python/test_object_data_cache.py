@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import update
+
+from models import db, Object, ObjectData, ObjectField
+
+
+@pytest.fixture
+def cached_object(app_context, create_object):
+    """A committed Product loaded in the test's session, with its data already decoded."""
+    created = create_object('Datacachetest skiva')
+    db.session.remove()
+    obj = db.session.get(Object, created['id'])
+    assert obj.data['namn'] == 'Datacachetest skiva'
+    assert '_data_cache' in obj.__dict__
+    return obj
+
+
+def get_name_row(obj):
+    return next(od for od in obj.object_data if od.field.field_name == 'namn')
+
+
+def update_name_in_database(obj, value):
+    db.session.execute(
+        update(ObjectData).where(ObjectData.id == get_name_row(obj).id).values(value_text=value),
+        execution_options={'synchronize_session': False}
+    )
+
+
+def test_setting_a_value_column_invalidates(cached_object):
+    get_name_row(cached_object).value_text = 'Datacachetest ändrad'
+
+    assert cached_object.data['namn'] == 'Datacachetest ändrad'
+
+
+def test_append_invalidates(cached_object):
+    field = ObjectField.query.filter(
+        ObjectField.object_type_id == cached_object.object_type_id,
+        ObjectField.field_type == 'text',
+        ObjectField.field_name.notin_(list(cached_object.data))
+    ).first()
+
+    cached_object.object_data.append(ObjectData(field_id=field.id, value_text='Datacachetest tillagd'))
+
+    assert cached_object.data[field.field_name] == 'Datacachetest tillagd'
+
+
+def test_remove_invalidates(cached_object):
+    cached_object.object_data.remove(get_name_row(cached_object))
+
+    assert 'namn' not in cached_object.data
+
+
+def test_expire_invalidates(cached_object):
+    update_name_in_database(cached_object, 'Datacachetest utgången')
+
+    db.session.expire_all()
+
+    assert cached_object.data['namn'] == 'Datacachetest utgången'
+
+
+def test_refresh_invalidates(cached_object):
+    update_name_in_database(cached_object, 'Datacachetest uppdaterad')
+    db.session.refresh(get_name_row(cached_object))
+
+    db.session.refresh(cached_object)
+
+    assert cached_object.data['namn'] == 'Datacachetest uppdaterad'
+
+
+def test_returned_data_is_a_copy(cached_object):
+    cached_object.data['namn'] = 'Datacachetest kopia'
+
+    assert cached_object.data['namn'] == 'Datacachetest skiva'
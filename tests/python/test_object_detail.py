@@ -0,0 +1,22 @@
+from models import db, ObjectRelation
+
+
+def test_sparse_relations_match_full_payload(app_context, client):
+    source_id = db.session.query(ObjectRelation.source_object_id).order_by(ObjectRelation.id).first()[0]
+
+    full = client.get(f'/api/objects/{source_id}').get_json()
+    sparse = client.get(f'/api/objects/{source_id}?include=relations&fields=namn').get_json()
+
+    assert sparse['relations']
+    assert sparse['relations'] == full['relations']
+    assert set(sparse['data']) <= {'namn'}
+    assert 'documents' not in sparse
+
+
+def test_unknown_include_is_rejected(client, create_object):
+    created = create_object('Detaljtest')
+
+    response = client.get(f"/api/objects/{created['id']}?include=everything")
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
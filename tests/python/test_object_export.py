@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy import event
+
+import routes.objects as object_routes
+from models import db
+
+
+def fail_after(monkeypatch, rows):
+    """Make get_object_export_value raise for every object after the first rows ones."""
+    original = object_routes.get_object_export_value
+    exported_ids = set()
+
+    def export_value(obj, data, column):
+        if obj.id not in exported_ids and len(exported_ids) >= rows:
+            raise RuntimeError('broken row')
+        exported_ids.add(obj.id)
+        return original(obj, data, column)
+
+    monkeypatch.setattr(object_routes, 'get_object_export_value', export_value)
+
+
+def read_chunks(response):
+    """Body chunks up to the point where the stream raised, and whether it did."""
+    chunks = []
+    try:
+        for chunk in response.response:
+            chunks.append(chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk)
+    except RuntimeError:
+        return ''.join(chunks), True
+    return ''.join(chunks), False
+
+
+def test_ndjson_export(client):
+    response = client.get('/api/objects/export?type=Product')
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(rows) == len(client.get('/api/objects?type=Product&minimal=true').get_json())
+    assert all('id' in row for row in rows)
+
+
+def test_csv_export_has_header_and_rows(client):
+    response = client.get('/api/objects/export?type=Product&format=csv')
+
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0][0] == 'id'
+    assert len(rows) == len(client.get('/api/objects?type=Product&minimal=true').get_json()) + 1
+
+
+def test_export_reads_all_batches_from_one_statement(app, client, monkeypatch):
+    monkeypatch.setattr(object_routes, 'OBJECT_EXPORT_BATCH_SIZE', 2)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if 'FROM objects JOIN object_types' in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get('/api/objects/export?type=Product')
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    ids = [json.loads(line)['id'] for line in response.get_data(as_text=True).splitlines()]
+    assert ids == [item['id'] for item in client.get('/api/objects?type=Product&minimal=true').get_json()]
+    assert len(statements) == 1
+    assert 'OFFSET' not in statements[0]
+
+
+@pytest.mark.parametrize('export_format', ['ndjson', 'csv'])
+def test_failure_in_first_batch_is_a_server_error(client, monkeypatch, export_format):
+    fail_after(monkeypatch, 0)
+
+    response = client.get(f'/api/objects/export?type=Product&format={export_format}')
+
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'Failed to export objects'}
+
+
+def test_ndjson_failure_mid_stream_is_marked_and_aborted(client, monkeypatch):
+    monkeypatch.setattr(object_routes, 'OBJECT_EXPORT_BATCH_SIZE', 2)
+    fail_after(monkeypatch, 5)
+
+    response = client.get('/api/objects/export?type=Product', buffered=False)
+    body, aborted = read_chunks(response)
+
+    assert response.status_code == 200
+    assert aborted
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert lines[-1] == {'error': 'Export failed; the file is incomplete'}
+    assert all('error' not in line for line in lines[:-1])
+
+
+def test_csv_failure_mid_stream_is_aborted(client, monkeypatch):
+    monkeypatch.setattr(object_routes, 'OBJECT_EXPORT_BATCH_SIZE', 2)
+    fail_after(monkeypatch, 5)
+
+    response = client.get('/api/objects/export?type=Product&format=csv', buffered=False)
+    _, aborted = read_chunks(response)
+
+    assert response.status_code == 200
+    assert aborted
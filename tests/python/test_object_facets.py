@@ -0,0 +1,66 @@
+import pytest
+
+
+def get_facets(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_all_facets_of_type(client):
+    payload = get_facets(client, '/api/objects?type=Product&minimal=true&facets=true')
+
+    assert {'object_type', 'status', 'material', 'produktkategori'} <= set(payload['facets'])
+    assert payload['facets']['object_type']['values'] == [
+        {'value': 'Product', 'id': payload['items'][0]['object_type']['id'], 'count': len(payload['items'])}
+    ]
+    assert sum(value['count'] for value in payload['facets']['status']['values']) == len(payload['items'])
+
+
+def test_selected_facets_only(client):
+    payload = get_facets(client, '/api/objects?type=Product&minimal=true&facets=status,material')
+
+    assert set(payload['facets']) == {'status', 'material'}
+
+
+def test_multi_select_values_are_counted_per_item(client, create_object):
+    created = create_object('Facettest flerval', material=['124', '126'])
+    create_object('Facettest enkelval', material=['126'])
+
+    payload = get_facets(
+        client, '/api/objects?type=Product&minimal=true&facets=material&filter[namn]=startswith:facettest'
+    )
+
+    assert created['id'] in [item['id'] for item in payload['items']]
+    assert payload['facets']['material'] == {
+        'values': [
+            {'value': '126', 'label': 'Stål', 'count': 2},
+            {'value': '124', 'label': 'Trä', 'count': 1},
+        ],
+        'truncated': False
+    }
+
+
+def test_counts_follow_search(client, create_object):
+    create_object('Facettest Sökbar skiva', material=['124'])
+
+    payload = get_facets(client, '/api/objects?type=Product&minimal=true&facets=material&search=sökbar skiva')
+
+    assert payload['facets']['material']['values'] == [{'value': '124', 'label': 'Trä', 'count': 1}]
+
+
+@pytest.mark.parametrize('facet', ['status', 'produktkategori'])
+def test_limit_caps_values(client, facet):
+    full = get_facets(client, f'/api/objects?type=Product&minimal=true&facets={facet}&facet_limit=100')['facets'][facet]
+    capped = get_facets(client, f'/api/objects?type=Product&minimal=true&facets={facet}&facet_limit=1')['facets'][facet]
+
+    assert len(full['values']) > 1
+    assert not full['truncated']
+    assert capped == {'values': full['values'][:1], 'truncated': True}
+
+
+def test_invalid_facet_limit_is_rejected(client):
+    response = client.get('/api/objects?type=Product&facets=true&facet_limit=many')
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
@@ -0,0 +1,117 @@
+"""Summaries, search documents and typeahead terms follow object writes."""
+from models import db, ObjectData, ObjectField
+
+
+def search_ids(client, query):
+    response = client.get(f'/api/search?q={query}')
+    assert response.status_code == 200, response.get_json()
+    return [item['id'] for item in response.get_json()]
+
+
+def suggest_ids(client, query):
+    response = client.get(f'/api/objects/suggest?q={query}')
+    assert response.status_code == 200, response.get_json()
+    return [item['id'] for item in response.get_json()]
+
+
+def get_summary(client, object_id):
+    summaries = client.get(f'/api/objects/summaries?ids={object_id}').get_json()
+    return summaries[0] if summaries else None
+
+
+def test_summary_follows_create_update_delete(client, create_object):
+    created = create_object('Indextest Kvartsplatta')
+    object_id = created['id']
+
+    summary = get_summary(client, object_id)
+    assert summary['display_name'] == 'Indextest Kvartsplatta'
+    assert summary['id_full'] == created['id_full']
+
+    response = client.put(f'/api/objects/{object_id}', json={'data': {'namn': 'Indextest Granitplatta'}})
+    assert response.status_code == 200, response.get_json()
+    assert get_summary(client, object_id)['display_name'] == 'Indextest Granitplatta'
+
+    assert client.delete(f'/api/objects/{object_id}').status_code == 200
+    assert get_summary(client, object_id) is None
+
+
+def test_relation_updates_counts_on_both_ends(client, create_object):
+    source = create_object('Indextest källa')
+    target = create_object('Indextest mål')
+
+    response = client.post(f"/api/objects/{source['id']}/relations", json={
+        'target_object_id': target['id'],
+        'relation_type': 'relaterad'
+    })
+    assert response.status_code == 201, response.get_json()
+
+    assert get_summary(client, source['id'])['outgoing_relation_count'] == 1
+    assert get_summary(client, target['id'])['incoming_relation_count'] == 1
+
+
+def test_search_document_follows_create_update_delete(client, create_object):
+    created = create_object('Indextest Kalkplatta')
+    object_id = created['id']
+
+    assert object_id in search_ids(client, 'kalkplatta')
+    assert object_id in search_ids(client, created['id_full'])
+
+    response = client.put(f'/api/objects/{object_id}', json={'data': {'namn': 'Indextest Skifferplatta'}})
+    assert response.status_code == 200, response.get_json()
+    assert object_id in search_ids(client, 'skifferplatta')
+    assert object_id not in search_ids(client, 'kalkplatta')
+
+    assert client.delete(f'/api/objects/{object_id}').status_code == 200
+    assert object_id not in search_ids(client, 'skifferplatta')
+
+
+def test_suggest_terms_follow_create_update_delete(client, create_object):
+    created = create_object('Indextest Marmorplatta')
+    object_id = created['id']
+
+    assert object_id in suggest_ids(client, 'indextest marmor')
+    assert object_id in suggest_ids(client, 'marmorplat')
+
+    response = client.put(f'/api/objects/{object_id}', json={'data': {'namn': 'Indextest Basaltplatta'}})
+    assert response.status_code == 200, response.get_json()
+    assert [item['name'] for item in client.get('/api/objects/suggest?q=indextest basalt').get_json()] == [
+        'Indextest Basaltplatta'
+    ]
+    assert object_id not in suggest_ids(client, 'indextest marmor')
+
+    assert client.delete(f'/api/objects/{object_id}').status_code == 200
+    assert object_id not in suggest_ids(client, 'indextest basalt')
+
+
+def set_tree_name_field(client, type_id, field_name):
+    response = client.put('/api/view-config/tree-display', json={
+        'Product': {'object_type_id': type_id, 'tree_view_name_field': field_name}
+    })
+    assert response.status_code == 200, response.get_json()
+
+
+def test_display_name_follows_tree_name_field(app_context, client, create_object):
+    created = create_object('Indextest namnlös', tillverkare='Indextest Fabrikat AB')
+    type_id = created['object_type']['id']
+    namn_field = ObjectField.query.filter_by(object_type_id=type_id, field_name='namn').one()
+    db.session.delete(ObjectData.query.filter_by(object_id=created['id'], field_id=namn_field.id).one())
+    db.session.commit()
+    assert get_summary(client, created['id'])['display_name'] == created['id_full']
+
+    set_tree_name_field(client, type_id, 'tillverkare')
+    try:
+        assert get_summary(client, created['id'])['display_name'] == 'Indextest Fabrikat AB'
+        suggestions = client.get(f"/api/objects/suggest?q={created['id_full']}").get_json()
+        assert suggestions[0]['name'] == 'Indextest Fabrikat AB'
+    finally:
+        set_tree_name_field(client, type_id, None)
+
+    assert get_summary(client, created['id'])['display_name'] == created['id_full']
+
+
+def test_search_matches_inside_words(client, create_object):
+    created = create_object('Indextest Ytterväggarnas skiva')
+
+    assert created['id'] in search_ids(client, 'väggarna')
+    assert created['id'] in search_ids(client, 'ytterväggarnas skiva')
+    assert created['id'] not in search_ids(client, 'väggarna skiva')
@@ -0,0 +1,191 @@
+from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import quote
+
+import pytest
+
+from models import db, ObjectData, ObjectField
+from routes.objects import (
+    decode_object_list_cursor,
+    encode_object_list_cursor,
+    parse_object_list_filter_value,
+)
+
+
+def get_items(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_pages_cover_list_once(client):
+    expected = [item['id'] for item in get_items(client, '/api/objects?type=Product&minimal=true')]
+
+    seen = []
+    page = 1
+    while True:
+        payload = get_items(client, f'/api/objects?type=Product&minimal=true&page={page}&per_page=7')
+        assert payload['total'] == len(expected)
+        assert len(payload['items']) <= 7
+        seen.extend(item['id'] for item in payload['items'])
+        if page >= payload['total_pages']:
+            break
+        page += 1
+
+    assert seen == expected
+
+
+def test_search_ignores_case_of_swedish_letters(client, create_object):
+    created = create_object('Listtest Ärtgrön skiva')
+
+    for query in ('ärtgrön', 'ÄRTGRÖN', created['id_full']):
+        matches = get_items(client, f'/api/objects?type=Product&minimal=true&search={query}')
+        assert [item['id'] for item in matches] == [created['id']]
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 21, 13, 29, 36, 559193)
+    token = encode_object_list_cursor(SimpleNamespace(created_at=created_at, id=42))
+
+    assert '=' not in token
+    assert decode_object_list_cursor(token) == (created_at, 42)
+    assert decode_object_list_cursor(encode_object_list_cursor(SimpleNamespace(created_at=None, id=7))) == (None, 7)
+
+
+@pytest.mark.parametrize('token', ['bogus', '', 'e30', 'eyJpZCI6ICJ4In0'])
+def test_decode_rejects_malformed_cursor(token):
+    with pytest.raises(ValueError):
+        decode_object_list_cursor(token)
+
+
+def test_cursor_pages_cover_list_once(client):
+    expected = [item['id'] for item in get_items(client, '/api/objects?type=Product&minimal=true')]
+
+    seen = []
+    cursor = ''
+    while cursor is not None:
+        page = get_items(client, f'/api/objects?type=Product&minimal=true&per_page=7&cursor={cursor}')
+        assert len(page['items']) <= 7
+        seen.extend(item['id'] for item in page['items'])
+        cursor = page['next_cursor']
+
+    assert seen == expected
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get('/api/objects?cursor=bogus').status_code == 400
+    assert client.get('/api/objects?cursor=&sort=namn').status_code == 400
+
+
+@pytest.mark.parametrize('kind, raw_value, expected', [
+    ('text', ' Vägg ', 'vägg'),
+    ('number', '12.5', pytest.approx(12.5)),
+    ('date', '2026-03-21', datetime(2026, 3, 21).date()),
+    ('datetime', '2026-03-21T13:29:36Z', datetime(2026, 3, 21, 13, 29, 36)),
+    ('datetime', '2026-03-21T15:29:36+02:00', datetime(2026, 3, 21, 13, 29, 36)),
+    ('datetime', '2026-03-21T13:29:36', datetime(2026, 3, 21, 13, 29, 36)),
+    ('boolean', 'ja', True),
+    ('boolean', 'false', False),
+])
+def test_parse_filter_value(kind, raw_value, expected):
+    assert parse_object_list_filter_value(kind, raw_value) == expected
+
+
+@pytest.mark.parametrize('kind, raw_value', [
+    ('number', 'abc'),
+    ('date', '2026-13-01'),
+    ('boolean', 'kanske'),
+])
+def test_parse_filter_value_rejects_invalid_input(kind, raw_value):
+    with pytest.raises(Exception):
+        parse_object_list_filter_value(kind, raw_value)
+
+
+def test_text_filters(client, create_object):
+    created = create_object('Filtertest Ytterväggsskiva')
+
+    contains = get_items(client, '/api/objects?type=Product&minimal=true&filter[namn]=contains:ytterväggs')
+    assert created['id'] in [item['id'] for item in contains]
+
+    startswith = get_items(client, '/api/objects?type=Product&minimal=true&filter[namn]=startswith:FILTERTEST')
+    assert [item['id'] for item in startswith] == [created['id']]
+
+    equal = get_items(client, '/api/objects?type=Product&minimal=true&filter[namn]=eq:filtertest ytterväggsskiva')
+    assert [item['id'] for item in equal] == [created['id']]
+
+    not_equal = get_items(client, '/api/objects?type=Product&minimal=true&filter[namn]=ne:filtertest ytterväggsskiva')
+    assert created['id'] not in [item['id'] for item in not_equal]
+
+
+def test_datetime_filter_and_sort(client, create_object):
+    created = create_object('Filtertest nyast')
+    since = created['created_at']
+
+    newer = get_items(client, f'/api/objects?type=Product&minimal=true&filter[created_at]=gte:{since}')
+    assert created['id'] in [item['id'] for item in newer]
+    older = get_items(client, f'/api/objects?type=Product&minimal=true&filter[created_at]=lt:{since}')
+    assert older
+    assert created['id'] not in [item['id'] for item in older]
+
+    ascending = get_items(client, '/api/objects?type=Product&minimal=true&sort=id_full&page=1&per_page=500')['items']
+    id_fulls = [item['id_full'].lower() for item in ascending]
+    assert id_fulls == sorted(id_fulls)
+
+
+def test_datetime_filter_with_offset_compares_in_utc(client, create_object):
+    created = create_object('Filtertest tidszon')
+    # One hour west of UTC: the same wall time is an hour after created_at.
+    west = quote(f"{created['created_at']}-01:00")
+
+    def created_matches(condition):
+        items = get_items(client, f'/api/objects?type=Product&minimal=true&filter[created_at]={condition}')
+        return created['id'] in [item['id'] for item in items]
+
+    assert created_matches(f"gte:{created['created_at']}Z")
+    assert created_matches(f'lt:{west}')
+    assert not created_matches(f'gte:{west}')
+
+
+@pytest.mark.parametrize('sort', ['namn', '-namn'])
+def test_sort_lists_object_once_with_several_matching_fields(app_context, client, create_object, sort):
+    created = create_object('Sorttest dubbelnamn')
+    other_type_field = ObjectField.query.filter(
+        ObjectField.field_name == 'namn',
+        ObjectField.object_type_id != created['object_type']['id']
+    ).first()
+    db.session.add(ObjectData(object_id=created['id'], field_id=other_type_field.id, value_text='Sorttest annat namn'))
+    db.session.commit()
+
+    payload = get_items(client, f'/api/objects?minimal=true&sort={sort}&page=1&per_page=1000')
+    ids = [item['id'] for item in payload['items']]
+
+    assert created['id'] in ids
+    assert len(ids) == len(set(ids)) == payload['total']
+    assert client.delete(f"/api/objects/{created['id']}").status_code == 200
+
+
+@pytest.mark.parametrize('query', [
+    'filter[saknas]=eq:x',
+    'filter[created_at]=gte:igår',
+    'filter[namn]=eq:',
+    'sort=saknas',
+])
+def test_invalid_filter_or_sort_is_rejected(client, query):
+    response = client.get(f'/api/objects?type=Product&{query}')
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+@pytest.mark.parametrize('op', ['contains', 'startswith'])
+@pytest.mark.parametrize('wildcard', ['%', '_', '\\'])
+def test_like_wildcards_in_filter_match_literally(client, create_object, op, wildcard):
+    created = create_object(f'{wildcard}Wildcardtest {wildcard} rabatt')
+    plain = create_object('Wildcardtest utan tecken')
+
+    matches = get_items(client, f'/api/objects?type=Product&minimal=true&filter[namn]={op}:{quote(wildcard)}')
+    match_ids = [item['id'] for item in matches]
+
+    assert created['id'] in match_ids
+    assert plain['id'] not in match_ids
+    assert all(wildcard in item['data'].get('namn', '') for item in matches)
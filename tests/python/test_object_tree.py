@@ -0,0 +1,144 @@
+import json
+
+import pytest
+
+from routes.objects import decode_tree_continuation, encode_tree_continuation
+from utils import tree_cache
+
+TREE_VIEWS = ('byggdelar', 'utrymmen', 'system')
+
+
+@pytest.fixture
+def empty_tree_cache():
+    def clear():
+        with tree_cache._cache.lock:
+            tree_cache._cache.entries.clear()
+            tree_cache._cache.total_bytes = 0
+
+    clear()
+    yield clear
+    clear()
+
+
+def fetch(client, url, etag=None):
+    """GET url, revalidating etag if given, and return status, ETag and body of the closed response."""
+    headers = {'If-None-Match': etag} if etag else {}
+    with client.get(url, headers=headers) as response:
+        return response.status_code, response.headers.get('ETag'), response.get_data()
+
+
+def get_nodes(client, url):
+    status, _, body = fetch(client, url)
+    assert status == 200, (url, body)
+    return json.loads(body)
+
+
+def resolve_truncated(client, view, nodes):
+    """
+    Replace every truncated marker with the nodes its continuation returns.
+
+    /tree/children answers one level with has_children set, so collapsed
+    nodes are expanded the way the tree table does it.
+    """
+    resolved = []
+    for node in nodes:
+        if node.get('type') == 'truncated':
+            continued = get_nodes(client, f"/api/objects/tree/children?view={view}&continuation={node['continuation']}")
+            resolved.extend(resolve_truncated(client, view, continued))
+            continue
+        if node.pop('has_children', False) and not node.get('children'):
+            node['children'] = get_nodes(client, f"/api/objects/tree/children?view={view}&node={node['id']}")
+        if 'children' in node:
+            node['children'] = resolve_truncated(client, view, node['children'])
+        resolved.append(node)
+    return resolved
+
+
+def count_truncated(nodes):
+    return sum((node.get('type') == 'truncated') + count_truncated(node.get('children') or []) for node in nodes)
+
+
+def test_continuation_round_trip():
+    token = encode_tree_continuation('byggdelar', 'group-93-Product', 12)
+
+    assert decode_tree_continuation(token) == ('byggdelar', 'group-93-Product', 12)
+    for bogus in ('bogus', '', encode_tree_continuation('byggdelar', None, -1)):
+        with pytest.raises(ValueError):
+            decode_tree_continuation(bogus)
+
+
+@pytest.mark.parametrize('view', TREE_VIEWS)
+@pytest.mark.parametrize('max_nodes', [1, 3, 37])
+def test_budgeted_tree_continues_to_full_tree(app, client, monkeypatch, empty_tree_cache, view, max_nodes):
+    monkeypatch.setitem(app.config, 'TREE_MAX_NODES', 0)
+    monkeypatch.setitem(app.config, 'TREE_MAX_SECONDS', 0)
+    full = get_nodes(client, f'/api/objects/tree?view={view}')
+
+    monkeypatch.setitem(app.config, 'TREE_MAX_NODES', max_nodes)
+    empty_tree_cache()
+    budgeted = get_nodes(client, f'/api/objects/tree?view={view}')
+
+    if view == 'byggdelar':
+        assert count_truncated(budgeted) > 0
+    assert resolve_truncated(client, view, budgeted) == full
+
+
+def test_invalid_continuation_is_rejected(client):
+    response = client.get('/api/objects/tree/children?continuation=bogus')
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid continuation token'}
+
+
+def test_timed_out_tree_is_not_cached(app, client, monkeypatch, empty_tree_cache):
+    monkeypatch.setitem(app.config, 'TREE_MAX_NODES', 0)
+    monkeypatch.setitem(app.config, 'TREE_MAX_SECONDS', 1e-9)
+
+    with client.get('/api/objects/tree?view=byggdelar') as response:
+        assert response.status_code == 200
+        assert count_truncated(response.get_json()) > 0
+        assert response.headers.get('Cache-Control') == 'no-store'
+        assert 'ETag' not in response.headers
+    assert not tree_cache._cache.entries
+
+
+def test_etag_revalidation_and_invalidation(client, empty_tree_cache, create_object):
+    url = '/api/objects/tree?view=byggdelar'
+    _, etag, body = fetch(client, url)
+
+    assert fetch(client, url, etag)[0] == 304
+    assert fetch(client, url) == (200, etag, body)
+
+    created = create_object('Trädcache ny produkt')
+    status, created_etag, _ = fetch(client, url, etag)
+    assert status == 200
+    assert created_etag != etag
+
+    assert client.delete(f"/api/objects/{created['id']}").status_code == 200
+    status, deleted_etag, _ = fetch(client, url, created_etag)
+    assert status == 200
+    assert deleted_etag not in (etag, created_etag)
+
+
+def test_read_only_requests_keep_etag(client, empty_tree_cache):
+    url = '/api/objects/tree?view=system'
+    etag = fetch(client, url)[1]
+
+    client.get('/api/objects?type=Product')
+    client.get('/api/search?q=vägg')
+
+    assert fetch(client, url, etag)[0] == 304
+
+
+def test_only_small_streamed_trees_are_cached(app, client, monkeypatch, empty_tree_cache):
+    url = '/api/objects/tree?view=byggdelar'
+    monkeypatch.setitem(app.config, 'TREE_CACHE_STREAM_MAX_BYTES', 1024)
+    status, _, body = fetch(client, url)
+
+    assert status == 200
+    assert len(body) > 1024
+    assert not tree_cache._cache.entries
+
+    monkeypatch.setitem(app.config, 'TREE_CACHE_STREAM_MAX_BYTES', len(body))
+    fetch(client, url)
+    assert [entry[1] for entry in tree_cache._cache.entries.values()] == [body]
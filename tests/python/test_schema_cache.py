@@ -0,0 +1,79 @@
+from utils.schema_cache import bump_schema_version, get_schema
+
+
+def load_schema(app):
+    with app.test_request_context():
+        return get_schema()
+
+
+def get_product_type(client):
+    return next(item for item in client.get('/api/object-types').get_json() if item['name'] == 'Product')
+
+
+def test_snapshot_is_reused_within_a_version(app):
+    first = load_schema(app)
+    second = load_schema(app)
+
+    assert first is not None
+    assert second is first
+
+
+def test_schema_is_not_cached_outside_requests(app):
+    with app.app_context():
+        assert get_schema() is None
+
+
+def test_bump_bypasses_snapshot_for_rest_of_request(app_context):
+    assert get_schema() is not None
+
+    bump_schema_version()
+
+    assert get_schema() is None
+
+
+def test_object_type_update_reloads_schema(app, client):
+    product = get_product_type(client)
+    before = load_schema(app)
+
+    response = client.put(f"/api/object-types/{product['id']}", json={'description': 'Schematest beskrivning'})
+    assert response.status_code == 200, response.get_json()
+    after = load_schema(app)
+    assert client.put(f"/api/object-types/{product['id']}", json={'description': product['description']}).status_code == 200
+
+    assert after.version > before.version
+    assert after.types_by_id[product['id']].description == 'Schematest beskrivning'
+
+
+def test_field_template_update_reloads_schema(app, client):
+    template = client.get('/api/field-templates').get_json()[0]
+    before = load_schema(app)
+
+    response = client.put(f"/api/field-templates/{template['id']}", json={**template, 'display_name': 'Schematest mall'})
+    assert response.status_code == 200, response.get_json()
+    after = load_schema(app)
+    assert client.put(f"/api/field-templates/{template['id']}", json=template).status_code == 200
+
+    assert after.version > before.version
+    assert after.templates_by_id[template['id']].display_name == 'Schematest mall'
+
+
+def test_field_binding_changes_reload_schema(app, client):
+    managed_list_id = client.get('/api/managed-lists').get_json()[0]['id']
+    key = ('product', 'schematest')
+    before = load_schema(app)
+
+    response = client.post('/api/field-bindings', json={
+        'object_type': 'Product',
+        'field_name': 'schematest',
+        'list_id': managed_list_id
+    })
+    assert response.status_code == 201, response.get_json()
+    created = load_schema(app)
+    assert client.delete(f"/api/field-bindings/{response.get_json()['id']}").status_code == 200
+    deleted = load_schema(app)
+
+    assert key not in before.bindings_by_field
+    assert created.version > before.version
+    assert created.bindings_by_field[key]['list_id'] == managed_list_id
+    assert deleted.version > created.version
+    assert key not in deleted.bindings_by_field
@@ -0,0 +1,53 @@
+import sqlite3
+
+import pytest
+
+from models import db, Object
+from utils import memory_search_index
+from utils.search_index import build_search_match_query
+
+QUERIES = ['vägg', 'ö', 'byg', 'trappa', 'prod-1']
+
+
+def search_results(client, query):
+    response = client.get(f'/api/search?q={query}&page=1&per_page=500&facets=true')
+    assert response.status_code == 200, response.get_json()
+    payload = response.get_json()
+    return sorted(item['id'] for item in payload['items']), payload['total'], payload['facets']
+
+
+@pytest.fixture
+def memory_index_on(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'SEARCH_MEMORY_INDEX', 'on')
+
+
+def test_memory_index_matches_database_search(app, client, monkeypatch):
+    expected = {query: search_results(client, query) for query in QUERIES}
+
+    monkeypatch.setitem(app.config, 'SEARCH_MEMORY_INDEX', 'on')
+    for query in QUERIES:
+        assert search_results(client, query) == expected[query]
+
+
+@pytest.fixture
+def low_parameter_limit(app_context):
+    """Allow 999 bound parameters per statement, the default of older SQLite builds."""
+    connection = db.session.connection().connection.driver_connection
+    previous = connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    yield
+    connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, previous)
+
+
+def test_many_matches_do_not_hit_parameter_limit(low_parameter_limit, memory_index_on, monkeypatch):
+    object_ids = [object_id for (object_id,) in db.session.query(Object.id).all()]
+    candidates = object_ids + list(range(10 ** 6, 10 ** 6 + 5000))
+    monkeypatch.setattr(
+        memory_search_index.MemorySearchIndex, 'search',
+        lambda self, search, object_type_id=None, field_ids=None: candidates
+    )
+
+    matches = build_search_match_query('a').subquery()
+    matched_ids = {object_id for (object_id,) in db.session.execute(db.select(matches.c.object_id)).all()}
+
+    assert matched_ids == set(object_ids)
+    assert db.session.query(Object).filter(Object.id.in_(db.select(matches.c.object_id))).count() == len(object_ids)
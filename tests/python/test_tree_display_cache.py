@@ -0,0 +1,96 @@
+import pytest
+
+from models import db, ManagedList, ManagedListItem, Object, ObjectField
+from utils.cache_versions import bump_cache_version
+from utils.managed_list_cache import get_managed_list_version_scope
+from utils.schema_cache import SCHEMA_VERSION_SCOPE, parse_field_options
+from utils.tree_display_cache import get_tree_display_projection
+
+
+@pytest.fixture
+def projected(app, create_object):
+    """Project a new Product through the cache, recording every build."""
+    object_id = create_object('Visningstest skiva', material=['124'])['id']
+    builds = []
+
+    def project():
+        with app.test_request_context():
+            obj = db.session.get(Object, object_id)
+            return get_tree_display_projection(obj, lambda item: builds.append(item.updated_at) or {'id': item.id})
+
+    project()
+    return object_id, project, builds
+
+
+def get_product_list_ids(app):
+    """Managed lists behind the Product select fields, and the lists that are not."""
+    with app.app_context():
+        used = {
+            int(options['list_id'])
+            for field in ObjectField.query.join(ObjectField.object_type).filter_by(name='Product')
+            for options in [parse_field_options(field.field_options) or {}]
+            if field.field_type == 'select' and options.get('source') == 'managed_list'
+        }
+        unused = {managed_list.id for managed_list in ManagedList.query.all()} - used
+        return sorted(used), sorted(unused)
+
+
+def commit_version_bump(app, scope):
+    with app.test_request_context():
+        bump_cache_version(scope)
+        db.session.commit()
+
+
+def test_projection_is_reused_for_same_stamp(projected):
+    object_id, project, builds = projected
+
+    assert project() == {'id': object_id}
+    assert len(builds) == 1
+
+
+def test_object_update_recomputes_projection(client, projected):
+    object_id, project, builds = projected
+
+    response = client.put(f'/api/objects/{object_id}', json={'data': {'namn': 'Visningstest ändrad'}})
+    assert response.status_code == 200, response.get_json()
+    project()
+
+    assert len(builds) == 2
+    assert builds[1] > builds[0]
+
+
+def test_schema_version_recomputes_projection(app, projected):
+    _, project, builds = projected
+
+    commit_version_bump(app, SCHEMA_VERSION_SCOPE)
+    project()
+
+    assert len(builds) == 2
+
+
+def test_only_referenced_list_versions_recompute_projection(app, projected):
+    _, project, builds = projected
+    used_list_ids, unused_list_ids = get_product_list_ids(app)
+    assert used_list_ids and unused_list_ids
+
+    commit_version_bump(app, get_managed_list_version_scope(unused_list_ids[0]))
+    project()
+    assert len(builds) == 1
+
+    commit_version_bump(app, get_managed_list_version_scope(used_list_ids[0]))
+    project()
+    assert len(builds) == 2
+
+
+def test_projection_is_not_cached_while_lists_are_written(app, app_context, projected):
+    object_id, _, _ = projected
+    list_id = get_product_list_ids(app)[0][0]
+    db.session.add(ManagedListItem(list_id=list_id, label='Visningstest ej sparad', value='Visningstest ej sparad'))
+    db.session.flush()
+    obj = db.session.get(Object, object_id)
+    builds = []
+
+    for _ in range(2):
+        get_tree_display_projection(obj, lambda item: builds.append(item.id) or {'id': item.id})
+
+    assert builds == [object_id, object_id]
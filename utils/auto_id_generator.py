@@ -1,5 +1,7 @@
 import re
-from models import db, Object, ObjectType
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from models import db, Object, ObjectType, IdSequence
 
 
 DEFAULT_PREFIX_MAP = {
@@ -23,10 +25,16 @@ DEFAULT_PREFIX_MAP = {
 }
 
 
+def resolve_object_type_prefix(object_type_name, id_prefix=None):
+    if id_prefix:
+        return str(id_prefix).strip().upper()
+    return DEFAULT_PREFIX_MAP.get(object_type_name, 'OBJ')
+
+
 def get_object_type_prefix(object_type_name):
     object_type = ObjectType.query.filter_by(name=object_type_name).first()
-    if object_type and object_type.id_prefix:
-        return str(object_type.id_prefix).strip().upper()
+    if object_type:
+        return object_type.resolve_id_prefix()
     return DEFAULT_PREFIX_MAP.get(object_type_name, 'OBJ')
 
 
@@ -98,9 +106,80 @@ def get_next_version_for_base_id(base_id):
 
     return f"v{max_version_number + 1}"
 
+def scan_max_base_number(prefix):
+    """Return the highest number used by existing main_ids with prefix (full scan)."""
+    existing_ids = db.session.query(Object.main_id).filter(Object.main_id.like(f'{prefix}-%')).all()
+    max_num = 0
+    for (candidate,) in existing_ids:
+        number = extract_numeric_suffix(candidate, expected_prefix=prefix)
+        if number is not None and number > max_num:
+            max_num = number
+    return max_num
+
+
+def lock_id_sequence(prefix):
+    """
+    Load the id_sequences row for prefix with a write lock, seeding it if missing.
+
+    PostgreSQL locks the row with SELECT ... FOR UPDATE. SQLite has no row locks,
+    so the write transaction is opened with BEGIN IMMEDIATE instead, which
+    serializes concurrent ID generation until commit/rollback.
+    """
+    prefix = str(prefix or '').strip().upper()
+    db.session.info.get('peeked_base_numbers', {}).pop(prefix, None)
+    if db.session.get_bind().dialect.name == 'sqlite':
+        dbapi_connection = db.session.connection().connection.driver_connection
+        if not dbapi_connection.in_transaction:
+            db.session.execute(text('BEGIN IMMEDIATE'))
+
+    sequence = db.session.get(IdSequence, prefix, with_for_update=True)
+    if sequence is not None:
+        return sequence
+
+    # First ID for this prefix: seed from existing objects once.
+    sequence = IdSequence(prefix=prefix, last_value=scan_max_base_number(prefix))
+    try:
+        with db.session.begin_nested():
+            db.session.add(sequence)
+    except IntegrityError:
+        # Another transaction seeded the row concurrently; lock theirs instead.
+        sequence = db.session.get(IdSequence, prefix, with_for_update=True, populate_existing=True)
+    return sequence
+
+
+def peek_next_base_number(prefix):
+    """Return the next base-ID number for prefix without reserving it."""
+    prefix = str(prefix or '').strip().upper()
+    # Listing many objects peeks the same few prefixes over and over; remember
+    # the answer for the rest of the session (lock_id_sequence forgets it).
+    peeked = db.session.info.setdefault('peeked_base_numbers', {})
+    if prefix not in peeked:
+        sequence = db.session.get(IdSequence, prefix)
+        if sequence is not None:
+            peeked[prefix] = (sequence.last_value or 0) + 1
+        else:
+            peeked[prefix] = scan_max_base_number(prefix) + 1
+    return peeked[prefix]
+
+
+def observe_base_id(base_id):
+    """Advance the sequence past an explicitly supplied base ID (e.g. 'BYG-120')."""
+    match = re.match(r'^([A-Za-z0-9_]+)-(\d+)$', normalize_base_id(base_id))
+    if not match:
+        return
+    sequence = lock_id_sequence(match.group(1))
+    number = int(match.group(2))
+    if number > (sequence.last_value or 0):
+        sequence.last_value = number
+        db.session.flush()
+
+
 def generate_base_id(object_type_name):
     """
     Generate auto ID for objects based on type.
+
+    The number is reserved in id_sequences within the caller's transaction, so
+    concurrent creates cannot receive the same ID and a rollback releases it.
     
     Args:
         object_type_name (str): Name of the object type
@@ -109,22 +188,7 @@ def generate_base_id(object_type_name):
         str: Generated base ID (e.g., 'BYG-1', 'PROD-42')
     """
     prefix = get_object_type_prefix(object_type_name)
-
-    # Get the highest number for this type
-    try:
-        pattern = f'{prefix}-%'
-        existing_ids = db.session.query(Object.main_id).filter(Object.main_id.like(pattern)).all()
-        max_num = 0
-        for (candidate,) in existing_ids:
-            number = extract_numeric_suffix(candidate, expected_prefix=prefix)
-            if number is not None and number > max_num:
-                max_num = number
-
-        new_num = max_num + 1
-        return f"{prefix}-{new_num}"
-    except Exception as e:
-        # Log error and start from 1
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Error generating base_id for {object_type_name}: {str(e)}. Starting from 1.")
-        return f"{prefix}-1"
+    sequence = lock_id_sequence(prefix)
+    sequence.last_value = (sequence.last_value or 0) + 1
+    db.session.flush()
+    return f"{prefix}-{sequence.last_value}"
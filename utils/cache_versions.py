@@ -0,0 +1,36 @@
+"""Shared version counters used to invalidate in-process caches across workers."""
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from models import db, CacheVersion
+
+
+def get_cache_version(scope):
+    """Return the committed version for scope (0 if never bumped). One PK lookup."""
+    version = db.session.query(CacheVersion.version).filter(CacheVersion.scope == scope).scalar()
+    return int(version or 0)
+
+
+def bump_cache_version(scope):
+    """
+    Increment the version for scope inside the current transaction.
+
+    The bump becomes visible to other workers when the caller commits, and is
+    discarded together with the rest of the change on rollback.
+    """
+    updated = (
+        db.session.query(CacheVersion)
+        .filter(CacheVersion.scope == scope)
+        .update(
+            {CacheVersion.version: CacheVersion.version + 1, CacheVersion.updated_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+    )
+    if updated:
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(CacheVersion(scope=scope, version=1))
+    except IntegrityError:
+        # Created concurrently by another worker; bump theirs.
+        bump_cache_version(scope)
@@ -0,0 +1,103 @@
+"""
+Maintenance of the category_node_closure table.
+
+Every category node has one closure row per ancestor (and one for itself at
+depth 0), so breadcrumbs, descendant filters and requirement inheritance are
+single indexed lookups instead of walks over parent_id. The create, move and
+delete routes in routes/category_nodes.py keep the rows in sync inside their
+own transaction; rebuild_category_node_closure() recomputes the whole table
+(migrations/add_category_node_closure.py, scripts/rebuild_category_closure.py).
+"""
+import logging
+
+from sqlalchemy import and_, delete, insert, literal, select, true, union_all
+from sqlalchemy.orm import aliased
+
+from models import db, CategoryNode, CategoryNodeClosure
+from models.category_node import VALID_LEVELS
+
+logger = logging.getLogger(__name__)
+
+
+def _subtree_ids(node_id):
+    return select(CategoryNodeClosure.descendant_id).where(CategoryNodeClosure.ancestor_id == node_id)
+
+
+def add_category_node_closure(node):
+    """Insert the closure rows of a new (flushed) node: itself and the ancestors of its parent."""
+    rows = select(literal(node.id), literal(node.id), literal(0))
+    if node.parent_id is not None:
+        rows = union_all(
+            rows,
+            select(
+                CategoryNodeClosure.ancestor_id,
+                literal(node.id),
+                CategoryNodeClosure.depth + 1
+            ).where(CategoryNodeClosure.descendant_id == node.parent_id)
+        )
+    db.session.execute(insert(CategoryNodeClosure).from_select(
+        ['ancestor_id', 'descendant_id', 'depth'], rows
+    ))
+
+
+def move_category_node_closure(node_id, new_parent_id):
+    """Re-link the subtree of node_id below new_parent_id (None makes it a root)."""
+    subtree_ids = _subtree_ids(node_id)
+    # Drop the paths from the old ancestors into the subtree; paths inside it stay valid.
+    db.session.execute(delete(CategoryNodeClosure).where(
+        CategoryNodeClosure.descendant_id.in_(subtree_ids),
+        CategoryNodeClosure.ancestor_id.notin_(subtree_ids)
+    ).execution_options(synchronize_session=False))
+    if new_parent_id is None:
+        return
+
+    ancestors = aliased(CategoryNodeClosure)
+    subtree = aliased(CategoryNodeClosure)
+    db.session.execute(insert(CategoryNodeClosure).from_select(
+        ['ancestor_id', 'descendant_id', 'depth'],
+        select(
+            ancestors.ancestor_id,
+            subtree.descendant_id,
+            ancestors.depth + subtree.depth + 1
+        ).join_from(ancestors, subtree, true()).where(
+            ancestors.descendant_id == new_parent_id,
+            subtree.ancestor_id == node_id
+        )
+    ))
+
+
+def delete_category_node_closure(node_id):
+    """Remove the closure rows of node_id and its subtree (before the nodes are deleted)."""
+    db.session.execute(delete(CategoryNodeClosure).where(
+        CategoryNodeClosure.descendant_id.in_(_subtree_ids(node_id))
+    ).execution_options(synchronize_session=False))
+
+
+def rebuild_category_node_closure():
+    """Recompute every closure row from category_nodes.parent_id and commit; returns the row count."""
+    paths = select(
+        CategoryNode.id.label('ancestor_id'),
+        CategoryNode.id.label('descendant_id'),
+        literal(0).label('depth')
+    ).cte('category_paths', recursive=True)
+    paths = paths.union_all(
+        select(
+            paths.c.ancestor_id,
+            CategoryNode.id,
+            paths.c.depth + 1
+        ).join(CategoryNode, and_(
+            CategoryNode.parent_id == paths.c.descendant_id,
+            # Guards against parent_id cycles; valid trees are at most len(VALID_LEVELS) deep.
+            paths.c.depth < len(VALID_LEVELS)
+        ))
+    )
+
+    db.session.execute(delete(CategoryNodeClosure).execution_options(synchronize_session=False))
+    db.session.execute(insert(CategoryNodeClosure).from_select(
+        ['ancestor_id', 'descendant_id', 'depth'],
+        select(paths.c.ancestor_id, paths.c.descendant_id, paths.c.depth)
+    ))
+    written = db.session.query(CategoryNodeClosure).count()
+    db.session.commit()
+    logger.info(f"Rebuilt category node closure ({written} rows)")
+    return written
@@ -1,6 +1,7 @@
 """Utility functions for category-based requirement inheritance."""
 from models.object_category_assignment import ObjectCategoryAssignment
 from models.category_node import CategoryNode
+from models.category_node_closure import CategoryNodeClosure
 from models.relation import ObjectRelation
 
 
@@ -37,42 +38,50 @@ def get_inherited_requirements(object_id: int, db_session) -> list:
             })
 
     # --- 2. Inherited via category hierarchy ---
-    assignments = ObjectCategoryAssignment.query.filter_by(object_id=object_id).all()
-    for assignment in assignments:
-        node = assignment.category_node
-        if node is None:
-            continue
+    assignment_node_ids = [
+        row.category_node_id
+        for row in ObjectCategoryAssignment.query
+        .with_entities(ObjectCategoryAssignment.category_node_id)
+        .filter_by(object_id=object_id)
+        .order_by(ObjectCategoryAssignment.id)
+        .all()
+    ]
+    if not assignment_node_ids:
+        return results
+
+    # Ancestor chain per assigned node in one closure lookup: the node itself,
+    # then its ancestors from nearest to root.
+    chains = {}
+    chain_rows = (
+        db_session.query(CategoryNodeClosure.descendant_id, CategoryNode)
+        .join(CategoryNode, CategoryNode.id == CategoryNodeClosure.ancestor_id)
+        .filter(CategoryNodeClosure.descendant_id.in_(assignment_node_ids))
+        .order_by(CategoryNodeClosure.descendant_id, CategoryNodeClosure.depth)
+        .all()
+    )
+    for descendant_id, ancestor in chain_rows:
+        chains.setdefault(descendant_id, []).append(ancestor)
 
-        # Build ancestor chain: node itself, then its ancestors from nearest to root
-        chain = [node] + list(reversed(node.get_ancestors()))
+    # applies_to_category relations carry the category node id in
+    # relation_metadata (source=requirement object); CategoryNode is a separate
+    # table, so target_object_id cannot reference it. Load them once and group
+    # them by node id, keeping their query order.
+    inherited_by_node = {}
+    for rel in ObjectRelation.query.filter_by(relation_type='applies_to_category').all():
+        metadata = rel.relation_metadata or {}
+        inherited_by_node.setdefault(metadata.get('category_node_id'), []).append(rel)
 
-        for ancestor in chain:
-            # Find applies_to_category relations targeting this ancestor node
-            # These are stored in object_relations where target_object_id is the node's
-            # object-system id. Since CategoryNode is a standalone table, we query
-            # ObjectRelation by relation_type and look up via the ancestor id stored
-            # in a convention: source is a requirement object, target is the category node
-            # represented in object_relations by its id as target_object_id.
-            # NOTE: because CategoryNode is a separate table and not an Object, this
-            # query looks for relations where metadata or target carries the category node id.
-            # We store these as: source=requirement_object_id, target=category_node_id
-            # using a dedicated convention in object_relations.relation_metadata.
-            # For now we use a direct filter on category_node_id via source/target pattern.
-            inherited_relations = ObjectRelation.query.filter_by(
-                relation_type='applies_to_category',
-            ).all()
-            for rel in inherited_relations:
-                # The target_object_id encodes the category node id via relation_metadata
-                metadata = rel.relation_metadata or {}
-                if metadata.get('category_node_id') == ancestor.id:
-                    req_obj = rel.source_object
-                    if req_obj and req_obj.id not in seen_requirement_ids:
-                        seen_requirement_ids.add(req_obj.id)
-                        results.append({
-                            'requirement': req_obj,
-                            'inherited': True,
-                            'inherited_from': ancestor,
-                        })
+    for node_id in assignment_node_ids:
+        for ancestor in chains.get(node_id, []):
+            for rel in inherited_by_node.get(ancestor.id, []):
+                req_obj = rel.source_object
+                if req_obj and req_obj.id not in seen_requirement_ids:
+                    seen_requirement_ids.add(req_obj.id)
+                    results.append({
+                        'requirement': req_obj,
+                        'inherited': True,
+                        'inherited_from': ancestor,
+                    })
 
     return results
 
@@ -83,11 +92,13 @@ def get_category_breadcrumb(node_id: int) -> list:
 
     Returns a list of dicts: [{"id", "code", "name", "level"}, ...]
     """
-    node = CategoryNode.query.get(node_id)
-    if node is None:
-        return []
-    ancestors = node.get_ancestors()
-    chain = ancestors + [node]
+    chain = (
+        CategoryNode.query
+        .join(CategoryNodeClosure, CategoryNodeClosure.ancestor_id == CategoryNode.id)
+        .filter(CategoryNodeClosure.descendant_id == node_id)
+        .order_by(CategoryNodeClosure.depth.desc())
+        .all()
+    )
     return [
         {'id': n.id, 'code': n.code, 'name': n.name, 'level': n.level}
         for n in chain
@@ -96,7 +107,8 @@ def get_category_breadcrumb(node_id: int) -> list:
 
 def get_all_descendant_node_ids(node_id: int) -> set:
     """Return set of all descendant CategoryNode IDs for a given node (recursive)."""
-    node = CategoryNode.query.get(node_id)
-    if node is None:
-        return set()
-    return node.get_descendant_ids()
+    rows = CategoryNodeClosure.query.with_entities(CategoryNodeClosure.descendant_id).filter(
+        CategoryNodeClosure.ancestor_id == node_id,
+        CategoryNodeClosure.depth > 0,
+    ).all()
+    return {row.descendant_id for row in rows}
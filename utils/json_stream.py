@@ -0,0 +1,115 @@
+"""
+Incremental JSON encoding for large tree responses.
+
+jsonify encodes the whole structure into one string before the first byte is
+sent. stream_json_response walks lists and the 'children' of nodes instead and
+sends the body in chunks of about STREAM_CHUNK_SIZE bytes; everything else in a
+node (data, files, ...) is encoded in one call with the app's JSON provider,
+with the same settings jsonify uses. The body is byte for byte what jsonify
+would return.
+
+Arrays may also be given as iterators, so a caller can build one subtree at a
+time while the previous one is already on its way. The first chunk is encoded
+before the response is created, so an error there is still the caller's 500;
+callers build their first subtree up front for the same reason. A later error
+cannot change the status any more; the stream is then aborted instead of
+ending a 200 with a truncated document.
+"""
+from collections.abc import Iterator
+from functools import partial
+import itertools
+import logging
+
+from flask import current_app, jsonify, stream_with_context
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAMED_NODE_KEY = 'children'
+
+
+def _iter_json(value, dumps, sort_keys):
+    if isinstance(value, (list, Iterator)):
+        yield '['
+        for index, item in enumerate(value):
+            if index:
+                yield ','
+            yield from _iter_json(item, dumps, sort_keys)
+        yield ']'
+        return
+
+    if (
+        isinstance(value, dict)
+        and isinstance(value.get(STREAMED_NODE_KEY), (list, Iterator))
+        and all(isinstance(key, str) for key in value)
+    ):
+        # Encode the keys around 'children' in one call each and stream the children in between.
+        keys = sorted(value) if sort_keys else list(value)
+        position = keys.index(STREAMED_NODE_KEY)
+        head = dumps({key: value[key] for key in keys[:position]})[1:-1]
+        tail = dumps({key: value[key] for key in keys[position + 1:]})[1:-1]
+        yield '{' + head + (',' if head else '') + dumps(STREAMED_NODE_KEY) + ':'
+        yield from _iter_json(value[STREAMED_NODE_KEY], dumps, sort_keys)
+        yield (',' + tail if tail else '') + '}'
+        return
+
+    yield dumps(value)
+
+
+def iter_json_chunks(value, dumps, sort_keys=True, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield the compact JSON of value (plus jsonify's trailing newline) in chunks of about chunk_size."""
+    buffer = []
+    buffered = 0
+    for piece in _iter_json(value, dumps, sort_keys):
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield ''.join(buffer)
+            buffer = []
+            buffered = 0
+    buffer.append('\n')
+    yield ''.join(buffer)
+
+
+def stream_json_response(value, on_complete=None, collect_limit=None):
+    """
+    Return a response streaming value as JSON, identical to jsonify(value).
+
+    Errors in the first chunk are raised here. on_complete(body) receives the
+    encoded body (bytes) once all of it has been sent, unless it grew beyond
+    collect_limit bytes or the stream failed. When the app pretty-prints JSON
+    (debug mode) the response is built with jsonify instead.
+    """
+    provider = current_app.json
+    compact = getattr(provider, 'compact', None)
+    if compact is False or (compact is None and current_app.debug):
+        response = jsonify(list(value) if isinstance(value, Iterator) else value)
+        if on_complete is not None:
+            on_complete(response.get_data())
+        return response
+
+    dumps = partial(provider.dumps, separators=(',', ':'))
+    sort_keys = getattr(provider, 'sort_keys', True)
+
+    chunks = iter_json_chunks(value, dumps, sort_keys, STREAM_CHUNK_SIZE)
+    first_chunk = next(chunks)
+
+    def generate():
+        collected = [] if on_complete is not None else None
+        collected_size = 0
+        try:
+            for chunk in itertools.chain([first_chunk], chunks):
+                if collected is not None:
+                    collected.append(chunk)
+                    collected_size += len(chunk)
+                    if collect_limit is not None and collected_size > collect_limit:
+                        collected = None
+                yield chunk
+        except Exception as e:
+            # Headers are already sent; abort the connection so the client sees a failed download.
+            logger.error(f"Error streaming JSON response: {str(e)}")
+            raise
+        if collected is not None:
+            on_complete(''.join(collected).encode('utf-8'))
+
+    return current_app.response_class(stream_with_context(generate()), mimetype=provider.mimetype)
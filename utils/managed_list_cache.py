@@ -0,0 +1,190 @@
+"""
+Process-wide cache of managed-list lookups.
+
+Tree labels, facets, search documents and multi-select saves all resolve
+managed-list item ids to labels and parent paths. Each list is loaded once
+per worker into a ManagedListLookup and reused until the list's own version
+counter ('managed_list:<id>') changes. The session listeners below bump that
+counter in any transaction that creates, updates, moves or deletes items of
+the list (or the list itself); the versions of all lists are read once per
+request.
+
+Lists written in the current transaction are never served from or stored in
+the shared cache: they are loaded from the session, so uncommitted rows
+cannot leak to other requests.
+"""
+from itertools import chain
+import threading
+
+from flask import g, has_request_context
+from sqlalchemy import event, inspect
+
+from models import db, CacheVersion, ManagedList, ManagedListItem
+from utils.cache_versions import bump_cache_version
+
+MANAGED_LIST_VERSION_SCOPE_PREFIX = 'managed_list:'
+PENDING_MANAGED_LIST_IDS_KEY = 'managed_list_cache_ids'
+
+_lock = threading.Lock()
+_lookups = {}
+
+
+def get_managed_list_version_scope(list_id):
+    return f'{MANAGED_LIST_VERSION_SCOPE_PREFIX}{int(list_id)}'
+
+
+class CachedListItem:
+    """Detached copy of the ManagedListItem columns used for labels and paths."""
+
+    __slots__ = ('id', 'parent_item_id', 'value', 'label', 'value_translations')
+
+    resolve_display_value = ManagedListItem.resolve_display_value
+
+    def __init__(self, item):
+        self.id = int(item.id)
+        self.parent_item_id = int(item.parent_item_id or 0) or None
+        self.value = item.value
+        self.label = item.label
+        self.value_translations = dict(item.value_translations or {})
+
+
+class ManagedListLookup:
+    """
+    Items of one list by id and value, with label paths memoized per locale.
+
+    by_id holds {'label', 'parent_item_id'} per item with a label (default
+    display value); by_value maps stored values to item ids.
+    """
+
+    def __init__(self, list_id, version, items):
+        self.list_id = list_id
+        self.version = version
+        self.items = {}
+        self.by_id = {}
+        self.by_value = {}
+        self._path_payloads = {}
+        for item in items:
+            cached_item = CachedListItem(item)
+            self.items[cached_item.id] = cached_item
+            label = str(cached_item.resolve_display_value() or cached_item.label or cached_item.value or '').strip()
+            value_key = str(cached_item.value or '').strip()
+            if cached_item.id > 0 and label:
+                self.by_id[cached_item.id] = {
+                    'label': label,
+                    'parent_item_id': cached_item.parent_item_id
+                }
+            if value_key and label:
+                self.by_value[value_key] = cached_item.id
+
+    def get_path_payload(self, item_id, locale=None, fallback_language_code=None):
+        """
+        Return {'selected_id', 'label', 'path_ids', 'path'} for item_id, root first.
+
+        None if the item is not in this list or its parent chain leaves it;
+        callers then resolve the path from the database.
+        """
+        cache_key = (item_id, locale, fallback_language_code)
+        path = self._path_payloads.get(cache_key)
+        if path is None:
+            if item_id not in self.items:
+                return None
+            chain_entries = []
+            visited = set()
+            current = self.items[item_id]
+            while current and current.id not in visited:
+                visited.add(current.id)
+                chain_entries.append((
+                    current.id,
+                    str(current.resolve_display_value(locale=locale, fallback_language_code=fallback_language_code) or current.value or '').strip()
+                ))
+                if not current.parent_item_id:
+                    break
+                current = self.items.get(current.parent_item_id)
+                if current is None:
+                    return None
+            path = tuple(reversed(chain_entries))
+            self._path_payloads[cache_key] = path
+        return {
+            'selected_id': item_id,
+            'label': path[-1][1],
+            'path_ids': [entry_id for entry_id, _ in path],
+            'path': [label for _, label in path]
+        }
+
+
+def _get_managed_list_versions():
+    """Return {list_id: version} for lists that were ever bumped, read once per request."""
+    versions = g.get('_managed_list_versions')
+    if versions is None:
+        rows = db.session.query(CacheVersion.scope, CacheVersion.version).filter(
+            CacheVersion.scope.like(f'{MANAGED_LIST_VERSION_SCOPE_PREFIX}%')
+        ).all()
+        versions = {}
+        for scope, version in rows:
+            suffix = scope[len(MANAGED_LIST_VERSION_SCOPE_PREFIX):]
+            if suffix.isdigit():
+                versions[int(suffix)] = int(version or 0)
+        g._managed_list_versions = versions
+    return versions
+
+
+def get_managed_list_version(list_id):
+    """Return the committed version of a list (0 if never bumped); versions are read once per request."""
+    return _get_managed_list_versions().get(list_id, 0)
+
+
+def _load_lookup(list_id, version):
+    items = ManagedListItem.query.filter_by(list_id=list_id).all()
+    return ManagedListLookup(list_id, version, items)
+
+
+def get_shared_managed_list_lookup(list_id):
+    """Return the ManagedListLookup for list_id, loading it when missing or stale."""
+    pending_ids = db.session.info.get(PENDING_MANAGED_LIST_IDS_KEY)
+    if not has_request_context() or (pending_ids and list_id in pending_ids):
+        return _load_lookup(list_id, None)
+
+    version = get_managed_list_version(list_id)
+    with _lock:
+        lookup = _lookups.get(list_id)
+    if lookup is not None and lookup.version == version:
+        return lookup
+
+    lookup = _load_lookup(list_id, version)
+    with _lock:
+        _lookups[list_id] = lookup
+    return lookup
+
+
+def _item_list_ids(item):
+    list_ids = {item.list_id}
+    list_ids.update(inspect(item).attrs.list_id.history.deleted or ())
+    list_ids.discard(None)
+    return list_ids
+
+
+@event.listens_for(db.session, 'after_flush')
+def _collect_managed_list_changes(session, flush_context):
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, ManagedListItem):
+            session.info.setdefault(PENDING_MANAGED_LIST_IDS_KEY, set()).update(_item_list_ids(instance))
+        elif isinstance(instance, ManagedList) and instance.id is not None:
+            session.info.setdefault(PENDING_MANAGED_LIST_IDS_KEY, set()).add(instance.id)
+
+
+@event.listens_for(db.session, 'before_commit')
+def _bump_managed_list_versions_before_commit(session):
+    for list_id in sorted(session.info.get(PENDING_MANAGED_LIST_IDS_KEY) or ()):
+        bump_cache_version(get_managed_list_version_scope(list_id))
+    if has_request_context():
+        g.pop('_managed_list_versions', None)
+
+
+@event.listens_for(db.session, 'after_commit')
+def _clear_managed_list_changes(session):
+    session.info.pop(PENDING_MANAGED_LIST_IDS_KEY, None)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_managed_list_changes(session):
+    session.info.pop(PENDING_MANAGED_LIST_IDS_KEY, None)
@@ -0,0 +1,208 @@
+"""
+Optional in-process inverted index for /api/search on SQLite without FTS5.
+
+The index mirrors object_search_documents: per object its type and
+(field_id, content) entries, plus postings from every content trigram to the
+objects containing it. A query intersects the postings of its trigrams and
+verifies the substring on the few candidates, instead of scanning every row.
+
+It is built lazily on the first search. Commits that rewrite search documents
+bump the 'search_documents' version and hand their new rows to the
+after_commit listener in models/object_search_document.py, which applies them
+here. A worker that sees a version it did not apply itself rebuilds.
+"""
+from datetime import datetime
+import sys
+import threading
+import time
+
+from flask import current_app, has_app_context
+
+from models import db, ObjectSearchDocument
+from utils.cache_versions import get_cache_version, bump_cache_version
+
+SEARCH_DOCUMENTS_VERSION_SCOPE = 'search_documents'
+PENDING_MEMORY_UPDATES_KEY = 'memory_search_updates'
+TRIGRAM_LENGTH = 3
+
+
+def iter_trigrams(content):
+    for start in range(len(content) - TRIGRAM_LENGTH + 1):
+        yield content[start:start + TRIGRAM_LENGTH]
+
+
+class MemorySearchIndex:
+    """Trigram postings over the search documents of one worker."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.documents = {}
+        self.postings = {}
+        self.build_seconds = None
+        self.built_at = None
+
+    def _add(self, object_id, object_type_id, entries):
+        if not entries:
+            return
+        self.documents[object_id] = (object_type_id, tuple(entries))
+        for _, content in entries:
+            for trigram in iter_trigrams(content):
+                self.postings.setdefault(trigram, set()).add(object_id)
+
+    def _remove(self, object_id):
+        document = self.documents.pop(object_id, None)
+        if document is None:
+            return
+        for _, content in document[1]:
+            for trigram in iter_trigrams(content):
+                object_ids = self.postings.get(trigram)
+                if object_ids is None:
+                    continue
+                object_ids.discard(object_id)
+                if not object_ids:
+                    del self.postings[trigram]
+
+    def build(self, version):
+        started = time.perf_counter()
+        rows = db.session.query(
+            ObjectSearchDocument.object_id,
+            ObjectSearchDocument.object_type_id,
+            ObjectSearchDocument.field_id,
+            ObjectSearchDocument.content
+        ).order_by(ObjectSearchDocument.object_id, ObjectSearchDocument.id).all()
+
+        grouped = {}
+        for object_id, object_type_id, field_id, content in rows:
+            grouped.setdefault(object_id, (object_type_id, []))[1].append((field_id, content))
+
+        with self.lock:
+            self.documents = {}
+            self.postings = {}
+            for object_id, (object_type_id, entries) in grouped.items():
+                self._add(object_id, object_type_id, entries)
+            self.version = version
+            self.build_seconds = time.perf_counter() - started
+            self.built_at = datetime.utcnow()
+
+    def apply(self, documents_by_object, version):
+        """Apply the documents written by one commit (None removes an object)."""
+        with self.lock:
+            if self.version is None or self.version != version - 1:
+                # Another worker committed in between; rebuild on next use.
+                self.version = None
+                return
+            for object_id, document in documents_by_object.items():
+                self._remove(object_id)
+                if document is not None:
+                    self._add(object_id, document[0], document[1])
+            self.version = version
+
+    def search(self, search, object_type_id=None, field_ids=None):
+        """Return ids (ascending) of objects with a document containing search."""
+        allowed_fields = set(field_ids) if field_ids is not None else None
+        with self.lock:
+            if len(search) >= TRIGRAM_LENGTH:
+                postings = []
+                for trigram in set(iter_trigrams(search)):
+                    object_ids = self.postings.get(trigram)
+                    if not object_ids:
+                        return []
+                    postings.append(object_ids)
+                postings.sort(key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+            else:
+                candidates = self.documents.keys()
+
+            matches = []
+            for object_id in candidates:
+                document_type_id, entries = self.documents[object_id]
+                if object_type_id is not None and document_type_id != object_type_id:
+                    continue
+                for field_id, content in entries:
+                    if field_id is not None and allowed_fields is not None and field_id not in allowed_fields:
+                        continue
+                    if search in content:
+                        matches.append(object_id)
+                        break
+        return sorted(matches)
+
+    def memory_bytes(self):
+        """Approximate deep size of the index structures."""
+        size = sys.getsizeof(self.documents) + sys.getsizeof(self.postings)
+        for document in self.documents.values():
+            size += sys.getsizeof(document) + sys.getsizeof(document[1])
+            for entry in document[1]:
+                size += sys.getsizeof(entry) + sys.getsizeof(entry[1])
+        for trigram, object_ids in self.postings.items():
+            size += sys.getsizeof(trigram) + sys.getsizeof(object_ids)
+        return size
+
+    def stats(self):
+        with self.lock:
+            return {
+                'built': self.version is not None,
+                'version': self.version,
+                'objects': len(self.documents),
+                'documents': sum(len(document[1]) for document in self.documents.values()),
+                'trigrams': len(self.postings),
+                'postings': sum(len(object_ids) for object_ids in self.postings.values()),
+                'memory_bytes': self.memory_bytes(),
+                'build_seconds': round(self.build_seconds, 4) if self.build_seconds is not None else None,
+                'built_at': self.built_at.isoformat() if self.built_at else None
+            }
+
+
+_index = MemorySearchIndex()
+
+
+def is_memory_search_index_enabled():
+    if not has_app_context():
+        return False
+    mode = str(current_app.config.get('SEARCH_MEMORY_INDEX') or 'auto').lower()
+    if mode == 'off' or db.session.get_bind().dialect.name != 'sqlite':
+        return False
+    if mode == 'on':
+        return True
+    from utils.search_index import has_fts_table
+    return not has_fts_table()
+
+
+def get_memory_search_index():
+    """Return the up-to-date index, building it if needed, or None when disabled."""
+    if not is_memory_search_index_enabled():
+        return None
+    version = get_cache_version(SEARCH_DOCUMENTS_VERSION_SCOPE)
+    if _index.version != version:
+        _index.build(version)
+    return _index
+
+
+def rebuild_memory_search_index():
+    _index.build(get_cache_version(SEARCH_DOCUMENTS_VERSION_SCOPE))
+    return _index
+
+
+def get_memory_search_index_stats():
+    return {'enabled': is_memory_search_index_enabled(), **_index.stats()}
+
+
+def record_search_document_changes(session, documents_by_object):
+    """Bump the documents version and queue this transaction's rows for after_commit."""
+    if not documents_by_object or not is_memory_search_index_enabled():
+        return
+    bump_cache_version(SEARCH_DOCUMENTS_VERSION_SCOPE)
+    version = get_cache_version(SEARCH_DOCUMENTS_VERSION_SCOPE)
+    session.info[PENDING_MEMORY_UPDATES_KEY] = (version, documents_by_object)
+
+
+def apply_committed_search_document_changes(session):
+    pending = session.info.pop(PENDING_MEMORY_UPDATES_KEY, None)
+    if pending is None:
+        return
+    version, documents_by_object = pending
+    _index.apply(documents_by_object, version)
+
+
+def discard_search_document_changes(session):
+    session.info.pop(PENDING_MEMORY_UPDATES_KEY, None)
@@ -0,0 +1,196 @@
+"""
+Facet counts for object result sets.
+
+Counts are GROUP BY queries over a subquery of matching object ids, so the
+caller never loads the result set to count it. Each facet returns at most
+`limit` values, most frequent first, and says whether values were cut off.
+"""
+from sqlalchemy import case, func, literal, true
+
+from models import db, Object, ObjectType, ObjectField, ObjectData
+from utils.schema_cache import get_schema, parse_field_options
+
+DEFAULT_FACET_LIMIT = 20
+MAX_FACET_LIMIT = 100
+BUILTIN_FACETS = ('object_type', 'status')
+
+
+def parse_facet_args(args):
+    """
+    Read ?facets= and ?facet_limit= from request args.
+
+    ``facets=true`` selects the built-in facets plus every managed-list field
+    of the filtered type; ``facets=object_type,status,<field_name>`` selects
+    explicitly. Returns (facet_keys or None, limit); None means no facets.
+    """
+    raw = str(args.get('facets') or '').strip()
+    if not raw or raw.lower() in ('false', '0', 'no'):
+        return None, DEFAULT_FACET_LIMIT
+
+    try:
+        limit = int(args.get('facet_limit') or DEFAULT_FACET_LIMIT)
+    except (TypeError, ValueError):
+        raise ValueError('facet_limit must be an integer')
+    limit = min(max(limit, 1), MAX_FACET_LIMIT)
+
+    if raw.lower() in ('true', '1', 'yes', 'all'):
+        return [], limit
+    return [key.strip() for key in raw.split(',') if key.strip()], limit
+
+
+def get_field_options(field):
+    # SchemaField carries parsed options; ORM fields are parsed here.
+    options = getattr(field, 'options', None)
+    return options if isinstance(options, dict) else (parse_field_options(field.field_options) or {})
+
+
+def is_managed_list_field(field):
+    options = get_field_options(field)
+    if not options.get('list_id'):
+        return False
+    source = str(options.get('source') or '').strip().lower()
+    return source == 'managed_list' or str(field.field_type or '').lower() in ('select', 'tag')
+
+
+def get_managed_list_facet_fields(object_type_id=None, field_names=None):
+    """Return {field_name: [fields]} for managed-list fields of a type (or named fields of any type)."""
+    schema = get_schema()
+    if schema is not None:
+        fields = list(schema.fields_by_id.values())
+    else:
+        fields = ObjectField.query.all()
+
+    wanted = {name.lower() for name in field_names} if field_names is not None else None
+    by_name = {}
+    for field in fields:
+        if object_type_id is not None and field.object_type_id != object_type_id:
+            continue
+        if wanted is not None and str(field.field_name or '').lower() not in wanted:
+            continue
+        if not is_managed_list_field(field):
+            continue
+        by_name.setdefault(field.field_name, []).append(field)
+    return by_name
+
+
+def _capped(values, limit):
+    values = sorted(values, key=lambda item: (-item['count'], str(item['value'])))
+    return {'values': values[:limit], 'truncated': len(values) > limit}
+
+
+def count_object_types(object_ids, limit):
+    rows = db.session.query(
+        ObjectType.id, ObjectType.name, func.count(Object.id)
+    ).join(
+        Object, Object.object_type_id == ObjectType.id
+    ).filter(
+        Object.id.in_(object_ids)
+    ).group_by(ObjectType.id, ObjectType.name).order_by(func.count(Object.id).desc()).limit(limit + 1).all()
+    return _capped([
+        {'value': type_name, 'id': type_id, 'count': count}
+        for type_id, type_name, count in rows
+    ], limit)
+
+
+def count_statuses(object_ids, limit):
+    rows = db.session.query(
+        Object.status, func.count(Object.id)
+    ).filter(
+        Object.id.in_(object_ids)
+    ).group_by(Object.status).order_by(func.count(Object.id).desc()).limit(limit + 1).all()
+    return _capped([{'value': status, 'count': count} for status, count in rows], limit)
+
+
+def _get_field_list_id(field):
+    try:
+        return int(get_field_options(field).get('list_id') or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _split_stored_items():
+    """Table-valued split of object_data.value_text on commas, one 'value' row per stored item."""
+    if db.session.get_bind().dialect.name == 'postgresql':
+        return func.unnest(func.string_to_array(ObjectData.value_text, ',')).table_valued('value').render_derived()
+
+    # SQLite has no split function: the text is rewritten as a JSON array for
+    # json_each. Text that still is not valid JSON (control characters) is
+    # one item, as it would never be a list of item ids.
+    escaped = func.replace(func.replace(ObjectData.value_text, '\\', '\\\\'), '"', '\\"', type_=db.Text)
+    as_array = literal('["', db.Text) + func.replace(escaped, ',', '","', type_=db.Text) + '"]'
+    return func.json_each(
+        case((func.json_valid(as_array) == 1, as_array), else_=func.json_array(ObjectData.value_text))
+    ).table_valued('value')
+
+
+def count_managed_list_values(object_ids, fields, limit, managed_list_cache):
+    """
+    Count objects per managed-list item of fields (same field name, possibly several types).
+
+    Multi-select values are stored as comma-separated item ids; they are
+    split in SQL, so grouping, ordering and the limit all happen there and
+    only the returned items are resolved to labels.
+    """
+    from routes.objects import resolve_managed_list_path
+
+    items = _split_stored_items()
+    list_id = case(
+        {field.id: _get_field_list_id(field) for field in fields},
+        value=ObjectData.field_id,
+        else_=0
+    )
+    item_value = func.trim(items.c.value)
+    object_count = func.count(ObjectData.object_id.distinct())
+    rows = db.session.query(
+        list_id, item_value, object_count
+    ).select_from(ObjectData).join(
+        items, true()
+    ).filter(
+        ObjectData.field_id.in_([field.id for field in fields]),
+        ObjectData.object_id.in_(object_ids),
+        ObjectData.value_text.isnot(None),
+        item_value != ''
+    ).group_by(list_id, item_value).order_by(object_count.desc(), item_value.asc()).limit(limit + 1).all()
+
+    values = []
+    for row_list_id, stored_value, count in rows:
+        path = resolve_managed_list_path(stored_value, row_list_id, managed_list_cache)
+        values.append({
+            'value': stored_value,
+            'label': ' > '.join(path) if path else stored_value,
+            'count': count
+        })
+    return _capped(values, limit)
+
+
+def build_object_facets(object_ids, facet_keys=None, limit=DEFAULT_FACET_LIMIT, object_type_id=None):
+    """
+    Return {facet_key: {'values': [...], 'truncated': bool}} for the objects selected by object_ids.
+
+    object_ids is a SELECT of Object ids (the filtered, unpaginated result
+    set). facet_keys None/[] means the built-in facets plus the managed-list
+    fields of object_type_id.
+    """
+    facet_keys = list(facet_keys or [])
+    if not facet_keys:
+        builtin_keys = list(BUILTIN_FACETS)
+        field_names = None if object_type_id is not None else []
+    else:
+        builtin_keys = [key for key in facet_keys if key in BUILTIN_FACETS]
+        field_names = [key for key in facet_keys if key not in BUILTIN_FACETS]
+
+    facets = {}
+    if 'object_type' in builtin_keys:
+        facets['object_type'] = count_object_types(object_ids, limit)
+    if 'status' in builtin_keys:
+        facets['status'] = count_statuses(object_ids, limit)
+
+    if field_names is None or field_names:
+        managed_list_cache = {}
+        fields_by_name = get_managed_list_facet_fields(
+            object_type_id if field_names is None else None,
+            field_names
+        )
+        for field_name, fields in fields_by_name.items():
+            facets[field_name] = count_managed_list_values(object_ids, fields, limit, managed_list_cache)
+    return facets
@@ -0,0 +1,64 @@
+"""
+Object summaries for GET /api/objects/summaries.
+
+Display name, short description, requirement text, file count and relation /
+instance counts are derived from EAV rows, HTML and related objects. The
+display name follows the same rule and per-type tree name field as the object
+tree. They are computed when they are read, for one page of objects at a time
+in a fixed number of queries, so writes pay nothing for them.
+"""
+from sqlalchemy import func
+
+from models import db, ObjectRelation, Instance
+
+
+def _count_by(column, object_ids):
+    return dict(
+        db.session.query(column, func.count())
+        .filter(column.in_(object_ids))
+        .group_by(column)
+        .all()
+    )
+
+
+def build_object_summaries(objects):
+    """Return the summary payload of each object, in order, in a fixed number of queries."""
+    from routes.objects import (
+        build_files_lookup,
+        get_display_name,
+        get_tree_requirement_text,
+        get_tree_short_description,
+        load_tree_view_config
+    )
+
+    object_ids = [obj.id for obj in objects]
+    if not object_ids:
+        return []
+
+    files_lookup = build_files_lookup(object_ids)
+    view_config = load_tree_view_config({obj.object_type_id for obj in objects})
+    outgoing_counts = _count_by(ObjectRelation.source_object_id, object_ids)
+    incoming_counts = _count_by(ObjectRelation.target_object_id, object_ids)
+    child_counts = _count_by(Instance.parent_object_id, object_ids)
+    parent_counts = _count_by(Instance.child_object_id, object_ids)
+
+    summaries = []
+    for obj in objects:
+        type_name = obj.object_type.name if obj.object_type else None
+        file_count = len(files_lookup.get(obj.id, []))
+        summaries.append({
+            'object_id': obj.id,
+            'object_type_id': obj.object_type_id,
+            'id_full': obj.id_full,
+            'display_name': get_display_name(obj, type_name, view_config),
+            'short_description': get_tree_short_description(obj),
+            'requirement_text': get_tree_requirement_text(obj),
+            'file_count': file_count,
+            'has_files': bool(file_count),
+            'outgoing_relation_count': outgoing_counts.get(obj.id, 0),
+            'incoming_relation_count': incoming_counts.get(obj.id, 0),
+            'child_instance_count': child_counts.get(obj.id, 0),
+            'parent_instance_count': parent_counts.get(obj.id, 0),
+            'updated_at': obj.updated_at.isoformat() if obj.updated_at else None
+        })
+    return summaries
@@ -0,0 +1,272 @@
+"""
+In-process cache of schema metadata (object types, fields, templates, bindings).
+
+Every hot read path (object serialization, tree building, validation, list-view
+config) needs the same small set of schema rows. They are loaded once per
+worker into a read-only snapshot and reused until the shared 'schema' version
+counter changes. Admin routes that write schema call bump_schema_version()
+before committing; other workers notice the new version on their next request
+with a single primary-key lookup.
+"""
+from copy import deepcopy
+import json
+import threading
+
+from flask import g, has_request_context
+
+from models import db, ObjectType, ObjectField, FieldTemplate, FieldListBinding
+from utils.auto_id_generator import resolve_object_type_prefix, peek_next_base_number
+from utils.cache_versions import get_cache_version, bump_cache_version
+
+SCHEMA_VERSION_SCOPE = 'schema'
+
+_lock = threading.Lock()
+_state = {'snapshot': None}
+
+
+def parse_field_options(raw_options):
+    if not raw_options:
+        return None
+    if isinstance(raw_options, dict):
+        return raw_options
+    if not isinstance(raw_options, str):
+        return None
+    try:
+        parsed = json.loads(raw_options)
+    except (TypeError, ValueError):
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _decode_number(object_data):
+    return float(object_data.value_number) if object_data.value_number is not None else None
+
+
+def _decode_date(object_data):
+    return object_data.value_date.isoformat() if object_data.value_date else None
+
+
+def _decode_boolean(object_data):
+    return object_data.value_boolean
+
+
+def _decode_value(object_data):
+    return object_data.value_json if object_data.value_json is not None else object_data.value_text
+
+
+FIELD_VALUE_DECODERS = {
+    'number': _decode_number,
+    'date': _decode_date,
+    'boolean': _decode_boolean,
+}
+
+
+def get_field_value_decoder(field_type):
+    """Return the ObjectData -> value converter for a field type."""
+    return FIELD_VALUE_DECODERS.get(field_type, _decode_value)
+
+
+def compile_field_decoder(fields):
+    """Map field_id to (field_name, converter) so decoding a row is one dict lookup."""
+    return {
+        field.id: (field.field_name, get_field_value_decoder(field.field_type))
+        for field in fields
+    }
+
+
+class SchemaTemplate:
+    """Read-only copy of the FieldTemplate attributes used on read paths."""
+    __slots__ = ('id', 'template_name', 'field_name', 'display_name', 'display_name_translations')
+
+    def __init__(self, template):
+        self.id = template.id
+        self.template_name = template.template_name
+        self.field_name = template.field_name
+        self.display_name = template.display_name
+        self.display_name_translations = deepcopy(template.display_name_translations)
+
+
+class SchemaField:
+    """Read-only copy of an ObjectField, attribute-compatible with the model for reads."""
+    __slots__ = (
+        'id', 'object_type_id', 'field_template_id', 'field_template', 'field_name', 'display_name',
+        'field_type', 'field_options', 'options', 'is_required', 'lock_required_setting',
+        'force_presence_on_all_objects', 'is_table_visible', 'is_detail_visible', 'is_tree_visible',
+        'help_text', 'display_order', 'detail_width', 'created_at'
+    )
+
+    def __init__(self, field, template=None):
+        self.id = field.id
+        self.object_type_id = field.object_type_id
+        self.field_template_id = field.field_template_id
+        self.field_template = template
+        self.field_name = field.field_name
+        self.display_name = field.display_name
+        self.field_type = field.field_type
+        self.field_options = deepcopy(field.field_options)
+        # Parsed once here instead of on every validation/display call.
+        self.options = parse_field_options(self.field_options)
+        self.is_required = field.is_required
+        self.lock_required_setting = field.lock_required_setting
+        self.force_presence_on_all_objects = field.force_presence_on_all_objects
+        self.is_table_visible = field.is_table_visible
+        self.is_detail_visible = field.is_detail_visible
+        self.is_tree_visible = field.is_tree_visible
+        self.help_text = field.help_text
+        self.display_order = field.display_order
+        self.detail_width = field.detail_width
+        self.created_at = field.created_at
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'object_type_id': self.object_type_id,
+            'field_template_id': self.field_template_id,
+            'field_template_name': self.field_template.template_name if self.field_template else None,
+            'field_name': self.field_name,
+            'display_name': self.display_name,
+            'field_type': self.field_type,
+            'field_options': deepcopy(self.field_options),
+            'is_required': self.is_required,
+            'lock_required_setting': bool(self.lock_required_setting),
+            'force_presence_on_all_objects': bool(self.force_presence_on_all_objects),
+            'is_table_visible': self.is_table_visible,
+            'is_detail_visible': bool(self.is_detail_visible),
+            'is_tree_visible': bool(self.is_tree_visible),
+            'help_text': self.help_text,
+            'display_order': self.display_order,
+            'detail_width': self.detail_width,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
+class SchemaType:
+    """Read-only copy of an ObjectType with its fields."""
+    __slots__ = (
+        'id', 'name', 'description', 'icon', 'id_prefix', 'color', 'created_at', 'is_system', 'fields',
+        'field_decoder'
+    )
+
+    def __init__(self, object_type, fields):
+        self.id = object_type.id
+        self.name = object_type.name
+        self.description = object_type.description
+        self.icon = object_type.icon
+        self.id_prefix = object_type.id_prefix
+        self.color = object_type.color
+        self.created_at = object_type.created_at
+        self.is_system = object_type.is_system
+        self.fields = fields
+        self.field_decoder = compile_field_decoder(fields)
+
+    def resolve_id_prefix(self):
+        return resolve_object_type_prefix(self.name, self.id_prefix)
+
+    def to_dict(self, include_fields=False):
+        result = {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'icon': self.icon,
+            'id_prefix': self.id_prefix,
+            # Data-dependent, so read live (peeked once per session).
+            'next_base_id_number': peek_next_base_number(self.resolve_id_prefix()),
+            'color': self.color,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'is_system': self.is_system
+        }
+        if include_fields:
+            result['fields'] = [field.to_dict() for field in sorted(self.fields, key=lambda f: f.display_order or 999)]
+        return result
+
+
+class SchemaSnapshot:
+    """All schema metadata for one schema version."""
+
+    def __init__(self, version, object_types, fields, templates, bindings):
+        self.version = version
+        self.templates_by_id = {template.id: SchemaTemplate(template) for template in templates}
+
+        self.fields_by_id = {}
+        self.fields_by_type = {}
+        for field in sorted(fields, key=lambda item: item.id):
+            schema_field = SchemaField(field, self.templates_by_id.get(field.field_template_id))
+            self.fields_by_id[schema_field.id] = schema_field
+            self.fields_by_type.setdefault(schema_field.object_type_id, []).append(schema_field)
+        # Covers rows whose field belongs to another type (e.g. after a type change).
+        self.field_decoder = compile_field_decoder(self.fields_by_id.values())
+
+        self.types_by_id = {}
+        self.types_by_name = {}
+        for object_type in sorted(object_types, key=lambda item: item.id):
+            schema_type = SchemaType(object_type, self.fields_by_type.get(object_type.id, []))
+            self.types_by_id[schema_type.id] = schema_type
+            self.types_by_name[schema_type.name] = schema_type
+
+        self.bindings = [binding.to_dict() for binding in bindings]
+        self.bindings_by_field = {
+            (str(binding['object_type'] or '').strip().lower(), str(binding['field_name'] or '').strip().lower()): binding
+            for binding in self.bindings
+        }
+
+    def get_field_decoder(self, object_type_id):
+        schema_type = self.types_by_id.get(object_type_id)
+        return schema_type.field_decoder if schema_type is not None else self.field_decoder
+
+    @classmethod
+    def load(cls, version):
+        return cls(
+            version,
+            ObjectType.query.all(),
+            ObjectField.query.all(),
+            FieldTemplate.query.all(),
+            FieldListBinding.query.all()
+        )
+
+
+def get_schema():
+    """
+    Return the current SchemaSnapshot, or None when the cache must not be used.
+
+    The version is checked once per request. Outside requests (migrations, CLI)
+    and after the current request has bumped the schema, None is returned and
+    callers read the ORM models directly.
+    """
+    if not has_request_context() or g.get('_schema_cache_bypass'):
+        return None
+
+    snapshot = g.get('_schema_snapshot')
+    if snapshot is not None:
+        return snapshot
+
+    # Read the version before the rows: a concurrent bump then at worst makes
+    # this snapshot look older than its contents, never newer.
+    version = get_cache_version(SCHEMA_VERSION_SCOPE)
+    with _lock:
+        snapshot = _state['snapshot']
+    if snapshot is None or snapshot.version != version:
+        snapshot = SchemaSnapshot.load(version)
+        with _lock:
+            _state['snapshot'] = snapshot
+
+    g._schema_snapshot = snapshot
+    return snapshot
+
+
+def bump_schema_version():
+    """Invalidate cached schema in all workers once the current transaction commits."""
+    bump_cache_version(SCHEMA_VERSION_SCOPE)
+    if has_request_context():
+        g._schema_cache_bypass = True
+        g.pop('_schema_snapshot', None)
+
+
+def get_object_type_fields(object_type):
+    """Return the fields of object_type from the schema cache, falling back to the ORM."""
+    if object_type is None:
+        return []
+    schema = get_schema()
+    if schema is not None and object_type.id in schema.types_by_id:
+        return schema.types_by_id[object_type.id].fields
+    return object_type.fields or []
+
@@ -0,0 +1,420 @@
+"""
+Full-text index over object identifiers and textual field values.
+
+Every id_full/main_id and the displayed text of every non-empty value
+(managed-list labels, rich text without HTML, names in relation_list fields)
+is stored lower-cased as one row in object_search_documents, kept in sync by
+the session listeners in models/object_search_document.py. The
+dialect-specific index over that table is created by
+migrations/add_object_search_index.py:
+
+* SQLite: an external-content FTS5 table with the trigram tokenizer, so a
+  MATCH keeps the substring semantics of the old in-Python scan. Queries
+  shorter than a trigram fall back to instr() on the document table.
+* PostgreSQL: a pg_trgm GIN index on content serving LIKE '%...%', so both
+  dialects return the same substring matches; ranked by trigram similarity.
+* SQLite without FTS5 (or SEARCH_MEMORY_INDEX=on): the in-process trigram
+  index in utils/memory_search_index.py.
+
+The object picker typeahead uses the smaller object_suggest_terms table
+(id_full, main_id and name per object), written in the same pass. Prefix
+matches are range scans on its B-tree index; substring matches use a
+trigram index (FTS5 trigram on SQLite, pg_trgm on PostgreSQL) created by
+migrations/add_object_suggest_index.py.
+"""
+import json
+import logging
+
+from sqlalchemy import column, func, literal, literal_column, or_, select, table, text
+
+from models import db, Object, ObjectData, ObjectField, ObjectRelation, ObjectSearchDocument, ObjectSuggestTerm
+from models.object import object_data_loader
+from utils.cache_versions import bump_cache_version
+from utils.schema_cache import get_schema, get_object_type_fields
+from utils.memory_search_index import get_memory_search_index, SEARCH_DOCUMENTS_VERSION_SCOPE
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FTS_TABLE = 'object_search_fts'
+SUGGEST_FTS_TABLE = 'object_suggest_fts'
+SUGGEST_TERM_MAX_LENGTH = 255
+SEARCH_BATCH_SIZE = 500
+# Bump when build_search_documents changes what it stores; the migration then rebuilds.
+SEARCH_DOCUMENT_FORMAT = 1
+SEARCH_DOCUMENT_FORMAT_SCOPE = 'search_document_format'
+TRIGRAM_LENGTH = 3
+
+_state = {}
+
+
+def normalize_search_text(value):
+    return str(value or '').strip().lower()
+
+
+def escape_like(value):
+    """Escape LIKE wildcards in value, for patterns compiled with escape='\\'."""
+    return str(value).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def resolve_managed_list_label(raw_value, list_id, managed_list_cache):
+    """Label path(s) a managed-list value shows, e.g. 'Isolering > Mineralull'."""
+    from routes.objects import resolve_managed_list_path
+
+    path = resolve_managed_list_path(raw_value, list_id, managed_list_cache)
+    if path:
+        return ' > '.join(path)
+    parts = [part.strip() for part in str(raw_value).split(',') if part.strip()]
+    if len(parts) < 2:
+        return None
+    # Multi-select values are stored as comma-separated item ids.
+    labels = []
+    for part in parts:
+        path = resolve_managed_list_path(part, list_id, managed_list_cache)
+        labels.append(' > '.join(path) if path else part)
+    return '\n'.join(labels)
+
+
+def get_search_display_text(field, raw_value, managed_list_cache):
+    """Text a user sees for a stored value: managed-list labels, rich text without HTML."""
+    from routes.objects import strip_html_to_text, normalize_field_options
+
+    field_type = str(getattr(field, 'field_type', '') or '').strip().lower()
+    if field_type == 'richtext':
+        return strip_html_to_text(raw_value)
+    if field_type in ('select', 'tag'):
+        list_id = (normalize_field_options(getattr(field, 'field_options', None)) or {}).get('list_id')
+        if list_id:
+            return resolve_managed_list_label(raw_value, list_id, managed_list_cache) or raw_value
+    return raw_value
+
+
+def build_search_documents(objects, managed_list_cache=None):
+    """Return insert rows for the identifiers and displayed text values of objects.
+
+    Managed-list ids are indexed as their label paths, rich text without
+    markup, and relation_list fields as the names of the related objects.
+    """
+    from routes.objects import build_relation_list_lookup, compute_relation_list_values
+
+    managed_list_cache = managed_list_cache if managed_list_cache is not None else {}
+    relations_lookup = build_relation_list_lookup(objects)
+    rows = []
+    for obj in objects:
+        identifiers = []
+        for identifier in (obj.id_full, obj.main_id):
+            content = normalize_search_text(identifier)
+            if content and content not in identifiers:
+                identifiers.append(content)
+        for content in identifiers:
+            rows.append({
+                'object_id': obj.id,
+                'object_type_id': obj.object_type_id,
+                'field_id': None,
+                'content': content
+            })
+
+        fields = get_object_type_fields(obj.object_type)
+        fields_by_id = {field.id: field for field in fields}
+        for object_data in obj.object_data:
+            if not object_data.value_text:
+                continue
+            field = fields_by_id.get(object_data.field_id) or object_data.field
+            content = get_search_display_text(field, object_data.value_text, managed_list_cache)
+            if not content:
+                continue
+            rows.append({
+                'object_id': obj.id,
+                'object_type_id': obj.object_type_id,
+                'field_id': object_data.field_id,
+                'content': str(content).lower()
+            })
+
+        relation_list_fields = {field.field_name: field for field in fields if field.field_type == 'relation_list'}
+        if relation_list_fields:
+            for field_name, names in compute_relation_list_values(obj, relations_lookup).items():
+                if not names:
+                    continue
+                rows.append({
+                    'object_id': obj.id,
+                    'object_type_id': obj.object_type_id,
+                    'field_id': relation_list_fields[field_name].id,
+                    'content': names.lower()
+                })
+    return rows
+
+
+def get_relation_list_type_ids():
+    schema = get_schema()
+    fields = schema.fields_by_id.values() if schema is not None else ObjectField.query.filter_by(
+        field_type='relation_list'
+    ).all()
+    return {field.object_type_id for field in fields if field.field_type == 'relation_list'}
+
+
+def get_managed_list_field_ids(list_ids):
+    from routes.objects import normalize_field_options
+
+    schema = get_schema()
+    fields = schema.fields_by_id.values() if schema is not None else ObjectField.query.all()
+    list_ids = {int(list_id) for list_id in list_ids}
+    return [
+        field.id for field in fields
+        if str(field.field_type or '').lower() in ('select', 'tag')
+        and int((normalize_field_options(field.field_options) or {}).get('list_id') or 0) in list_ids
+    ]
+
+
+def expand_search_refresh_ids(object_ids, neighbour_ids=None, list_ids=None):
+    """
+    Add the objects whose documents show values of the changed objects/lists.
+
+    Objects related to neighbour_ids list their names in relation_list
+    fields; objects with a value in a field bound to one of list_ids show
+    that list's labels.
+    """
+    object_ids = set(object_ids or [])
+    neighbour_ids = list(neighbour_ids or [])
+    if neighbour_ids:
+        type_ids = get_relation_list_type_ids()
+        if type_ids:
+            rows = db.session.query(ObjectRelation.source_object_id, ObjectRelation.target_object_id).filter(
+                (ObjectRelation.source_object_id.in_(neighbour_ids)) |
+                (ObjectRelation.target_object_id.in_(neighbour_ids))
+            ).all()
+            linked_ids = {object_id for row in rows for object_id in row} - object_ids
+            if linked_ids:
+                object_ids.update(
+                    object_id for (object_id,) in db.session.query(Object.id).filter(
+                        Object.id.in_(list(linked_ids)),
+                        Object.object_type_id.in_(list(type_ids))
+                    ).all()
+                )
+
+    if list_ids:
+        field_ids = get_managed_list_field_ids(list_ids)
+        if field_ids:
+            object_ids.update(
+                object_id for (object_id,) in db.session.query(ObjectData.object_id).filter(
+                    ObjectData.field_id.in_(field_ids),
+                    ObjectData.value_text.isnot(None)
+                ).distinct().all()
+            )
+    return object_ids
+
+
+def build_suggest_terms(objects):
+    """Return insert rows for the typeahead terms (identifiers and name) of objects."""
+    from routes.objects import get_data_value_case_insensitive
+
+    rows = []
+    for obj in objects:
+        data = obj.data
+        name = (
+            get_data_value_case_insensitive(data, 'namn')
+            or get_data_value_case_insensitive(data, 'name')
+        )
+        terms = []
+        for value in (obj.id_full, obj.main_id, name):
+            term = normalize_search_text(value)[:SUGGEST_TERM_MAX_LENGTH]
+            if term and term not in terms:
+                terms.append(term)
+        rows.extend(
+            {'object_id': obj.id, 'object_type_id': obj.object_type_id, 'term': term}
+            for term in terms
+        )
+    return rows
+
+
+def refresh_search_index(object_ids, documents_by_object=None):
+    """Replace the search documents and typeahead terms of object_ids in the current transaction.
+
+    When documents_by_object is given it receives {object_id: (object_type_id,
+    [(field_id, content), ...])}, or None for objects that no longer exist.
+    """
+    object_ids = sorted({int(object_id) for object_id in (object_ids or []) if object_id is not None})
+    managed_list_cache = {}
+    written = 0
+    for start in range(0, len(object_ids), SEARCH_BATCH_SIZE):
+        batch_ids = object_ids[start:start + SEARCH_BATCH_SIZE]
+        db.session.execute(
+            ObjectSearchDocument.__table__.delete().where(ObjectSearchDocument.object_id.in_(batch_ids))
+        )
+        db.session.execute(
+            ObjectSuggestTerm.__table__.delete().where(ObjectSuggestTerm.object_id.in_(batch_ids))
+        )
+        objects = Object.query.options(object_data_loader()).filter(Object.id.in_(batch_ids)).all()
+        rows = build_search_documents(objects, managed_list_cache)
+        if rows:
+            db.session.execute(ObjectSearchDocument.__table__.insert(), rows)
+        if documents_by_object is not None:
+            documents_by_object.update({object_id: None for object_id in batch_ids})
+            documents_by_object.update({obj.id: (obj.object_type_id, []) for obj in objects})
+            for row in rows:
+                documents_by_object[row['object_id']][1].append((row['field_id'], row['content']))
+        suggest_rows = build_suggest_terms(objects)
+        if suggest_rows:
+            db.session.execute(ObjectSuggestTerm.__table__.insert(), suggest_rows)
+        written += len(rows)
+    return written
+
+
+def rebuild_search_index(only_missing=False):
+    """Index every object (or only objects without documents) and commit per batch."""
+    query = db.session.query(Object.id)
+    if only_missing:
+        query = query.filter(
+            ~Object.id.in_(db.session.query(ObjectSearchDocument.object_id)) |
+            ~Object.id.in_(db.session.query(ObjectSuggestTerm.object_id))
+        )
+    else:
+        db.session.execute(ObjectSearchDocument.__table__.delete())
+        db.session.execute(ObjectSuggestTerm.__table__.delete())
+    object_ids = [object_id for (object_id,) in query.order_by(Object.id).all()]
+
+    written = 0
+    for start in range(0, len(object_ids), SEARCH_BATCH_SIZE):
+        written += refresh_search_index(object_ids[start:start + SEARCH_BATCH_SIZE])
+        db.session.commit()
+        db.session.expunge_all()
+    if object_ids or not only_missing:
+        # In-process indexes of running workers rebuild from the new documents.
+        bump_cache_version(SEARCH_DOCUMENTS_VERSION_SCOPE)
+    db.session.commit()
+    return written
+
+
+def has_fts_table(table_name=SEARCH_FTS_TABLE):
+    """Whether the SQLite FTS5 table exists (checked once per process)."""
+    if table_name not in _state:
+        row = db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': table_name}
+        ).first()
+        _state[table_name] = row is not None
+    return _state[table_name]
+
+
+def build_search_match_query(search, object_type_id=None, field_ids=None):
+    """
+    Select (object_id, rank) for objects matching search, one row per object.
+
+    Lower rank is better. field_ids restricts field value matches to those
+    fields; identifier rows always match. Returns None for an empty search.
+    """
+    search = normalize_search_text(search)
+    if not search:
+        return None
+
+    documents = ObjectSearchDocument.__table__
+    dialect = db.session.get_bind().dialect.name
+    query = None
+
+    memory_index = get_memory_search_index() if dialect == 'sqlite' else None
+    if memory_index is not None:
+        object_ids = memory_index.search(search, object_type_id, field_ids)
+        # The ids go in as one JSON parameter, not one bound parameter each: a
+        # common query can match more objects than SQLite allows parameters,
+        # and counts, facets and pages all reuse this query.
+        matches = func.json_each(json.dumps(object_ids)).table_valued('value')
+        return select(Object.id.label('object_id'), literal(0.0).label('rank')).join(
+            matches, matches.c.value == Object.id
+        )
+
+    if dialect == 'postgresql':
+        # Substring match like SQLite's trigram FTS; the pg_trgm index serves the LIKE.
+        query = select(
+            documents.c.object_id,
+            (-func.similarity(documents.c.content, search)).label('rank')
+        ).where(documents.c.content.like(f'%{escape_like(search)}%', escape='\\'))
+    elif len(search) >= TRIGRAM_LENGTH and has_fts_table():
+        # The hidden rank column is bm25() and, unlike the function, survives the GROUP BY below.
+        fts = table(SEARCH_FTS_TABLE, column('rowid'), column('rank'))
+        phrase = '"' + search.replace('"', '""') + '"'
+        query = select(documents.c.object_id, fts.c.rank.label('rank')).select_from(
+            documents.join(fts, fts.c.rowid == documents.c.id)
+        ).where(literal_column(SEARCH_FTS_TABLE).op('MATCH')(phrase))
+
+    if query is None:
+        # Too short for a trigram (or no index): substring scan of the document table.
+        query = select(documents.c.object_id, literal(0.0).label('rank')).where(
+            func.instr(documents.c.content, search) > 0
+        )
+
+    if object_type_id is not None:
+        query = query.where(documents.c.object_type_id == object_type_id)
+    if field_ids is not None:
+        query = query.where(or_(documents.c.field_id.is_(None), documents.c.field_id.in_(list(field_ids))))
+
+    matches = query.subquery()
+    return select(
+        matches.c.object_id,
+        func.min(matches.c.rank).label('rank')
+    ).group_by(matches.c.object_id)
+
+
+def get_search_field_ids(field_name):
+    """IDs of all object fields named field_name (across object types)."""
+    return [
+        field_id for (field_id,) in
+        db.session.query(ObjectField.id).filter(ObjectField.field_name == field_name).all()
+    ]
+
+
+def _limit_to_types(query, terms, object_type_ids):
+    if object_type_ids is not None:
+        query = query.where(terms.c.object_type_id.in_(list(object_type_ids)))
+    return query
+
+
+def suggest_object_ids(search, object_type_ids=None, limit=20):
+    """
+    Return up to limit object ids for a typeahead query, best matches first.
+
+    Exact and prefix matches on a term come first (shortest term first), then
+    substring matches from the trigram index. Queries shorter than a trigram
+    only use the prefix index.
+    """
+    search = normalize_search_text(search)[:SUGGEST_TERM_MAX_LENGTH]
+    if not search or limit <= 0:
+        return []
+
+    terms = ObjectSuggestTerm.__table__
+    dialect = db.session.get_bind().dialect.name
+    best_length = func.min(func.length(terms.c.term))
+
+    # Half-open range on the term index: every string starting with search.
+    prefix_query = select(terms.c.object_id).where(
+        terms.c.term >= search,
+        terms.c.term < search + '\U0010ffff'
+    )
+    prefix_query = _limit_to_types(prefix_query, terms, object_type_ids)
+    prefix_query = prefix_query.group_by(terms.c.object_id).order_by(best_length, terms.c.object_id).limit(limit)
+    object_ids = [object_id for (object_id,) in db.session.execute(prefix_query).all()]
+    if len(object_ids) >= limit or len(search) < TRIGRAM_LENGTH:
+        return object_ids
+
+    if dialect == 'postgresql':
+        substring_query = select(terms.c.object_id).where(
+            terms.c.term.like(f'%{escape_like(search)}%', escape='\\')
+        ).group_by(terms.c.object_id).order_by(
+            func.max(func.similarity(terms.c.term, search)).desc(), terms.c.object_id
+        )
+    elif has_fts_table(SUGGEST_FTS_TABLE):
+        fts = table(SUGGEST_FTS_TABLE, column('rowid'), column('rank'))
+        phrase = '"' + search.replace('"', '""') + '"'
+        substring_query = select(terms.c.object_id).select_from(
+            terms.join(fts, fts.c.rowid == terms.c.id)
+        ).where(
+            literal_column(SUGGEST_FTS_TABLE).op('MATCH')(phrase)
+        ).group_by(terms.c.object_id).order_by(func.min(fts.c.rank), terms.c.object_id)
+    else:
+        substring_query = select(terms.c.object_id).where(
+            func.instr(terms.c.term, search) > 0
+        ).group_by(terms.c.object_id).order_by(best_length, terms.c.object_id)
+
+    substring_query = _limit_to_types(substring_query, terms, object_type_ids)
+    if object_ids:
+        substring_query = substring_query.where(terms.c.object_id.notin_(object_ids))
+    substring_query = substring_query.limit(limit - len(object_ids))
+    object_ids.extend(object_id for (object_id,) in db.session.execute(substring_query).all())
+    return object_ids
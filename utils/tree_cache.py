@@ -0,0 +1,142 @@
+"""
+In-process cache of rendered object tree responses.
+
+Building a tree view touches every root object, its relations or instances,
+their data and files, so the JSON body is kept per worker and reused until
+the data behind it changes. Entries are keyed by endpoint and query (view,
+depth, node, fields, continuation) and stamped with the 'tree_data' and
+'schema' version counters. The session listeners below bump 'tree_data' in any transaction
+that writes objects, their data, relations, instances, documents, managed
+lists or view configurations; other workers see the new version on their next
+tree request with a primary-key lookup.
+
+The same versions make up the ETag, so a client holding the current tree gets
+a 304 without the tree being built or even looked up.
+"""
+from collections import OrderedDict
+from itertools import chain
+import hashlib
+import threading
+
+from flask import current_app
+from sqlalchemy import event
+
+from models import (
+    db, Object, ObjectData, ObjectRelation, Instance, Document,
+    ManagedList, ManagedListItem, ViewConfiguration
+)
+from utils.cache_versions import get_cache_version, bump_cache_version
+from utils.schema_cache import SCHEMA_VERSION_SCOPE
+
+TREE_DATA_VERSION_SCOPE = 'tree_data'
+PENDING_TREE_CHANGES_KEY = 'tree_data_changed'
+TREE_DATA_MODELS = (
+    Object, ObjectData, ObjectRelation, Instance, Document,
+    ManagedList, ManagedListItem, ViewConfiguration
+)
+DEFAULT_TREE_CACHE_MAX_ENTRIES = 32
+DEFAULT_TREE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TREE_CACHE_STREAM_MAX_BYTES = 1024 * 1024
+
+
+class TreeResultCache:
+    """LRU of response bodies with an entry and a total size cap."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+
+    def _remove(self, key):
+        _, body = self.entries.pop(key)
+        self.total_bytes -= len(body)
+
+    def get(self, key, versions):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != versions:
+                if entry is not None:
+                    self._remove(key)
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, versions, body, max_entries, max_bytes):
+        if len(body) > max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (versions, body)
+            self.total_bytes += len(body)
+            while self.entries and (len(self.entries) > max_entries or self.total_bytes > max_bytes):
+                self._remove(next(iter(self.entries)))
+
+
+_cache = TreeResultCache()
+
+
+def get_tree_versions():
+    """Return the (tree data, schema) versions the current trees are built from."""
+    return get_cache_version(TREE_DATA_VERSION_SCOPE), get_cache_version(SCHEMA_VERSION_SCOPE)
+
+
+def build_tree_cache_key(endpoint, args):
+    """Key for endpoint and the query args a tree depends on, in a fixed order."""
+    return (endpoint,) + tuple(
+        str(args.get(name) or '').strip().lower() if name == 'view' else str(args.get(name) or '').strip()
+        for name in ('view', 'depth', 'node', 'fields', 'continuation')
+    )
+
+
+def build_tree_etag(key, versions):
+    digest = hashlib.sha1(repr((key, versions)).encode('utf-8')).hexdigest()
+    return f'tree-{versions[0]}-{versions[1]}-{digest[:16]}'
+
+
+def get_cached_tree(key, versions):
+    return _cache.get(key, versions)
+
+
+def get_tree_cache_max_bytes():
+    """Largest total (and so largest single body) the tree cache keeps."""
+    return int(current_app.config.get('TREE_CACHE_MAX_BYTES') or DEFAULT_TREE_CACHE_MAX_BYTES)
+
+
+def get_tree_cache_stream_max_bytes():
+    """Largest streamed body that is collected for the cache (never more than the cache holds)."""
+    stream_max_bytes = current_app.config.get('TREE_CACHE_STREAM_MAX_BYTES')
+    if stream_max_bytes is None:
+        stream_max_bytes = DEFAULT_TREE_CACHE_STREAM_MAX_BYTES
+    return min(int(stream_max_bytes), get_tree_cache_max_bytes())
+
+
+def store_cached_tree(key, versions, body):
+    _cache.put(
+        key,
+        versions,
+        body,
+        int(current_app.config.get('TREE_CACHE_MAX_ENTRIES') or DEFAULT_TREE_CACHE_MAX_ENTRIES),
+        get_tree_cache_max_bytes()
+    )
+
+
+@event.listens_for(db.session, 'after_flush')
+def _collect_tree_data_changes(session, flush_context):
+    if session.info.get(PENDING_TREE_CHANGES_KEY):
+        return
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, TREE_DATA_MODELS):
+            session.info[PENDING_TREE_CHANGES_KEY] = True
+            return
+
+
+@event.listens_for(db.session, 'before_commit')
+def _bump_tree_data_version_before_commit(session):
+    if session.info.pop(PENDING_TREE_CHANGES_KEY, False):
+        bump_cache_version(TREE_DATA_VERSION_SCOPE)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_tree_data_changes(session):
+    session.info.pop(PENDING_TREE_CHANGES_KEY, None)
@@ -0,0 +1,94 @@
+"""
+Per-worker cache of the display projections of tree object nodes.
+
+A tree node shows the object's data with managed-list values resolved to
+' > '-joined paths, plus its requirement text and short description with the
+HTML stripped. These only change with the object revision (updated_at), the
+schema and the managed lists its type's fields point at, so they are computed
+once and stamped with all three. A stamp mismatch recomputes the entry; an
+untouched object keeps its projection across tree rebuilds, even when other
+writes invalidated the cached tree responses.
+
+Projections are not cached outside requests or while the current transaction
+has written managed lists, so uncommitted values cannot leak to other requests.
+"""
+from collections import OrderedDict
+import threading
+
+from flask import current_app, has_request_context
+
+from models import db
+from utils.managed_list_cache import PENDING_MANAGED_LIST_IDS_KEY, get_managed_list_version
+from utils.schema_cache import get_schema
+
+DEFAULT_TREE_DISPLAY_CACHE_MAX_ENTRIES = 20000
+
+_lock = threading.Lock()
+_projections = OrderedDict()
+_type_list_ids = {}
+
+
+def _get_type_managed_list_ids(schema, object_type_id):
+    """Ids of the managed lists behind the select fields of a type, per schema version."""
+    key = (schema.version, object_type_id)
+    with _lock:
+        list_ids = _type_list_ids.get(key)
+    if list_ids is not None:
+        return list_ids
+
+    found = set()
+    for field in schema.types_by_id[object_type_id].fields:
+        if str(field.field_type or '').strip().lower() != 'select':
+            continue
+        field_options = field.options or {}
+        if str(field_options.get('source') or '').strip().lower() != 'managed_list':
+            continue
+        list_id = str(field_options.get('list_id') or '').strip()
+        if list_id.isdigit() and int(list_id) > 0:
+            found.add(int(list_id))
+    list_ids = tuple(sorted(found))
+    with _lock:
+        if any(version != schema.version for version, _ in _type_list_ids):
+            _type_list_ids.clear()
+        _type_list_ids[key] = list_ids
+    return list_ids
+
+
+def get_tree_display_stamp(obj):
+    """Return the (updated_at, schema version, list versions) stamp of obj, or None if uncacheable."""
+    if not has_request_context() or obj.id is None or obj.updated_at is None or obj.object_type_id is None:
+        return None
+    if db.session.info.get(PENDING_MANAGED_LIST_IDS_KEY):
+        return None
+    schema = get_schema()
+    if schema is None or obj.object_type_id not in schema.types_by_id:
+        return None
+    list_versions = tuple(
+        (list_id, get_managed_list_version(list_id))
+        for list_id in _get_type_managed_list_ids(schema, obj.object_type_id)
+    )
+    return obj.updated_at, schema.version, list_versions
+
+
+def get_tree_display_projection(obj, build_projection):
+    """Return build_projection(obj), reusing the result computed for the same stamp."""
+    stamp = get_tree_display_stamp(obj)
+    if stamp is None:
+        return build_projection(obj)
+
+    with _lock:
+        entry = _projections.get(obj.id)
+        if entry is not None and entry[0] == stamp:
+            _projections.move_to_end(obj.id)
+            return entry[1]
+
+    projection = build_projection(obj)
+    max_entries = int(
+        current_app.config.get('TREE_DISPLAY_CACHE_MAX_ENTRIES') or DEFAULT_TREE_DISPLAY_CACHE_MAX_ENTRIES
+    )
+    with _lock:
+        _projections[obj.id] = (stamp, projection)
+        _projections.move_to_end(obj.id)
+        while len(_projections) > max_entries:
+            _projections.popitem(last=False)
+    return projection